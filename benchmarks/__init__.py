@@ -0,0 +1,16 @@
+"""Micro benchmarks for the ymt_shifter_utility geometry kernels.
+
+The suite runs outside Maya. :mod:`benchmarks.openmaya` provides pure Python
+versions of the OpenMaya math types the kernels touch and placeholder modules
+for the rest of the Maya / mGear stack, so the kernels can be imported and
+timed on a plain Python install.
+
+Run from the repository root::
+
+    python -m benchmarks --output report.json
+    python -m benchmarks --compare old.json new.json
+
+Each kernel is run on synthetic curves and point clouds of growing size. Wall
+time and allocations (via :mod:`tracemalloc`) are recorded per kernel and size
+and written as a JSON report that can be compared between versions.
+"""
@@ -0,0 +1,64 @@
+"""Command line entry point, see :mod:`benchmarks`."""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+
+def _python_root() -> str:
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--output", "-o", help="write the JSON report to this path")
+    parser.add_argument("--filter", "-k", default="", help="only run kernels whose name contains this text")
+    parser.add_argument("--sizes", type=int, nargs="+", help="override the input sizes of every kernel")
+    parser.add_argument("--repeat", type=int, default=5, help="minimum timed calls per kernel and size")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum timed seconds per kernel and size")
+    parser.add_argument("--list", action="store_true", help="list the kernels and exit")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two JSON reports and exit")
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        default=0.0,
+        help="with --compare, exit with status 1 when any time ratio exceeds this value",
+    )
+    args = parser.parse_args(argv)
+
+    from . import runner
+
+    if args.compare:
+        rows = runner.compare_reports(runner.load_report(args.compare[0]), runner.load_report(args.compare[1]))
+        for row in rows:
+            print(runner.format_comparison(row))
+        if args.fail_above and any(row["time_ratio"] > args.fail_above for row in rows):
+            return 1
+        return 0
+
+    from . import openmaya
+
+    if _python_root() not in sys.path:
+        sys.path.insert(0, _python_root())
+    stand_in = openmaya.install()
+    logging.getLogger("ymt_shifter_utility.fit_curve").setLevel(logging.WARNING)
+
+    from .kernels import all_kernels
+
+    kernels = [k for k in all_kernels() if args.filter in k.name]
+    if args.list:
+        for kernel in kernels:
+            print("{}  ({}: {})".format(kernel.name, kernel.size_label, ", ".join(str(s) for s in kernel.sizes)))
+        return 0
+
+    measurements = runner.run(kernels, args.repeat, args.min_time, args.sizes, log=print)
+    if args.output:
+        runner.write_report(runner.build_report(measurements, stand_in), args.output)
+        print("wrote {}".format(args.output))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Benchmark kernels and the synthetic inputs they run on.
+
+Every kernel is a ``setup(size)`` function returning a zero argument callable.
+Setup work (building snapshots, contexts and point clouds) happens outside
+the measured call, so the numbers only cover the kernel itself.
+"""
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+
+@dataclass
+class Kernel:
+    """A named benchmark kernel measured at each of ``sizes``."""
+
+    name: str
+    sizes: Sequence[int]
+    setup: Callable[[int], Callable[[], object]]
+    size_label: str = "size"
+
+
+def _modules() -> tuple[object, object, object]:
+    # Imported lazily so the stand-in modules can be installed first.
+    import ymt_shifter_utility
+    import ymt_shifter_utility.fit_curve as fit_curve
+    import ymt_components.ymt_face_lip_02 as face_lip
+
+    return ymt_shifter_utility, fit_curve, face_lip
+
+
+def make_snapshot(num_cvs: int, degree: int = 3, periodic: bool = False, scale: float = 1.0, phase: float = 0.0) -> object:
+    """Return a synthetic ``NurbsCurveSnapshot`` with ``num_cvs`` CVs."""
+    _, fit_curve, _ = _modules()
+    om2 = fit_curve.om2
+
+    if periodic:
+        ring = [
+            om2.MPoint(
+                math.cos(2.0 * math.pi * i / num_cvs) * scale,
+                math.sin(2.0 * math.pi * i / num_cvs + phase) * scale * 0.7,
+                0.05 * math.sin(4.0 * math.pi * i / num_cvs),
+            )
+            for i in range(num_cvs)
+        ]
+        cvs = ring + [om2.MPoint(p) for p in ring[:degree]]
+        knots = [float(i - degree) for i in range(len(cvs) + degree + 1)]
+        form = om2.MFnNurbsCurve.kPeriodic
+    else:
+        cvs = [
+            om2.MPoint(i * scale, math.sin(i * 0.7 + phase) * scale, math.cos(i * 0.3) * 0.5)
+            for i in range(num_cvs)
+        ]
+        inner = num_cvs - degree
+        knots = [0.0] * (degree + 1) + [float(i) for i in range(1, inner)] + [float(inner)] * (degree + 1)
+        form = om2.MFnNurbsCurve.kOpen
+
+    return fit_curve.NurbsCurveSnapshot(degree, form, knots, cvs, om2.MMatrix(), om2.MMatrix())
+
+
+def make_context(num_cvs: int, num_samples: int, periodic: bool = False) -> object:
+    """Return a ``FitContext`` fitting one synthetic curve onto another."""
+    _, fit_curve, _ = _modules()
+
+    source = make_snapshot(num_cvs, periodic=periodic)
+    target = make_snapshot(num_cvs, periodic=periodic, scale=1.1, phase=0.4)
+    params = fit_curve._sample_params_by_parameter(source, num_samples)
+    basis = [fit_curve.basis_at_param(source, u) for u in params]
+    target_params = fit_curve._sample_params_by_parameter(target, num_samples)
+    target_points = [
+        fit_curve.evaluate_point(target.cvs_world, fit_curve.basis_at_param(target, u))
+        for u in target_params
+    ]
+    return fit_curve.FitContext(source, "parameter", params, basis, target_points)
+
+
+def make_point_cloud(count: int, flatness: float = 0.1, seed: int = 0) -> list[tuple[float, float, float]]:
+    """Return ``count`` points scattered around a tilted, slightly thick plane."""
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        u = rng.uniform(-1.0, 1.0)
+        v = rng.uniform(-0.5, 0.5)
+        w = rng.gauss(0.0, flatness)
+        points.append((u + 0.2 * w, 0.3 * u + v, w + 0.1 * v))
+    return points
+
+
+def make_mirrored_ring(count: int, seed: int = 0) -> list[object]:
+    """Return a closed, roughly X-symmetric ring of ``MPoint`` with a rotated seam."""
+    _, fit_curve, _ = _modules()
+    rng = random.Random(seed)
+    offset = rng.randrange(count)
+    return [
+        fit_curve.om2.MPoint(
+            math.sin(2.0 * math.pi * ((i + offset) % count) / count) + rng.gauss(0.0, 1e-3),
+            math.cos(2.0 * math.pi * ((i + offset) % count) / count),
+            0.0,
+        )
+        for i in range(count)
+    ]
+
+
+def make_dag_paths(depth: int) -> tuple[list[str], list[str]]:
+    """Return two leaf-to-root name paths sharing the upper half of a hierarchy."""
+    shared = ["shared_{}".format(i) for i in range(depth // 2)]
+    a_path = ["a_{}".format(i) for i in range(depth - len(shared))] + shared
+    b_path = ["b_{}".format(i) for i in range(depth - len(shared))] + shared
+    return a_path, b_path
+
+
+class GridMesh(object):
+    """``MFnMesh`` stand-in for a quad grid, exposing the bulk getters.
+
+    Arguments:
+        num_faces (int): Approximate face count; the grid is square.
+    """
+
+    def __init__(self, num_faces: int) -> None:
+        _, fit_curve, _ = _modules()
+        om2 = fit_curve.om2
+
+        side = max(1, int(round(math.sqrt(num_faces))))
+        row = side + 1
+        self.points = [om2.MPoint(float(x), 0.0, float(z)) for z in range(row) for x in range(row)]
+        self.us = [x / float(side) for z in range(row) for x in range(row)]
+        self.vs = [z / float(side) for z in range(row) for x in range(row)]
+        self.counts = [4] * (side * side)
+        self.connects = []
+        for z in range(side):
+            for x in range(side):
+                first = z * row + x
+                self.connects.extend((first, first + 1, first + row + 1, first + row))
+        self.normals = [om2.MVector(0.0, 1.0, 0.0)]
+
+    def getVertices(self) -> tuple[list[int], list[int]]:
+        return self.counts, self.connects
+
+    def getPoints(self) -> list[object]:
+        return self.points
+
+    def getUVs(self) -> tuple[list[float], list[float]]:
+        return self.us, self.vs
+
+    def getAssignedUVs(self) -> tuple[list[int], list[int]]:
+        return self.counts, self.connects
+
+    def getNormals(self) -> list[object]:
+        return self.normals
+
+    def getNormalIds(self) -> tuple[list[int], list[int]]:
+        return self.counts, [0] * len(self.connects)
+
+
+# ---------------------------------------------------------------------------
+# setups
+
+def _setup_basis_at_param(num_cvs: int) -> Callable[[], object]:
+    _, fit_curve, _ = _modules()
+    snapshot = make_snapshot(num_cvs)
+    params = fit_curve._sample_params_by_parameter(snapshot, 200)
+
+    def run() -> object:
+        return [fit_curve.basis_at_param(snapshot, u) for u in params]
+
+    return run
+
+
+def _setup_compute_objective_gradients(num_samples: int) -> Callable[[], object]:
+    _, fit_curve, _ = _modules()
+    context = make_context(16, num_samples)
+    cvs = list(context.source.cvs_world)
+
+    def run() -> object:
+        return fit_curve.compute_objective_gradients(cvs, context)
+
+    return run
+
+
+def _setup_optimize_context(backend: str) -> Callable[[int], Callable[[], object]]:
+
+    def setup(num_samples: int) -> Callable[[], object]:
+        _, fit_curve, _ = _modules()
+        context = make_context(16, num_samples)
+
+        def run() -> object:
+            return fit_curve.optimize_context(context, num_iterations=20, backend=backend)
+
+        return run
+
+    return setup
+
+
+def _setup_auto_symmetry(count: int) -> Callable[[], object]:
+    _, fit_curve, _ = _modules()
+    points = make_mirrored_ring(count)
+
+    def run() -> object:
+        return fit_curve._auto_symmetry_pairs_and_centers_for_points(points, True, 0)
+
+    return run
+
+
+def _setup_flatness_ratio_simple(count: int) -> Callable[[], object]:
+    _, _, face_lip = _modules()
+    points = make_point_cloud(count)
+
+    def run() -> object:
+        return face_lip.calculate_flatness_ratio_simple(points)
+
+    return run
+
+
+def _setup_flatness_ratio_numpy(count: int) -> Callable[[], object]:
+    import numpy as np
+
+    _, _, face_lip = _modules()
+    points = np.array(make_point_cloud(count))
+
+    def run() -> object:
+        return face_lip.calculate_flatness_ratio_using_numpy(points)
+
+    return run
+
+
+def _setup_eigen_decomposition(count: int) -> Callable[[], object]:
+    _, _, face_lip = _modules()
+    rng = random.Random(count)
+    matrices = []
+    for _ in range(count):
+        a, b, c = (rng.uniform(-1.0, 1.0) for _ in range(3))
+        d, e, f = (rng.uniform(-1.0, 1.0) for _ in range(3))
+        # symmetric positive semi-definite, like a covariance matrix
+        rows = [(a, b, c), (d, e, f), (a + d, b - e, c * f)]
+        matrices.append([[sum(rows[k][i] * rows[k][j] for k in range(3)) for j in range(3)] for i in range(3)])
+
+    def run() -> object:
+        return [face_lip.eigen_decomposition_3x3(m) for m in matrices]
+
+    return run
+
+
+def _setup_find_path(depth: int) -> Callable[[], object]:
+    ymt_util, _, _ = _modules()
+    a_path, b_path = make_dag_paths(depth)
+
+    def run() -> object:
+        return ymt_util._findPathAtoB(a_path, b_path)
+
+    return run
+
+
+def _setup_serialize_mesh(num_faces: int) -> Callable[[], object]:
+    ymt_util, _, _ = _modules()
+    from ymt_shifter_utility import geometry_codec
+
+    mesh = GridMesh(num_faces)
+
+    def run() -> object:
+        return geometry_codec.encode({"meshes": [ymt_util.serialize_mesh_data(mesh)]})
+
+    return run
+
+
+def _has_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def all_kernels() -> list[Kernel]:
+    """Return every kernel runnable in the current interpreter."""
+    kernels = [
+        Kernel("fit_curve.basis_at_param", (8, 64, 512), _setup_basis_at_param, "num_cvs"),
+        Kernel("fit_curve.compute_objective_gradients", (50, 200, 800), _setup_compute_objective_gradients, "num_samples"),
+        Kernel("fit_curve.optimize_context[python]", (50, 200, 800), _setup_optimize_context("python"), "num_samples"),
+        Kernel("fit_curve._auto_symmetry_pairs_and_centers_for_points", (16, 64, 256), _setup_auto_symmetry, "num_points"),
+        Kernel("ymt_face_lip_02.calculate_flatness_ratio_simple", (100, 1000, 10000), _setup_flatness_ratio_simple, "num_points"),
+        Kernel("ymt_face_lip_02.eigen_decomposition_3x3", (10, 100, 1000), _setup_eigen_decomposition, "num_matrices"),
+        Kernel("ymt_shifter_utility._findPathAtoB", (8, 64, 512), _setup_find_path, "depth"),
+        Kernel("ymt_shifter_utility.serialize_mesh_data", (10000, 100000, 1000000), _setup_serialize_mesh, "num_faces"),
+    ]
+    if _has_numpy():
+        kernels.extend([
+            Kernel("fit_curve.optimize_context[numpy]", (50, 200, 800), _setup_optimize_context("numpy"), "num_samples"),
+            Kernel("ymt_face_lip_02.calculate_flatness_ratio_using_numpy", (100, 1000, 10000), _setup_flatness_ratio_numpy, "num_points"),
+        ])
+    return kernels
@@ -0,0 +1,397 @@
+"""Pure Python stand-in for the parts of Maya the benchmarked kernels import.
+
+Only the value types used by the math kernels (``MPoint``, ``MVector``,
+``MMatrix`` and a few constants) are implemented. Every other Maya, mGear,
+pymel or Qt symbol resolves to an inert placeholder class, which is enough
+for module level code such as base classes, decorators and default
+arguments to import cleanly.
+
+Nothing here is installed unless :func:`install` is called, and real
+modules always win: a name is only faked when it cannot be imported.
+"""
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import math
+import sys
+import types
+from collections.abc import Iterable
+
+
+# Top level packages served by the placeholder finder.
+PLACEHOLDER_ROOTS = ("maya", "mgear", "pymel", "Qt", "PySide2", "PySide6", "shiboken2", "shiboken6")
+
+
+class MSpace(object):
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kPostTransform = 3
+    kWorld = 4
+    kObject = kPreTransform
+
+
+class MVector(object):
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: object = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        if isinstance(x, (MVector, MPoint)):
+            x, y, z = x.x, x.y, x.z
+        elif isinstance(x, (list, tuple)):
+            x, y, z = x[0], x[1], x[2]
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __add__(self, other: MVector) -> MVector:
+        return MVector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: MVector) -> MVector:
+        return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self) -> MVector:
+        return MVector(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other: object) -> object:
+        if isinstance(other, MVector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        if isinstance(other, MMatrix):
+            m = other.values
+            return MVector(
+                self.x * m[0] + self.y * m[4] + self.z * m[8],
+                self.x * m[1] + self.y * m[5] + self.z * m[9],
+                self.x * m[2] + self.y * m[6] + self.z * m[10],
+            )
+        return MVector(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: float) -> MVector:
+        return MVector(self.x * other, self.y * other, self.z * other)
+
+    def __truediv__(self, other: float) -> MVector:
+        return MVector(self.x / other, self.y / other, self.z / other)
+
+    def __xor__(self, other: MVector) -> MVector:
+        return MVector(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, MVector) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y, self.z)[index]
+
+    def __setitem__(self, index: int, value: float) -> None:
+        setattr(self, "xyz"[index], float(value))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __repr__(self) -> str:
+        return "MVector(%r, %r, %r)" % (self.x, self.y, self.z)
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def normal(self) -> MVector:
+        length = self.length()
+        return self / length if length else MVector(self)
+
+    def normalize(self) -> MVector:
+        length = self.length()
+        if length:
+            self.x /= length
+            self.y /= length
+            self.z /= length
+        return self
+
+
+class MPoint(object):
+    __slots__ = ("x", "y", "z", "w")
+
+    def __init__(self, x: object = 0.0, y: float = 0.0, z: float = 0.0, w: float = 1.0) -> None:
+        if isinstance(x, MPoint):
+            x, y, z, w = x.x, x.y, x.z, x.w
+        elif isinstance(x, MVector):
+            x, y, z = x.x, x.y, x.z
+        elif isinstance(x, (list, tuple)):
+            x, y, z = x[0], x[1], x[2]
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = float(w)
+
+    def __add__(self, other: MVector) -> MPoint:
+        return MPoint(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: object) -> object:
+        if isinstance(other, MPoint):
+            return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+        return MPoint(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, other: object) -> MPoint:
+        if isinstance(other, MMatrix):
+            m = other.values
+            x, y, z, w = self.x, self.y, self.z, self.w
+            rx = x * m[0] + y * m[4] + z * m[8] + w * m[12]
+            ry = x * m[1] + y * m[5] + z * m[9] + w * m[13]
+            rz = x * m[2] + y * m[6] + z * m[10] + w * m[14]
+            rw = x * m[3] + y * m[7] + z * m[11] + w * m[15]
+            return MPoint(rx, ry, rz, rw)
+        return MPoint(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: float) -> MPoint:
+        return MPoint(self.x * other, self.y * other, self.z * other)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, MPoint) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y, self.z, self.w)[index]
+
+    def __setitem__(self, index: int, value: float) -> None:
+        setattr(self, "xyzw"[index], float(value))
+
+    def __len__(self) -> int:
+        return 4
+
+    def __repr__(self) -> str:
+        return "MPoint(%r, %r, %r, %r)" % (self.x, self.y, self.z, self.w)
+
+    def distanceTo(self, other: MPoint) -> float:
+        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2)
+
+
+class MMatrix(object):
+    """Row major 4x4 matrix stored as 16 floats, like ``om2.MMatrix``."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable | None = None) -> None:
+        if values is None:
+            self.values = [1.0 if i % 5 == 0 else 0.0 for i in range(16)]
+        elif isinstance(values, MMatrix):
+            self.values = list(values.values)
+        else:
+            flat = []
+            for item in values:
+                if isinstance(item, (list, tuple)):
+                    flat.extend(float(v) for v in item)
+                else:
+                    flat.append(float(item))
+            if len(flat) != 16:
+                raise ValueError("MMatrix needs 16 values.")
+            self.values = flat
+
+    def __mul__(self, other: MMatrix) -> MMatrix:
+        a = self.values
+        b = other.values
+        return MMatrix([
+            sum(a[row * 4 + k] * b[k * 4 + col] for k in range(4))
+            for row in range(4)
+            for col in range(4)
+        ])
+
+    def __getitem__(self, index: int) -> float:
+        return self.values[index]
+
+    def __setitem__(self, index: int, value: float) -> None:
+        self.values[index] = float(value)
+
+    def __len__(self) -> int:
+        return 16
+
+    def __repr__(self) -> str:
+        return "MMatrix(%r)" % (self.values,)
+
+    def getElement(self, row: int, col: int) -> float:
+        return self.values[row * 4 + col]
+
+    def transpose(self) -> MMatrix:
+        return MMatrix([self.values[col * 4 + row] for row in range(4) for col in range(4)])
+
+    def inverse(self) -> MMatrix:
+        # Gauss-Jordan elimination with partial pivoting.
+        rows = [self.values[i * 4:i * 4 + 4] + [1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+        for col in range(4):
+            pivot = max(range(col, 4), key=lambda r: abs(rows[r][col]))
+            if abs(rows[pivot][col]) < 1e-300:
+                raise ValueError("MMatrix is singular.")
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            scale = rows[col][col]
+            rows[col] = [v / scale for v in rows[col]]
+            for r in range(4):
+                if r != col and rows[r][col]:
+                    factor = rows[r][col]
+                    rows[r] = [v - factor * p for v, p in zip(rows[r], rows[col])]
+        return MMatrix([v for row in rows for v in row[4:]])
+
+
+class MFnNurbsCurve(object):
+    kInvalid = 0
+    kOpen = 1
+    kClosed = 2
+    kPeriodic = 3
+
+
+class MGlobal(object):
+    @staticmethod
+    def displayInfo(message: str) -> None:
+        pass
+
+    @staticmethod
+    def displayWarning(message: str) -> None:
+        pass
+
+    @staticmethod
+    def displayError(message: str) -> None:
+        pass
+
+
+class MPointArray(list):
+    pass
+
+
+class MVectorArray(list):
+    pass
+
+
+class MDoubleArray(list):
+    pass
+
+
+class MIntArray(list):
+    pass
+
+
+class MFloatPointArray(list):
+    pass
+
+
+class _PlaceholderMeta(type):
+
+    def __getattr__(cls, name: str) -> type:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return placeholder(cls.__qualname__ + "." + name)
+
+    def __call__(cls, *args: object, **kwargs: object) -> object:
+        return type.__call__(cls)
+
+
+class Placeholder(object, metaclass=_PlaceholderMeta):
+    """Inert object standing in for any symbol the benchmarks never use."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return placeholder(type(self).__qualname__ + "." + name)()
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        return self
+
+    def __iter__(self) -> Iterable:
+        return iter(())
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __lt__(self, other: object) -> bool:
+        return False
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+
+_placeholders: dict[str, type] = {}
+
+
+def placeholder(qualname: str) -> type:
+    """Return the placeholder class for a dotted name, one class per name."""
+    cls = _placeholders.get(qualname)
+    if cls is None:
+        cls = _PlaceholderMeta(qualname.rpartition(".")[2], (Placeholder,), {"__qualname__": qualname})
+        _placeholders[qualname] = cls
+    return cls
+
+
+class _PlaceholderModule(types.ModuleType):
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return placeholder(self.__name__ + "." + name)
+
+
+def _open_maya_module(name: str) -> types.ModuleType:
+    module = _PlaceholderModule(name)
+    for symbol in (
+        MSpace, MVector, MPoint, MMatrix, MFnNurbsCurve, MGlobal,
+        MPointArray, MVectorArray, MDoubleArray, MIntArray, MFloatPointArray,
+    ):
+        setattr(module, symbol.__name__, symbol)
+    return module
+
+
+class _PlaceholderFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+
+    def __init__(self, roots: Iterable[str]) -> None:
+        self.roots = tuple(roots)
+
+    def find_spec(self, fullname: str, path: object, target: object = None) -> importlib.machinery.ModuleSpec | None:
+        if fullname.split(".")[0] not in self.roots:
+            return None
+        return importlib.util.spec_from_loader(fullname, self, is_package=True)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType:
+        if spec.name in ("maya.api.OpenMaya", "maya.OpenMaya"):
+            module = _open_maya_module(spec.name)
+        else:
+            module = _PlaceholderModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        pass
+
+
+def _six_module() -> types.ModuleType:
+    module = types.ModuleType("six")
+    module.PY2 = False
+    module.PY3 = True
+    module.string_types = (str,)
+    module.text_type = str
+    module.binary_type = bytes
+    module.integer_types = (int,)
+    module.iteritems = lambda d: iter(d.items())
+    return module
+
+
+def _importable(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def install() -> list[str]:
+    """Install the stand-in modules for every root that is not importable.
+
+    Returns:
+        list of str: The top level names that were faked.
+    """
+    faked = [root for root in PLACEHOLDER_ROOTS if not _importable(root)]
+    if faked and not any(isinstance(f, _PlaceholderFinder) for f in sys.meta_path):
+        sys.meta_path.append(_PlaceholderFinder(faked))
+
+    if not _importable("six"):
+        sys.modules.setdefault("six", _six_module())
+        faked.append("six")
+
+    return faked
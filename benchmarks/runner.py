@@ -0,0 +1,194 @@
+"""Measure kernels and read / write / compare JSON reports."""
+from __future__ import annotations
+
+import datetime
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+
+from .kernels import Kernel
+
+
+REPORT_FORMAT_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """Timing and allocation figures of one kernel at one input size."""
+
+    kernel: str
+    size_label: str
+    size: int
+    repeat: int
+    best_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    peak_bytes: int
+    retained_bytes: int
+
+
+def _time_calls(func: Callable[[], object], repeat: int, min_seconds: float) -> list[float]:
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < repeat or (time.perf_counter() - started) < min_seconds and len(timings) < repeat * 10:
+        begin = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - begin)
+    return timings
+
+
+def _trace_allocations(func: Callable[[], object]) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak - before, after - before
+
+
+def measure(kernel: Kernel, size: int, repeat: int = 5, min_seconds: float = 0.2) -> Measurement:
+    """Measure ``kernel`` at ``size``.
+
+    The kernel is called once to warm caches, then timed at least ``repeat``
+    times (more while under ``min_seconds`` of total run time), and finally
+    called once more under :mod:`tracemalloc`. ``peak_bytes`` is the highest
+    traced memory above the starting level during that call and
+    ``retained_bytes`` what is still allocated after it, result included.
+    """
+    func = kernel.setup(size)
+    func()
+
+    timings = _time_calls(func, repeat, min_seconds)
+    peak_bytes, retained_bytes = _trace_allocations(func)
+
+    return Measurement(
+        kernel=kernel.name,
+        size_label=kernel.size_label,
+        size=size,
+        repeat=len(timings),
+        best_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        mean_seconds=statistics.fmean(timings),
+        peak_bytes=peak_bytes,
+        retained_bytes=retained_bytes,
+    )
+
+
+def run(
+    kernels: Iterable[Kernel],
+    repeat: int = 5,
+    min_seconds: float = 0.2,
+    sizes: Sequence[int] | None = None,
+    log: Callable[[str], None] | None = None,
+) -> list[Measurement]:
+    """Measure every kernel at each of its sizes, or at ``sizes`` when given."""
+    measurements = []
+    for kernel in kernels:
+        for size in sizes or kernel.sizes:
+            measurement = measure(kernel, size, repeat, min_seconds)
+            measurements.append(measurement)
+            if log:
+                log(format_measurement(measurement))
+    return measurements
+
+
+def format_measurement(measurement: Measurement) -> str:
+    return "{:<56} {:>18} {:>10.3f} ms {:>12,d} B peak".format(
+        measurement.kernel,
+        "{}={}".format(measurement.size_label, measurement.size),
+        measurement.best_seconds * 1000.0,
+        measurement.peak_bytes,
+    )
+
+
+def build_report(measurements: Sequence[Measurement], stand_in: Sequence[str] = ()) -> dict[str, object]:
+    """Return the JSON serializable report for ``measurements``."""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": numpy_version,
+        "stand_in": list(stand_in),
+        "results": [asdict(m) for m in measurements],
+    }
+
+
+def write_report(report: dict[str, object], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_report(path: str) -> dict[str, object]:
+    with open(path, "r") as f:
+        report = json.load(f)
+
+    version = report.get("format_version")
+    if version != REPORT_FORMAT_VERSION:
+        raise ValueError("Unsupported benchmark report version {} in {}".format(version, path))
+    return report
+
+
+def compare_reports(old: dict[str, object], new: dict[str, object]) -> list[dict[str, object]]:
+    """Pair the results of two reports by kernel and size.
+
+    Returns:
+        list of dict: One row per kernel/size present in both reports with the
+            ``time_ratio`` and ``peak_ratio`` of new over old (below 1.0 is an
+            improvement).
+    """
+    old_results = {(r["kernel"], r["size"]): r for r in old["results"]}
+    rows = []
+    for result in new["results"]:
+        previous = old_results.get((result["kernel"], result["size"]))
+        if previous is None:
+            continue
+
+        rows.append({
+            "kernel": result["kernel"],
+            "size_label": result["size_label"],
+            "size": result["size"],
+            "old_seconds": previous["best_seconds"],
+            "new_seconds": result["best_seconds"],
+            "time_ratio": _ratio(result["best_seconds"], previous["best_seconds"]),
+            "old_peak_bytes": previous["peak_bytes"],
+            "new_peak_bytes": result["peak_bytes"],
+            "peak_ratio": _ratio(result["peak_bytes"], previous["peak_bytes"]),
+        })
+    return rows
+
+
+def _ratio(new: float, old: float) -> float:
+    if old <= 0:
+        return 1.0 if new <= 0 else float("inf")
+    return new / old
+
+
+def format_comparison(row: dict[str, object]) -> str:
+    return "{:<56} {:>18} {:>10.3f} -> {:>10.3f} ms  x{:<6.2f} peak x{:.2f}".format(
+        row["kernel"],
+        "{}={}".format(row["size_label"], row["size"]),
+        row["old_seconds"] * 1000.0,
+        row["new_seconds"] * 1000.0,
+        row["time_ratio"],
+        row["peak_ratio"],
+    )
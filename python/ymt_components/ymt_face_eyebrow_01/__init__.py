@@ -477,6 +477,7 @@ class Component(component.Main):
 
             lvlType = "transform"
             cvs = ymt_util.getCurveCVs(crv, space="object")
+            arc_table = curve.ArcLengthTable(crv, space=om.MSpace.kWorld)
 
             for i, cv in enumerate(cvs):
 
@@ -484,7 +485,7 @@ class Component(component.Main):
                 oTrans = pm.PyNode(pm.createNode(lvlType, n=self.getName("secNpo", str(i).zfill(3)), p=self.browsHooks_root, ss=True))
 
                 oParam, oLength = curve.getCurveParamAtPosition(crv, cv)
-                uLength = curve.findLenghtFromParam(crv, oParam)
+                uLength = curve.findLenghtFromParam(crv, oParam, arc_table=arc_table)
                 u = uLength / oLength
 
                 # create motion paths transforms on main ctl curves
@@ -149,14 +149,13 @@ class Guide(guide.ComponentGuide):
         self.model = self.root.getParent(generations=-1)
         self.setParamDefValuesFromProperty(self.root)
         self.sliding_surface = pm.PyNode(self.getName("sliding_surface"))
-        info = ymt_utility.serialize_nurbs_surface(self.sliding_surface.name())
 
         super(Guide, self).setFromHierarchy(root)
-        pm.delete(self.sliding_surface)
 
-        sliding_surface = ymt_utility.deserialize_nurbs_surface(self.getName("sliding_surface"), info)
+        sliding_surface = ymt_utility.refresh_sliding_surface(self.sliding_surface.name(), self.root.name())
         self.sliding_surface = pm.PyNode(sliding_surface)
-        pm.parent(self.sliding_surface, self.root, absolute=False, relative=True)
+        if self.sliding_surface.getParent() != self.root:
+            pm.parent(self.sliding_surface, self.root, absolute=False, relative=True)
 
     def get_guide_template_dict(self) -> None:
         """Override the base class method to add more data to the guide template dict"""
@@ -164,6 +163,7 @@ class Guide(guide.ComponentGuide):
 
         self.sliding_surface = pm.PyNode(self.getName("sliding_surface"))
         c_dict["sliding_surface"] = ymt_utility.serialize_nurbs_surface(self.sliding_surface.name())
+        ymt_utility.store_sliding_surface_hash(self.sliding_surface.name(), self.root.name())
 
         return c_dict
 
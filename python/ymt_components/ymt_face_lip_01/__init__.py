@@ -354,6 +354,7 @@ class Component(component.Main):
 
         pm.progressWindow(title='Creating Upper Joints', progress=0, max=len(cvs))
 
+        arc_table = curve.ArcLengthTable(rope, space=om.MSpace.kWorld)
         for i, cv in enumerate(cvs):
             if skipHeadAndTail and i == 0:
                 continue
@@ -367,7 +368,7 @@ class Component(component.Main):
             npo = addTransform(rope_root, self.getName("{}LipRope_npo{}".format(name, str(i).zfill(3))))
 
             oParam, oLength = curve.getCurveParamAtPosition(rope, local_cvs[i])
-            uLength = curve.findLenghtFromParam(rope, oParam)
+            uLength = curve.findLenghtFromParam(rope, oParam, arc_table=arc_table)
             u = uLength / oLength
 
             if (i + 1) / float(len(cvs)) < 0.5:
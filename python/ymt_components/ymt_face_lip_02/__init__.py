@@ -302,6 +302,7 @@ class Component(component.Main):
 
         controls = []
         npos = []
+        ropes = []
         for i, (cvo, cvw) in enumerate(cvs):
 
             mirror = i > self.num_locs / 2
@@ -334,13 +335,20 @@ class Component(component.Main):
                     _index = (tmp - i + self.right_index - 1)
 
             with ymt_util.overrideNamingAttributeTemporary(self, side=oSide):
-                cvu = datatypes.Vector(cvo[0], cvo[1], cvo[2])
-
                 upv = addTransform(self.upv_root, self.getName("rope_{}_upv".format(_index)))
                 cns = addTransform(self.rope_root, self.getName("rope_{}_cns".format(_index)))
-                curve.applyRopeCnsLocal(upv, self.crv_ctl, self.upv_crv, cvu)
-                curve.applyRopeCnsLocalWithUpv(cns, upv, self.crv_ctl, self.rope, cvo)
+                ropes.append((i, oSide, _index, mirror, lower, cvo, upv, cns))
+
+        # constrain every rope transform in one pass so the rope edit points
+        # are read once instead of per location
+        cvos = [entry[5] for entry in ropes]
+        upvs = [entry[6] for entry in ropes]
+        cnss = [entry[7] for entry in ropes]
+        curve.applyRopeCnsLocalBatch(upvs, self.crv_ctl, self.upv_crv, cvos)
+        curve.applyRopeCnsLocalWithUpvBatch(cnss, upvs, self.crv_ctl, self.rope, cvos)
 
+        for i, oSide, _index, mirror, lower, cvo, upv, cns in ropes:
+            with ymt_util.overrideNamingAttributeTemporary(self, side=oSide):
                 m = getTransform(cns)
                 m = setMatrixPosition(m, self._objToWorld(self.locsPos[i]))
 
@@ -313,6 +313,7 @@ class Component(component.Main):
 
         logger.debug("Adding rope control joints... self.left_index: {}, self.right_index: {}".format(self.left_index, self.right_index))
         xforms = []  # type: List[datatypes.Matrix] # to store xforms for each cv
+        ropes = []
         for i, _ in enumerate(cvsObject):
 
             mirror = i > self.num_locs / 2
@@ -350,9 +351,19 @@ class Component(component.Main):
 
                 upv = addTransform(self.upv_root, self.getName("rope_{}_upv".format(_index)))
                 cns = addTransform(rope_root, self.getName("rope_{}_cns".format(_index)))
-                curve.applyRopeCnsLocal(upv, self.crv_ctl, self.upv_crv, cvu)
-                curve.applyRopeCnsLocalWithUpv(cns, upv, self.crv_ctl, self.rope, cvo)
-
+                ropes.append((i, oSide, _index, mirror, lower, cvo, cvu, upv, cns))
+
+        # constrain every rope transform in one pass so the rope edit points
+        # are read once instead of per location
+        cvos = [entry[5] for entry in ropes]
+        cvus = [entry[6] for entry in ropes]
+        upvs = [entry[7] for entry in ropes]
+        cnss = [entry[8] for entry in ropes]
+        curve.applyRopeCnsLocalBatch(upvs, self.crv_ctl, self.upv_crv, cvus)
+        curve.applyRopeCnsLocalWithUpvBatch(cnss, upvs, self.crv_ctl, self.rope, cvos)
+
+        for i, oSide, _index, mirror, lower, cvo, cvu, upv, cns in ropes:
+            with ymt_util.overrideNamingAttributeTemporary(self, side=oSide):
                 m = getTransform(cns)
                 m = setMatrixPosition(m, self._objToWorld(self.locsPos[i]))
 
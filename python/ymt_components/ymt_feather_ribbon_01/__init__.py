@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import math
+import time
 import importlib
 from contextlib import suppress
+from logging import getLogger
 from typing import TYPE_CHECKING, Optional, TypedDict, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import maya.cmds as cmds
 
 try:
@@ -38,9 +47,14 @@ if TYPE_CHECKING:
         blades: dict[str, BladeLike]
 
 
+logger = getLogger(__name__)
+
 MAYA_2025_API_VERSION = 20250000
 PARENT_COMPONENT_TYPE = "ymt_birdwing_3jnt_01"
 ROTATE_ORDER_XYZ = 0
+# debug only: after the batched write, time rewriting every CV through
+# skinPercent too and log it next to the batched timings
+COMPARE_PER_CV_SKIN_WRITE = False
 
 
 class DetailSpec(TypedDict):
@@ -419,30 +433,349 @@ class Component(component.Main):
         self._validate_surface_topology(u_count, v_count, surface_u_values, surface_depths)
         influence_names = self._skin_influence_names(skin)
         influence_by_node = self._skin_influence_names_by_node(skin)
+
+        start = time.perf_counter()
+        weights = self._surface_weight_matrix(
+            surface_shape, surface_u_values, surface_depths, influence_names, influence_by_node
+        )
+        matrix_seconds = time.perf_counter() - start
+
         with suppress(RuntimeError):
             cmds.setAttr(skin + ".normalizeWeights", 0)
 
-        for u_index in range(u_count):
-            u = surface_u_values[u_index]
-            for v_index in range(v_count):
-                depth = surface_depths[v_index]
-                component = "%s.cv[%s][%s]" % (surface_shape, u_index, v_index)
-                weights = dict.fromkeys(influence_names, 0.0)
-                for joint, weight in self._surface_anchor_weight_entries(depth, u):
-                    weights[influence_by_node[self._node_name(joint)]] = weight
-                for curl_joint, curl_weight in self._surface_curl_weight_entries(u, depth):
-                    weights[influence_by_node[self._node_name(curl_joint)]] = curl_weight
-                total = sum(weights.values())
-                if total <= 0.0:
-                    raise RuntimeError("ymt_feather_ribbon_01 generated zero total skin weight for %s." % component)
-                normalized = [(name, weight / total) for name, weight in weights.items()]
-                cmds.skinPercent(skin, component, transformValue=normalized, normalize=False)
+        start = time.perf_counter()
+        batch = self._write_surface_skin_weights(skin, surface_shape, v_count, influence_names, influence_by_node, weights)
+        if not batch:
+            self._write_surface_skin_weights_per_cv(skin, surface_shape, v_count, influence_names, weights)
+        write_seconds = time.perf_counter() - start
+
+        if batch and COMPARE_PER_CV_SKIN_WRITE:
+            start = time.perf_counter()
+            self._write_surface_skin_weights_per_cv(skin, surface_shape, v_count, influence_names, weights)
+            logger.info(
+                "%s surface skin weights: skinPercent per CV %.1f ms, MFnSkinCluster.setWeights %.1f ms",
+                skin,
+                (time.perf_counter() - start) * 1000.0,
+                write_seconds * 1000.0,
+            )
 
         with suppress(RuntimeError):
             cmds.setAttr(skin + ".normalizeWeights", 1)
             cmds.skinCluster(skin, edit=True, forceNormalizeWeights=True)
-        self._validate_surface_skin_weights(
-            skin, surface_shape, surface_u_values, v_count, surface_depths, influence_by_node
+
+        start = time.perf_counter()
+        if batch:
+            self._validate_surface_skin_weight_matrix(skin, surface_shape, v_count, influence_names, influence_by_node, weights)
+        else:
+            self._validate_surface_skin_weights(
+                skin, surface_shape, surface_u_values, v_count, surface_depths, influence_by_node
+            )
+        validate_seconds = time.perf_counter() - start
+
+        logger.info(
+            "%s surface skin weights, %d CVs x %d influences: matrix %.1f ms (%s), write %.1f ms (%s), "
+            "validate %.1f ms",
+            skin,
+            u_count * v_count,
+            len(influence_names),
+            matrix_seconds * 1000.0,
+            "numpy" if np is not None else "python",
+            write_seconds * 1000.0,
+            "MFnSkinCluster.setWeights" if batch else "skinPercent per CV",
+            validate_seconds * 1000.0,
+        )
+
+    def _surface_weight_matrix(
+        self,
+        surface_shape: str,
+        surface_u_values: list[float],
+        surface_depths: list[float],
+        influence_names: list[str],
+        influence_by_node: dict[str, str],
+    ) -> Union[list[list[float]], np.ndarray]:
+        """Return the normalized (CV x influence) weights, CVs in u-major order.
+
+        At a CV (u, depth) an anchor joint gets its u entry times its layer
+        entry times ``1 - curl weight`` and a curl joint the entries of
+        ``_surface_curl_weight_entries``. The weight kernels are only
+        evaluated per u column and per depth row (see
+        ``_surface_weight_tables``) and combined by outer products.
+        """
+        if not self.curl_surface_skin_joints:
+            raise RuntimeError("ymt_feather_ribbon_01 curl surface skin joints were not properly initialized.")
+
+        column_by_name = {name: index for index, name in enumerate(influence_names)}
+
+        def _column(joint: PymelNode) -> int:
+            return column_by_name[influence_by_node[self._node_name(joint)]]
+
+        anchor_columns = [[_column(joint) for joint in joints] for joints in self.anchor_surface_skin_joints]
+        curl_columns = [_column(joint) for joint in self.curl_surface_skin_joints]
+        tables = self._surface_weight_tables(surface_u_values, surface_depths)
+
+        if np is not None:
+            rows = self._combine_surface_weight_tables_numpy(tables, anchor_columns, curl_columns, len(influence_names))
+        else:
+            rows = self._combine_surface_weight_tables(tables, anchor_columns, curl_columns, len(influence_names))
+
+        def _zero_weight_error(index: int) -> RuntimeError:
+            v_count = len(surface_depths)
+            component = "%s.cv[%s][%s]" % (surface_shape, index // v_count, index % v_count)
+            return RuntimeError("ymt_feather_ribbon_01 generated zero total skin weight for %s." % component)
+
+        if np is not None:
+            matrix = np.asarray(rows, dtype=float)
+            totals = matrix.sum(axis=1)
+            zero_rows = np.flatnonzero(totals <= 0.0)
+            if zero_rows.size:
+                raise _zero_weight_error(int(zero_rows[0]))
+            return matrix / totals[:, np.newaxis]
+
+        normalized = []
+        for index, row in enumerate(rows):
+            total = sum(row)
+            if total <= 0.0:
+                raise _zero_weight_error(index)
+            normalized.append([weight / total for weight in row])
+        return normalized
+
+    def _surface_weight_tables(self, surface_u_values: list[float], surface_depths: list[float]) -> dict[str, list]:
+        """Evaluate the separable weight factors once per u column and per depth row.
+
+        Returns a dict of
+            ``anchor``: anchor entries per u (``_anchor_weight_entries_for_u``),
+            ``curl``: normalized curl raw weights per u,
+            ``segment``: curl segment weight per u,
+            ``layer``: layer entries per depth (``_anchor_layer_weight_entries_for_depth``),
+            ``depth``: curl depth weight per depth.
+        """
+        raw_table = self._surface_curl_raw_weight_table(surface_u_values)
+        curl = []
+        segment = []
+        for raw_weights in raw_table:
+            raw_total = sum(raw_weights)
+            segment.append(min(1.0, raw_total))
+            if raw_total <= 0.0:
+                curl.append([0.0] * len(raw_weights))
+            else:
+                curl.append([raw_weight / raw_total for raw_weight in raw_weights])
+
+        max_depth = self._max_surface_depth()
+        if max_depth <= 0.0:
+            depth_weights = [0.0] * len(surface_depths)
+        else:
+            depth_weights = [max(0.0, min(1.0, depth / max_depth)) for depth in surface_depths]
+
+        return {
+            "anchor": [self._anchor_weight_entries_for_u(u) for u in surface_u_values],
+            "curl": curl,
+            "segment": segment,
+            "layer": [self._anchor_layer_weight_entries_for_depth(depth) for depth in surface_depths],
+            "depth": depth_weights,
+        }
+
+    def _surface_curl_raw_weight_table(self, surface_u_values: list[float]) -> list[list[float]]:
+        """``_surface_curl_raw_weights_for_u`` for every u, radii computed once."""
+        count = len(self.curl_surface_skin_joints)
+        centers = [self._curl_u(index) for index in range(count)]
+        radii = [self._surface_curl_weight_radius(centers, index) for index in range(count)]
+
+        if np is None:
+            return [
+                [
+                    1.0 - self._smootherstep(abs(u - center) / radius)
+                    if radius > 0.0 else (1.0 if abs(u - center) <= 0.001 else 0.0)
+                    for center, radius in zip(centers, radii)
+                ]
+                for u in surface_u_values
+            ]
+
+        distance = np.abs(np.asarray(surface_u_values, dtype=float)[:, np.newaxis] - np.asarray(centers, dtype=float))
+        radius = np.asarray(radii, dtype=float)
+        safe_radius = np.where(radius > 0.0, radius, 1.0)
+        weights = 1.0 - self._smootherstep_array(distance / safe_radius)
+        weights = np.where(radius > 0.0, weights, (distance <= 0.001).astype(float))
+        return weights.tolist()
+
+    def _smootherstep_array(self, values: np.ndarray) -> np.ndarray:
+        t = np.clip(values, 0.0, 1.0)
+        return t * t * t * (t * ((t * 6.0) - 15.0) + 10.0)
+
+    def _combine_surface_weight_tables(
+        self,
+        tables: dict[str, list],
+        anchor_columns: list[list[int]],
+        curl_columns: list[int],
+        column_count: int,
+    ) -> list[list[float]]:
+        rows = []
+        for anchor_entries, curl, segment in zip(tables["anchor"], tables["curl"], tables["segment"]):
+            for layer_entries, depth_weight in zip(tables["layer"], tables["depth"]):
+                row = [0.0] * column_count
+                curl_weight = max(0.0, min(1.0, depth_weight * segment * 0.65))
+                anchor_weight = max(0.0, 1.0 - curl_weight)
+                for anchor_index, anchor_value in anchor_entries:
+                    for layer_index, layer_value in layer_entries:
+                        row[anchor_columns[anchor_index][layer_index]] = anchor_value * layer_value * anchor_weight
+                if curl_weight > 0.0:
+                    for column, weight in zip(curl_columns, curl):
+                        if weight > 0.0:
+                            row[column] = curl_weight * weight
+                rows.append(row)
+        return rows
+
+    def _combine_surface_weight_tables_numpy(
+        self,
+        tables: dict[str, list],
+        anchor_columns: list[list[int]],
+        curl_columns: list[int],
+        column_count: int,
+    ) -> np.ndarray:
+        u_count = len(tables["anchor"])
+        v_count = len(tables["layer"])
+
+        anchor = np.zeros((u_count, len(anchor_columns)))
+        for u_index, entries in enumerate(tables["anchor"]):
+            for anchor_index, value in entries:
+                anchor[u_index, anchor_index] = value
+        layer = np.zeros((v_count, max(len(columns) for columns in anchor_columns)))
+        for v_index, entries in enumerate(tables["layer"]):
+            for layer_index, value in entries:
+                layer[v_index, layer_index] = value
+
+        curl_weight = np.clip(np.outer(tables["segment"], tables["depth"]) * 0.65, 0.0, 1.0)
+        anchor_weight = np.maximum(0.0, 1.0 - curl_weight)
+
+        weights = np.zeros((u_count, v_count, column_count))
+        for anchor_index, columns in enumerate(anchor_columns):
+            for layer_index, column in enumerate(columns):
+                weights[:, :, column] = np.outer(anchor[:, anchor_index], layer[:, layer_index]) * anchor_weight
+        weights[:, :, curl_columns] = curl_weight[:, :, np.newaxis] * np.asarray(tables["curl"])[:, np.newaxis, :]
+
+        return weights.reshape(u_count * v_count, column_count)
+
+    def _surface_skin_api_objects(
+        self,
+        skin: str,
+        surface_shape: str,
+        v_count: int,
+        weights: Union[list[list[float]], np.ndarray],
+    ) -> tuple[oma.MFnSkinCluster, om.MDagPath, om.MObject, list[int]]:
+        """Return the skin function set, shape path, all CV components and their matrix rows."""
+        selection = om.MSelectionList()
+        selection.add(skin)
+        selection.add(surface_shape)
+        skin_fn = oma.MFnSkinCluster(selection.getDependNode(0))
+        shape_path = selection.getDagPath(1)
+
+        component_fn = om.MFnDoubleIndexedComponent()
+        components = component_fn.create(om.MFn.kSurfaceCVComponent)
+        component_fn.addElements([(index // v_count, index % v_count) for index in range(len(weights))])
+        # the component decides the order the weights are read in
+        rows = [u_index * v_count + v_index for u_index, v_index in component_fn.getElements()]
+
+        return skin_fn, shape_path, components, rows
+
+    def _skin_influence_indices(
+        self,
+        skin_fn: oma.MFnSkinCluster,
+        influence_names: list[str],
+        influence_by_node: dict[str, str],
+    ) -> list[int]:
+        physical_by_name = {}
+        for index, path in enumerate(skin_fn.influenceObjects()):
+            name = influence_by_node.get(path.partialPathName()) or influence_by_node.get(path.fullPathName())
+            if name is not None:
+                physical_by_name[name] = index
+        return [physical_by_name[name] for name in influence_names]
+
+    def _write_surface_skin_weights(
+        self,
+        skin: str,
+        surface_shape: str,
+        v_count: int,
+        influence_names: list[str],
+        influence_by_node: dict[str, str],
+        weights: Union[list[list[float]], np.ndarray],
+    ) -> bool:
+        """Write every CV weight with one MFnSkinCluster.setWeights call.
+
+        Returns False, leaving the weights untouched, when the skin cluster
+        can not be written through the API.
+        """
+        try:
+            skin_fn, shape_path, components, rows = self._surface_skin_api_objects(skin, surface_shape, v_count, weights)
+            influence_indices = self._skin_influence_indices(skin_fn, influence_names, influence_by_node)
+            if np is not None:
+                values = np.asarray(weights)[rows].ravel().tolist()
+            else:
+                values = [weight for row in rows for weight in weights[row]]
+            skin_fn.setWeights(shape_path, components, om.MIntArray(influence_indices), om.MDoubleArray(values), False)
+        except (RuntimeError, KeyError, TypeError) as e:
+            logger.warning("Falling back to per CV skinPercent for %s: %s", skin, e)
+            return False
+        return True
+
+    def _write_surface_skin_weights_per_cv(
+        self,
+        skin: str,
+        surface_shape: str,
+        v_count: int,
+        influence_names: list[str],
+        weights: Union[list[list[float]], np.ndarray],
+    ) -> None:
+        for index, row in enumerate(weights):
+            component = "%s.cv[%s][%s]" % (surface_shape, index // v_count, index % v_count)
+            normalized = [(name, float(weight)) for name, weight in zip(influence_names, row)]
+            cmds.skinPercent(skin, component, transformValue=normalized, normalize=False)
+
+    def _validate_surface_skin_weight_matrix(
+        self,
+        skin: str,
+        surface_shape: str,
+        v_count: int,
+        influence_names: list[str],
+        influence_by_node: dict[str, str],
+        weights: Union[list[list[float]], np.ndarray],
+        tolerance: float = 1e-4,
+    ) -> None:
+        """Read every CV weight back with one getWeights call and compare it to the matrix."""
+        skin_fn, shape_path, components, rows = self._surface_skin_api_objects(skin, surface_shape, v_count, weights)
+        influence_indices = self._skin_influence_indices(skin_fn, influence_names, influence_by_node)
+        actual = skin_fn.getWeights(shape_path, components, om.MIntArray(influence_indices))
+        column_count = len(influence_names)
+
+        if np is not None:
+            actual_matrix = np.asarray(list(actual), dtype=float).reshape(len(rows), column_count)
+            difference = np.abs(actual_matrix - np.asarray(weights)[rows])
+            if difference.max(initial=0.0) <= tolerance:
+                return
+            position, column = np.unravel_index(int(difference.argmax()), difference.shape)
+            position, column = int(position), int(column)
+        else:
+            position = column = None
+            for position_index, row in enumerate(rows):
+                for column_index in range(column_count):
+                    value = actual[position_index * column_count + column_index]
+                    if abs(value - weights[row][column_index]) > tolerance:
+                        position, column = position_index, column_index
+                        break
+                if position is not None:
+                    break
+            if position is None:
+                return
+
+        row = rows[position]
+        component = "%s.cv[%s][%s]" % (surface_shape, row // v_count, row % v_count)
+        raise RuntimeError(
+            "ymt_feather_ribbon_01 failed to assign skin weight: "
+            "%s expected %.3f on %s, got %.3f."
+            % (
+                influence_names[column],
+                float(weights[row][column]),
+                component,
+                float(actual[position * column_count + column]),
+            )
         )
 
     def _validate_surface_skin_weights(
@@ -534,18 +867,6 @@ class Component(component.Main):
                 raise RuntimeError("ymt_feather_ribbon_01 could not resolve skin influence for '%s'." % joint_name)
         return mapping
 
-    def _surface_anchor_weight_entries(self, depth: float, u: float) -> list[tuple[PymelNode, float]]:
-        anchor_entries = self._anchor_weight_entries_for_u(u)
-        layer_entries = self._anchor_layer_weight_entries_for_depth(depth)
-        curl_weight = self._surface_curl_weight_for_u(u, depth)
-        anchor_weight = max(0.0, 1.0 - curl_weight)
-        entries = []
-        for anchor_index, anchor_value in anchor_entries:
-            for layer_index, layer_value in layer_entries:
-                joint = self.anchor_surface_skin_joints[anchor_index][layer_index]
-                entries.append((joint, anchor_value * layer_value * anchor_weight))
-        return entries
-
     def _surface_curl_weight_entries(self, u: float, depth: float) -> list[tuple[PymelNode, float]]:
         if not self.curl_surface_skin_joints:
             raise RuntimeError("ymt_feather_ribbon_01 curl surface skin joints were not properly initialized.")
@@ -237,6 +237,7 @@ class Component(component.Main):
         else:
             scl = [1, 1, 1]
 
+        arc_table = curve.ArcLengthTable(self.surfaceCurve, space=om.MSpace.kWorld)
         for i, (pos, tra) in enumerate(
                 zip(self.guide.apos[1:-1],
                     self.guide.atra[1:-1]
@@ -245,7 +246,7 @@ class Component(component.Main):
 
             tra = transform.setMatrixScale(tra, scl)
             adj = addTransform(self.ctl_root, self.getName("detail{}_adj".format(str(i))), tra)
-            cns = curve.applyPathConstrainLocal(adj, self.surfaceCurve)
+            cns = curve.applyPathConstrainLocal(adj, self.surfaceCurve, arc_table=arc_table)
             cmds.setAttr(cns + ".worldUpType", 2)  # object rotation up
             cmds.setAttr(cns + ".worldUpVectorX", 0)
             cmds.setAttr(cns + ".worldUpVectorY", 0)
@@ -601,35 +601,10 @@ class Component(component.Main):
 
         curveLen = curveFn.length()
         max_param = curveLen / 33.3333
-        maximum_iteration = 10000
 
-        joint = getAsMFnNode(joints[0], om.MFnTransform)
-        _positions = []
-
-        for param in [(max_param / maximum_iteration) * x for x in range(maximum_iteration)]:
-            cmds.setAttr("{0}.params[0].param".format(riderCnst), param)
-            cmds.dgeval(riderCnst)
-            p = joint.translation(om.MSpace.kWorld)
-            _positions.append(p)
-
-        def _searchNearestParam(pos: float) -> None:
-
-            res = _positions[0]
-            cur = None
-            pos = om.MVector(pos)
-
-            for i, p in enumerate(_positions):
-                d = (p - pos).length()
-                if not cur or cur > d:
-                    cur = d
-                    res = p
-
-            return max_param / maximum_iteration * _positions.index(res)
-
-        cmds.setAttr("{0}.params[0].param".format(riderCnst), 0.0)
-        for i, pos in enumerate(positions[1:]):
+        params = ymt_util.find_nearest_rider_params(joints[0], riderCnst, max_param, positions[1:])
+        for i, param in enumerate(params):
             i = i + 1  # skiped first
-            param = _searchNearestParam(pos)
             cmds.setAttr("{0}.params[{1}].param".format(riderCnst, i), param)
 
     def convertToTwistSpline(self, positions: object, crv: object, ikNb: object, isClosed: bool=False) -> None:
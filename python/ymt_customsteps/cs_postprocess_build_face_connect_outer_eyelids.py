@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import importlib
 try:
     pm = importlib.import_module("mgear.pymaya")
@@ -59,8 +60,9 @@ class CustomShifterStep(cstp.customShifterMainStep):
         blink_crv = self.get_blink_crv(left=True)
         eyelids, dummy_start, dummy_end = self.get_npos(left=True)
         dest_crv = self.blendShape("eyelidline_L0_", brow_crv, blink_crv, eyelids)
+        arc_table = curve.ArcLengthTable(dest_crv, space=om.MSpace.kWorld)
         for npo in eyelids:
-            curve.applyPathConstrainLocal(npo, dest_crv)
+            curve.applyPathConstrainLocal(npo, dest_crv, arc_table=arc_table)
 
         cmds.delete(dummy_start)
         cmds.delete(dummy_end)
@@ -70,8 +72,9 @@ class CustomShifterStep(cstp.customShifterMainStep):
         blink_crv = self.get_blink_crv(left=False)
         eyelids, dummy_start, dummy_end = self.get_npos(left=False)
         dest_crv = self.blendShape("eyelidline_R0_", brow_crv, blink_crv, eyelids, False)
+        arc_table = curve.ArcLengthTable(dest_crv, space=om.MSpace.kWorld)
         for npo in eyelids:
-            curve.applyPathConstrainLocal(npo, dest_crv)
+            curve.applyPathConstrainLocal(npo, dest_crv, arc_table=arc_table)
         cmds.delete(dummy_start)
         cmds.delete(dummy_end)
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import re
 import math
+import hashlib
 import sys
 import contextlib
 from collections.abc import Iterator, Sequence
@@ -40,6 +41,8 @@ from mgear.core.primitive import addTransform
 from ymt_shifter_utility import twistSplineBuilder as tsBuilder
 from ymt_shifter_utility.type_protocols import ComponentLike, DagNodeLike, MatrixLike, PymelNode, VectorLike
 from ymt_shifter_utility import synoptic
+from ymt_shifter_utility import geometry_codec
+from ymt_shifter_utility.spatial_index import PointGridIndex
 
 from logging import (
     StreamHandler,  # noqa: F401
@@ -144,6 +147,7 @@ if sys.version_info > (3, 0):
             Union  # noqa: F401
         )
         import mgear.shifter.component as component  # noqa: F401
+        from ymt_shifter_utility import curve  # noqa: F401
 
     from typing import (
         Union,  # noqa: F401
@@ -931,49 +935,102 @@ def alignControllers(cvs: List[Text], bfrs: List[Text], oTans: List[Text], iTans
         insertNpo(cv)
 
 
-def alignDeformers(joints: List, positions: List, riderCnst: Text, curveFn: om.MFnNurbsCurve) -> None:
-    # align deformer joints to the given positions
+_GOLDEN_RATIO_INV = (math.sqrt(5.0) - 1.0) * 0.5
 
-    curveLen = curveFn.length()
-    max_param = curveLen * len(positions) / 33.3
-    maximum_iteration = 10000
 
-    joint = getAsMFnNode(joints[0], om.MFnTransform)
-    _positions = []
+def _golden_section_minimize(func: Callable[[float], float], low: float, high: float, tolerance: float) -> float:
+    """Return the argument minimizing a unimodal ``func`` on ``[low, high]``."""
 
-    for param in [(max_param / maximum_iteration) * x for x in range(maximum_iteration)]:
-        cmds.setAttr("{0}.params[0].param".format(riderCnst), param)
+    a, b = low, high
+    c = b - (b - a) * _GOLDEN_RATIO_INV
+    d = a + (b - a) * _GOLDEN_RATIO_INV
+    fc = func(c)
+    fd = func(d)
+    while (b - a) > tolerance:
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - (b - a) * _GOLDEN_RATIO_INV
+            fc = func(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + (b - a) * _GOLDEN_RATIO_INV
+            fd = func(d)
+
+    return (a + b) * 0.5
+
+
+def find_nearest_rider_params(
+    joint: Text,
+    riderCnst: Text,
+    max_param: float,
+    positions: Sequence[Sequence[float]],
+    coarse_samples: int = 200,
+    resolution: int = 10000,
+) -> List[float]:
+    """Return the rider ``params[0]`` value placing ``joint`` nearest each position.
+
+    The rider is sampled at ``coarse_samples`` params in ``[0, max_param)``
+    and the samples are indexed spatially. Each query picks the nearest sample
+    and refines it by golden-section search between the neighbouring samples
+    down to ``max_param / resolution``. That needs a few hundred DG
+    evaluations instead of one per ``resolution`` step.
+    """
+
+    joint_fn = getAsMFnNode(joint, om.MFnTransform)
+    param_attr = "{0}.params[0].param".format(riderCnst)
+    coarse_samples = max(2, coarse_samples)
+    step = max_param / coarse_samples
+    sample_params = [step * x for x in range(coarse_samples)]
+
+    def _evaluate(param: float) -> om.MVector:
+        cmds.setAttr(param_attr, param)
         cmds.dgeval(riderCnst)
-        p = joint.translation(om.MSpace.kWorld)
-        _positions.append(p)
+        return joint_fn.translation(om.MSpace.kWorld)
+
+    samples = [_evaluate(param) for param in sample_params]
+    sample_index = PointGridIndex(samples)
+    tolerance = max_param / resolution
 
-    def _searchNearestParam(pos: Sequence[float]) -> float:
+    params = []
+    for pos in positions:
+        target = om.MVector(pos)
+        nearest, _ = sample_index.nearest(target)
+        low = sample_params[max(nearest - 1, 0)]
+        high = sample_params[min(nearest + 1, coarse_samples - 1)]
+        params.append(_golden_section_minimize(
+            lambda param: (_evaluate(param) - target).length(),
+            low,
+            high,
+            tolerance,
+        ))
 
-        res = _positions[0]
-        cur = None
-        pos = om.MVector(pos)
+    cmds.setAttr(param_attr, 0.0)
+    return params
 
-        for i, p in enumerate(_positions):
-            d = (p - pos).length()
-            if not cur or cur > d:
-                cur = d
-                res = p
 
-        return max_param / maximum_iteration * _positions.index(res)
+def alignDeformers(joints: List, positions: List, riderCnst: Text, curveFn: om.MFnNurbsCurve) -> None:
+    # align deformer joints to the given positions
+
+    curveLen = curveFn.length()
+    max_param = curveLen * len(positions) / 33.3
 
-    cmds.setAttr("{0}.params[0].param".format(riderCnst), 0.0)
-    for i, pos in enumerate(positions[1:]):
+    params = find_nearest_rider_params(joints[0], riderCnst, max_param, positions[1:])
+    for i, param in enumerate(params):
         i = i + 1  # skiped first
-        param = _searchNearestParam(pos)
         cmds.setAttr("{0}.params[{1}].param".format(riderCnst, i), param)
 
 
-def withCurvePos(curveFn: om.MFnNurbsCurve, it: Sequence[object], offset: float = 0.0) -> Iterator[tuple[tuple[float, float, float], object]]:
+def withCurvePos(curveFn: om.MFnNurbsCurve, it: Sequence[object], offset: float = 0.0, arc_table: Optional[curve.ArcLengthTable] = None) -> Iterator[tuple[tuple[float, float, float], object]]:
 
-    curveLen = curveFn.length()
+    if arc_table is not None:
+        curveLen = arc_table.total_length
+        findParamFromLength = arc_table.param_at_length
+    else:
+        curveLen = curveFn.length()
+        findParamFromLength = curveFn.findParamFromLength
 
     if len(it) == 1:
-        param = curveFn.findParamFromLength(curveLen * offset)
+        param = findParamFromLength(curveLen * offset)
         point = curveFn.getPointAtParam(param, om.MSpace.kObject)
         pos = point[0], point[1], point[2]
 
@@ -982,7 +1039,7 @@ def withCurvePos(curveFn: om.MFnNurbsCurve, it: Sequence[object], offset: float
 
     for i, element in enumerate(it):
 
-        param = curveFn.findParamFromLength((curveLen / (len(it) - 1)) * (i + offset))
+        param = findParamFromLength((curveLen / (len(it) - 1)) * (i + offset))
         point = curveFn.getPointAtParam(param, om.MSpace.kObject)
         pos = point[0], point[1], point[2]
 
@@ -1078,55 +1135,55 @@ def add3DChain(parent: PymelNode, name: str, positions: Sequence[VectorLike], no
     return joints
 
 
-def __has_make_nurbs_surface_hostory(surface_name: str) -> bool:
-    """Return True if the surface has makeNurbPlane history"""
-    for history in cmds.listHistory(surface_name) or []:
-        if cmds.nodeType(history) == "makeNurbPlane":
-            return True
+def serialize_mesh_data(mesh: om.MFnMesh, face_vertex_normals: bool = False) -> dict[str, object]:
+    """Return the packed topology, points and uvs of a mesh.
 
-    return False
+    Everything is read with the bulk ``MFnMesh`` getters; uvs are stored as
+    per-polygon counts and uv ids, like ``MFnMesh.assignUVs`` takes them.
 
+    Arguments:
+        mesh (om.MFnMesh): The mesh function set.
+        face_vertex_normals (bool): Also store the normals with their
+            per face-vertex ids so they can be restored as locked normals.
 
-def serialize_mesh_shape(mesh_name: str) -> str:
-    """Serialize a mesh shape to a string"""
-    meshes = cmds.ls(mesh_name, dag=True, type="mesh")
+    Returns:
+        dict: ``geometry_codec`` ready data of the mesh.
+    """
+    counts, connects = mesh.getVertices()
+    points = mesh.getPoints()
+    us, vs = mesh.getUVs()
+    uv_counts, uv_ids = mesh.getAssignedUVs()
+
+    data = {
+        "vertexCounts": geometry_codec.PackedArray("i", counts),
+        "vertexConnects": geometry_codec.PackedArray("i", connects),
+        "points": geometry_codec.PackedArray("f", [v for p in points for v in (p.x, p.y, p.z)]),
+        "us": geometry_codec.PackedArray("f", us),
+        "vs": geometry_codec.PackedArray("f", vs),
+        "uvCounts": geometry_codec.PackedArray("i", uv_counts),
+        "uvIndices": geometry_codec.PackedArray("i", uv_ids),
+    }
 
-    def _serialize_mesh(mesh_name: str) -> dict[str, object]:
-        # to store the mesh shape, we need to store the vertices, faces, normals, and uvs
-        # using OpenMaya to get the data
-        mesh = getAsMFnNode(mesh_name, om.MFnMesh)
-        vertices = mesh.getVertices()
-        points = mesh.getPoints()
+    if face_vertex_normals:
         normals = mesh.getNormals()
-        uvs = mesh.getUVs()
-        poly_uvs = []
-        uv_idices = []
-
-        iter_poly = om.MItMeshPolygon(mesh.object())
-        while not iter_poly.isDone():
-            poly_uv = iter_poly.getUVs()
-            us = list(poly_uv[0])
-            vs = list(poly_uv[1])
-            poly_uvs.append((us, vs))
-            indices = []
-            for i in range(iter_poly.polygonVertexCount()):
-                indices.append(iter_poly.getUVIndex(i))
-            uv_idices.extend(indices)
-
-            iter_poly.next()
-
-        return {
-            "vertices": ([v for v in vertices[0]], [v for v in vertices[1]]),
-            "points": [(p[0], p[1], p[2]) for p in points],
-            "normals": [(p[0], p[1], p[2]) for p in normals],
-            "uvs": (list(uvs[0]), list(uvs[1])),
-            "polyUvs": poly_uvs,
-            "uvIndices": uv_idices,
-        }
+        _, normal_ids = mesh.getNormalIds()
+        data["normals"] = geometry_codec.PackedArray("f", [v for n in normals for v in (n.x, n.y, n.z)])
+        data["normalIds"] = geometry_codec.PackedArray("i", normal_ids)
+
+    return data
+
+
+def serialize_mesh_shape(mesh_name: str, compression: str = "zlib", face_vertex_normals: bool = False) -> str:
+    """Serialize a mesh shape to a string
+
+    The result is a ``geometry_codec`` container with float32 points and
+    int32 topology arrays, see :mod:`ymt_shifter_utility.geometry_codec`.
+    """
+    meshes = cmds.ls(mesh_name, dag=True, type="mesh")
 
     res = []
     for mesh in meshes:
-        res.append(_serialize_mesh(mesh))
+        res.append(serialize_mesh_data(getAsMFnNode(mesh, om.MFnMesh), face_vertex_normals))
 
     serialized_data = {
         "localRotatePivot": cmds.xform(mesh_name, q=True, os=True, rp=True),
@@ -1137,18 +1194,41 @@ def serialize_mesh_shape(mesh_name: str) -> str:
         "meshes": res,
     }
 
-    return str(serialized_data)
+    return geometry_codec.encode(serialized_data, compression)
 
 
-def deserialize_mesh_shape(mesh_name: str, serialized_data: str) -> str:
-    """Deserialize a NURBS surface from a string"""
+def _mesh_shape_records(meshes: list[dict[str, object]]) -> Iterator[tuple[Sequence[int], Sequence[int], Sequence[float], Sequence[float], Sequence[float], Sequence[int], Sequence[int]]]:
+    """Yield (counts, connects, flat points, us, vs, uv counts, uv indices) per mesh.
 
-    if not isinstance(mesh_name, (str, unicode)):
-        raise TypeError("surface_name must be a string but got {0}".format(type(mesh_name)))
+    Accepts both the container layout and the legacy ``repr`` layout. The
+    legacy per-vertex normals carried no ids and were never restored.
+    """
+    for mesh in meshes:
+        if "vertexCounts" in mesh:
+            yield (
+                mesh["vertexCounts"],
+                mesh["vertexConnects"],
+                mesh["points"],
+                mesh["us"],
+                mesh["vs"],
+                mesh["uvCounts"],
+                mesh["uvIndices"],
+            )
+        else:
+            vertices = mesh["vertices"]
+            uvs = mesh["uvs"]
+            yield (
+                vertices[0],
+                vertices[1],
+                geometry_codec.flatten(mesh["points"]),
+                uvs[0],
+                uvs[1],
+                [len(uv[0]) for uv in mesh["polyUvs"]],
+                mesh["uvIndices"],
+            )
 
-    deserializedData = eval(serialized_data)
-    if deserializedData.get("controlVertices"):
-        return deserialize_nurbs_surface(mesh_name, serialized_data)
+
+def _create_mesh_shape(mesh_name: str, deserializedData: dict[str, object]) -> str:
 
     # Retrieve the necessary information from the deserialized data
     localRotatePivot = deserializedData["localRotatePivot"]
@@ -1169,103 +1249,222 @@ def deserialize_mesh_shape(mesh_name: str, serialized_data: str) -> str:
 
     fn_container = getAsMFnNode(container, om.MFnTransform)
 
-    for mesh in meshes:
+    created = []
+    for counts, connects, points, us, vs, uv_counts, uv_indices in _mesh_shape_records(meshes):
 
         mesh_fn = om.MFnMesh()
-        vertices = mesh["vertices"]
-        points = mesh["points"]
-        normals = mesh["normals"]
-        uvs = mesh["uvs"]
-        poly_uvs = mesh["polyUvs"]
-        uv_indices = mesh["uvIndices"]
-
-        vertex_array = om.MFloatPointArray()
-        for p in points:
-            vertex_array.append(om.MFloatPoint(*p))
-
+        created.append(mesh_fn)
         mesh_fn.create(
-            vertex_array,
-            vertices[0],
-            vertices[1],
+            om.MFloatPointArray(geometry_codec.group(points)),
+            om.MIntArray(counts),
+            om.MIntArray(connects),
             parent=fn_container.object()
         )
 
-        mesh_fn.setUVs(uvs[0], uvs[1])
-        uv_counts = [len(uv[0]) for uv in poly_uvs]
-        mesh_fn.assignUVs(uv_counts, uv_indices)
+        mesh_fn.setUVs(om.MFloatArray(us), om.MFloatArray(vs))
+        mesh_fn.assignUVs(om.MIntArray(uv_counts), om.MIntArray(uv_indices))
+
+    for mesh, mesh_fn in zip(meshes, created):
+        if "normalIds" in mesh:
+            _set_face_vertex_normals(mesh_fn, mesh)
 
     return container
 
 
-def serialize_nurbs_surface(surface_name: str) -> str:
-    """Serialize a NURBS surface to a string"""
+def _set_face_vertex_normals(mesh_fn: om.MFnMesh, mesh: dict[str, object]) -> None:
+    """Restore the normals stored by ``serialize_mesh_data(face_vertex_normals=True)``."""
+    counts = mesh["vertexCounts"]
+    normals = geometry_codec.group(mesh["normals"])
+    face_ids = [face for face, count in enumerate(counts) for _ in range(count)]
+    vectors = om.MVectorArray([normals[i] for i in mesh["normalIds"]])
+    mesh_fn.setFaceVertexNormals(vectors, om.MIntArray(face_ids), om.MIntArray(mesh["vertexConnects"]))
+
+
+def deserialize_mesh_shape(mesh_name: str, serialized_data: str) -> str:
+    """Deserialize a mesh shape from a string
+
+    Both the ``geometry_codec`` container and the legacy ``repr`` strings
+    are accepted.
+    """
+
+    if not isinstance(mesh_name, (str, unicode)):
+        raise TypeError("surface_name must be a string but got {0}".format(type(mesh_name)))
+
+    deserializedData = geometry_codec.decode(serialized_data)
+    if deserializedData.get("controlVertices") or "cvPositions" in deserializedData:
+        return _create_nurbs_surface(mesh_name, deserializedData)
+
+    return _create_mesh_shape(mesh_name, deserializedData)
+
+
+# Maya's formU / formV attribute values indexed into MFnNurbsSurface forms.
+_SURFACE_FORMS = (om.MFnNurbsSurface.kOpen, om.MFnNurbsSurface.kClosed, om.MFnNurbsSurface.kPeriodic)
+
+
+def serialize_nurbs_surface_data(surface: om.MFnNurbsSurface) -> dict[str, object]:
+    """Return the packed control vertices, knots, degrees and forms of a surface.
+
+    Everything is read with the bulk ``MFnNurbsSurface`` getters, so the
+    data can be rebuilt with ``MFnNurbsSurface.create`` whatever the degree
+    and form combination. Control vertices are stored as x, y, z, w in the
+    function set's order, periodic overlaps included.
+
+    Arguments:
+        surface (om.MFnNurbsSurface): The surface function set.
+
+    Returns:
+        dict: ``geometry_codec`` ready data of the surface.
+    """
+    cvs = surface.cvPositions(om.MSpace.kObject)
+
+    return {
+        "cvPositions": geometry_codec.PackedArray("d", [v for cv in cvs for v in (cv.x, cv.y, cv.z, cv.w)]),
+        "knotsU": geometry_codec.PackedArray("d", surface.knotsInU()),
+        "knotsV": geometry_codec.PackedArray("d", surface.knotsInV()),
+        "degreeU": surface.degreeInU,
+        "degreeV": surface.degreeInV,
+        "patchU": surface.numSpansInU,
+        "patchV": surface.numSpansInV,
+        "formU": _SURFACE_FORMS.index(surface.formInU),
+        "formV": _SURFACE_FORMS.index(surface.formInV),
+    }
+
+
+def serialize_nurbs_surface(surface_name: str, compression: str = "zlib") -> str:
+    """Serialize a NURBS surface to a string
+
+    The result is a ``geometry_codec`` container with float64 control
+    vertex positions and knots, see :mod:`ymt_shifter_utility.geometry_codec`
+    and :func:`serialize_nurbs_surface_data`.
+    """
 
     if not isinstance(surface_name, (str, unicode)):
         raise TypeError("surface_name must be a string")
 
     for shape in cmds.listRelatives(surface_name, shapes=True, fullPath=True) or []:
         if cmds.objectType(shape) == "mesh":
-            return serialize_mesh_shape(surface_name)
-
-    # if has make history, then freeze history
-    if __has_make_nurbs_surface_hostory(surface_name):
-        temp_surface = cmds.duplicate(surface_name, name="temp_surface")[0]
-        cmds.delete(temp_surface, constructionHistory=True)
-        surface_name = temp_surface
-    else:
-        temp_surface = None
-
-    # Get the control vertices of the NURBS surface
-    control_vertices_names = cmds.ls("{0}.cv[*][*]".format(surface_name), flatten=True)
-    control_vertices = {}
-
-    for path in control_vertices_names:
-        cv = path.split(".")[-1]
-        control_vertices[cv] = cmds.getAttr(path)[0]
+            return serialize_mesh_shape(surface_name, compression)
 
-    # Get other relevant attributes
-    degreeU = cmds.getAttr("{0}.degreeU".format(surface_name))
-    degreeV = cmds.getAttr("{0}.degreeV".format(surface_name))
-    patchU = cmds.getAttr("{0}.spansU".format(surface_name))
-    patchV = cmds.getAttr("{0}.spansV".format(surface_name))
-    formU = cmds.getAttr("{0}.formU".format(surface_name))
-    formV = cmds.getAttr("{0}.formV".format(surface_name))
+    # The function set reads the evaluated shape, history or not.
+    shapes = cmds.listRelatives(surface_name, shapes=True, noIntermediate=True, fullPath=True, type="nurbsSurface")
+    if not shapes:
+        raise ValueError("{0} has no nurbsSurface shape".format(surface_name))
 
-    # Create a dictionary to hold the serialized data
-    serialized_data = {
-        "controlVertices": control_vertices,
-        "degreeU": degreeU,
-        "degreeV": degreeV,
-        "patchU": patchU,
-        "patchV": patchV,
-        "formU": formU,
-        "formV": formV,
+    serialized_data = serialize_nurbs_surface_data(getAsMFnNode(shapes[0], om.MFnNurbsSurface))
+    serialized_data.update({
         "localRotatePivot": cmds.xform(surface_name, q=True, os=True, rp=True),
         "localScalePivot": cmds.xform(surface_name, q=True, os=True, sp=True),
         "rotate": cmds.xform(surface_name, q=True, os=True, ro=True),
         "scale": cmds.xform(surface_name, q=True, os=True, s=True),
         "translate": cmds.xform(surface_name, q=True, os=True, t=True)
-    }
+    })
 
-    # Convert the dictionary to a string
-    serialized_text = str(serialized_data)
+    return geometry_codec.encode(serialized_data, compression)
 
-    if temp_surface:
-        cmds.delete(temp_surface)
 
-    return serialized_text
+SURFACE_HASH_ATTR = "slidingSurfaceHash"
 
+# surface shape full path -> (shape handle, content hash) of the last refresh
+_sliding_surface_hashes: dict[str, tuple[om.MObjectHandle, str]] = {}
 
-def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
-    """Deserialize a NURBS surface from a string"""
 
-    if not isinstance(surface_name, (str, unicode)):
-        raise TypeError("surface_name must be a string but got {0}".format(type(surface_name)))
+def surface_content_hash(surface_name: str) -> str:
+    """Return a hash of the serialized shape and transform of a surface."""
+    serialized = serialize_nurbs_surface(surface_name, compression="none")
+    return hashlib.sha1(serialized.encode("ascii")).hexdigest()
+
+
+def _nurbs_surface_shape(surface_name: str) -> om.MDagPath:
+    shapes = cmds.listRelatives(surface_name, shapes=True, noIntermediate=True, fullPath=True, type="nurbsSurface")
+    if not shapes:
+        raise ValueError("{0} has no nurbsSurface shape".format(surface_name))
+    return om.MGlobal.getSelectionListByName(shapes[0]).getDagPath(0)
+
+
+def _stored_surface_hashes(shape: om.MDagPath, root: str, attr: str) -> set[str]:
+    res = set()
+    root_attr = "{0}.{1}".format(root, attr)
+    if cmds.objExists(root_attr):
+        res.add(cmds.getAttr(root_attr))
+
+    cached = _sliding_surface_hashes.get(shape.fullPathName())
+    if cached is not None:
+        handle, digest = cached
+        if handle.isValid() and handle.isAlive() and handle.object() == shape.node():
+            res.add(digest)
+    return res
+
+
+def _bake_surface_cvs(shape: om.MDagPath) -> None:
+    """Write the evaluated control vertices back into the shape, dropping its input."""
+    fn = om.MFnNurbsSurface(shape)
+    cvs = fn.cvPositions(om.MSpace.kObject)
+
+    create = fn.findPlug("create", False)
+    source = create.source()
+    if not source.isNull:
+        cmds.disconnectAttr(source.name(), "{0}.create".format(shape.fullPathName()))
+
+    fn.setCVPositions(cvs, om.MSpace.kObject)
+    fn.updateSurface()
 
-    deserializedData = eval(serialized_data)
-    if deserializedData.get("meshes"):
-        return deserialize_mesh_shape(surface_name, serialized_data)
 
+def refresh_sliding_surface(surface_name: str, root: str, attr: str = SURFACE_HASH_ATTR) -> str:
+    """Make a guide's sliding surface history free, in place.
+
+    Guides used to serialize the surface, delete it and deserialize it again
+    on every ``setFromHierarchy``. Now the content hash of the surface is
+    compared with the one saved on the guide root by
+    :func:`store_sliding_surface_hash` and the one remembered from the last
+    refresh in this session; when either matches nothing is done. Otherwise
+    the evaluated control vertices are written back through
+    ``MFnNurbsSurface.setCVPositions`` and the shape's input is disconnected,
+    which leaves the control vertices the rebuilt surface had.
+
+    Nothing is written to the guide root.
+
+    Arguments:
+        surface_name (str): The sliding surface.
+        root (str): The guide root the hash is saved on.
+        attr (str): Name of the string attribute holding the hash.
+
+    Returns:
+        str: The surface name.
+    """
+    shape = _nurbs_surface_shape(surface_name)
+    digest = surface_content_hash(surface_name)
+    if digest not in _stored_surface_hashes(shape, root, attr):
+        _bake_surface_cvs(shape)
+        digest = surface_content_hash(surface_name)
+
+    _sliding_surface_hashes[shape.fullPathName()] = (om.MObjectHandle(shape.node()), digest)
+    return surface_name
+
+
+def store_sliding_surface_hash(surface_name: str, root: str, attr: str = SURFACE_HASH_ATTR) -> None:
+    """Save the content hash of a guide's sliding surface on the guide root.
+
+    Called when the guide is saved, so the next :func:`refresh_sliding_surface`
+    of the same surface, in this or a later session, is skipped.
+
+    Arguments:
+        surface_name (str): The sliding surface.
+        root (str): The guide root to store the hash on.
+        attr (str): Name of the string attribute holding the hash.
+    """
+    root_attr = "{0}.{1}".format(root, attr)
+    if not cmds.objExists(root_attr):
+        cmds.addAttr(root, longName=attr, dataType="string")
+    cmds.setAttr(root_attr, surface_content_hash(surface_name), type="string")
+
+
+def _create_nurbs_surface(surface_name: str, deserializedData: dict[str, object]) -> str:
+
+    if "cvPositions" in deserializedData:
+        return _create_nurbs_surface_from_data(surface_name, deserializedData)
+
+    # Older data only has control vertex positions, rebuild them on a
+    # placeholder surface.
     # Retrieve the necessary information from the deserialized data
     control_vertices = deserializedData["controlVertices"]
     degreeU = deserializedData["degreeU"]
@@ -1336,6 +1535,59 @@ def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
     return new_surface
 
 
+def _create_nurbs_surface_from_data(surface_name: str, deserializedData: dict[str, object]) -> str:
+    """Create a surface from :func:`serialize_nurbs_surface_data` output with one ``MFnNurbsSurface.create``."""
+
+    positions = deserializedData["cvPositions"]
+    cvs = om.MPointArray([om.MPoint(*positions[i:i + 4]) for i in range(0, len(positions), 4)])
+    rational = any(positions[i] != 1.0 for i in range(3, len(positions), 4))
+
+    container = cmds.createNode("transform", name=surface_name)
+    cmds.xform(container, os=True, rp=deserializedData["localRotatePivot"])
+    cmds.xform(container, os=True, sp=deserializedData["localScalePivot"])
+    cmds.xform(container, os=True, ro=deserializedData["rotate"])
+    cmds.xform(container, os=True, s=deserializedData["scale"])
+    cmds.xform(container, os=True, t=deserializedData["translate"])
+
+    fn_container = getAsMFnNode(container, om.MFnTransform)
+    surface_fn = om.MFnNurbsSurface()
+    surface_fn.create(
+        cvs,
+        om.MDoubleArray(deserializedData["knotsU"]),
+        om.MDoubleArray(deserializedData["knotsV"]),
+        deserializedData["degreeU"],
+        deserializedData["degreeV"],
+        _SURFACE_FORMS[deserializedData["formU"]],
+        _SURFACE_FORMS[deserializedData["formV"]],
+        rational,
+        parent=fn_container.object()
+    )
+
+    # match the shape name and shading of cmds.nurbsPlane
+    shape = cmds.listRelatives(container, shapes=True, fullPath=True)[0]
+    shape = cmds.rename(shape, "{0}Shape".format(container.split("|")[-1]))
+    cmds.sets(shape, edit=True, forceElement="initialShadingGroup")
+
+    return container
+
+
+def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
+    """Deserialize a NURBS surface from a string
+
+    Both the ``geometry_codec`` container and the legacy ``repr`` strings
+    are accepted.
+    """
+
+    if not isinstance(surface_name, (str, unicode)):
+        raise TypeError("surface_name must be a string but got {0}".format(type(surface_name)))
+
+    deserializedData = geometry_codec.decode(serialized_data)
+    if deserializedData.get("meshes"):
+        return _create_mesh_shape(surface_name, deserializedData)
+
+    return _create_nurbs_surface(surface_name, deserializedData)
+
+
 def create_rivet_pin(mesh_name: Text, position: Tuple[Text, Text, Text], name: Optional[Text] = None) -> Text:
     """Apply uvPin constrain to given world position"""
 
@@ -1511,7 +1763,11 @@ def apply_rivet_constrain_to_selected(mesh: Text, targets: List[Text]|Text) -> L
 
 
 def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -> list[str]:
-    """Apply parent constrain to given objects with weight from skinCluster"""
+    """Apply parent constrain to given objects with weight from skinCluster
+
+    The nearest vertices of all targets are resolved in one batch through the
+    cached vertex index, and the skin weights are read once for the mesh.
+    """
 
     if not isinstance(targets, list):
         targets = [targets]
@@ -1519,7 +1775,7 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
     if isinstance(mesh, nodetypes.Transform):
         mesh = mesh.name()
 
-    cns = []
+    target_names = []
     for target in targets:
         if isinstance(target, nodetypes.Transform):
             target = target.name()
@@ -1527,7 +1783,13 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
         if not cmds.objExists(target):
             raise Exception("target({}) {} not found".format(type(target), target))
 
-        weights = __get_skin_weights(mesh, target)
+        target_names.append(target)
+
+    positions = [cmds.xform(target, q=True, ws=True, t=True) for target in target_names]
+    target_weights = __get_skin_weights_of_positions(mesh, positions)
+
+    cns = []
+    for target, weights in zip(target_names, target_weights):
         if not weights:
             continue
 
@@ -1542,33 +1804,29 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
     return cns
 
 
-def __get_skin_weights(mesh_name: str, cns_name: str) -> Dict[str, float]:
+def __get_skin_weights_of_position(mesh_name: str, position: str) -> dict[str, float]:
 
-    # find closest vertex
-    mesh_path = om.MGlobal.getSelectionListByName(mesh_name).getDagPath(0)
-    pos = cmds.xform(cns_name, q=True, ws=True, t=True)
+    return __get_skin_weights_of_positions(mesh_name, [position])[0]
 
-    return __get_skin_weights_of_position(mesh_name, pos)
 
+def __get_skin_weights_of_positions(mesh_name: str, positions: Sequence[Sequence[float]]) -> list[dict[str, float]]:
+    """Return the skin weights of the nearest vertex for every position."""
 
-def __get_skin_weights_of_position(mesh_name: str, position: str) -> dict[str, float]:
+    if not positions:
+        return []
 
-    # find closest vertex
+    # find closest vertices
     mesh_path = om.MGlobal.getSelectionListByName(mesh_name).getDagPath(0)
-    point = om.MPoint(position)
-
-    vertex, distance = get_nearest_vertex_on_point(mesh_path, point)
+    nearest = get_nearest_vertices_on_points(mesh_path, [om.MPoint(position) for position in positions])
     comp = om.MFnSingleIndexedComponent().create(om.MFn.kMeshVertComponent)
 
-    # get weights
+    # get weights once for the whole batch
     skin_cluster = cmds.listConnections(mesh_name + ".inMesh", type="skinCluster")[0]
     sel = om.MGlobal.getSelectionListByName(skin_cluster).getDependNode(0)
     skin_fn = oma.MFnSkinCluster(sel)
     weights, count = skin_fn.getWeights(mesh_path, comp)
 
-    w = weights[vertex * count:(vertex + 1) * count]
-    influences = get_influences(skin_fn, w)
-    return influences
+    return [get_influences(skin_fn, weights[vertex * count:(vertex + 1) * count]) for vertex, _ in nearest]
 
 
 def get_influences(skin_fn: oma.MFnSkinCluster, weights: list[float]) -> dict[str, float]:
@@ -1582,26 +1840,123 @@ def get_influences(skin_fn: oma.MFnSkinCluster, weights: list[float]) -> dict[st
     return res
 
 
-def get_nearest_vertex_on_point(mesh_fn: om.MFnMesh, pos1: om.MPoint) -> tuple[int, float]:
+class _CachedVertexIndex(object):
+    """Vertex index of one mesh, flagged dirty by a node dirty callback.
+
+    Deformation, tweaks and a new inMesh all dirty the shape, so the
+    callback catches point changes without reading the points back.
+    """
+
+    def __init__(self, shape: om.MObject, signature: tuple[object, ...], index: PointGridIndex) -> None:
+        self.handle = om.MObjectHandle(shape)
+        self.signature = signature
+        self.index = index
+        self.dirty = False
+        self.callback_id = om.MNodeMessage.addNodeDirtyCallback(shape, self._set_dirty)
+
+    def _set_dirty(self, *args: object) -> None:
+        self.dirty = True
+
+    def is_valid_for(self, shape: om.MObject, signature: tuple[object, ...]) -> bool:
+        # a mesh deleted and recreated at the same path is a different node
+        return (
+            not self.dirty
+            and self.handle.isValid()
+            and self.handle.isAlive()
+            and self.handle.object() == shape
+            and self.signature == signature
+        )
+
+    def remove_callback(self) -> None:
+        try:
+            om.MMessage.removeCallback(self.callback_id)
+        except RuntimeError:
+            pass
+
+
+# mesh full path -> cached vertex index
+_vertex_index_cache: dict[str, _CachedVertexIndex] = {}
+_vertex_index_scene_callbacks: list[int] = []
+
+
+def _watch_scene_for_vertex_index_cache() -> None:
+    """Clear the vertex index cache before a new scene is created or opened."""
+
+    if _vertex_index_scene_callbacks:
+        return
+    for message in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen):
+        _vertex_index_scene_callbacks.append(
+            om.MSceneMessage.addCallback(message, lambda *args: clear_vertex_index_cache())
+        )
+
+
+def _as_mesh_dagpath(mesh: Text | om.MDagPath | om.MFnMesh) -> om.MDagPath:
+    if isinstance(mesh, om.MDagPath):
+        return mesh
+    if isinstance(mesh, om.MFnMesh):
+        return mesh.getPath()
+    return om.MGlobal.getSelectionListByName(mesh).getDagPath(0)
+
+
+def get_vertex_index(mesh: Text | om.MDagPath | om.MFnMesh, refresh: bool = False) -> PointGridIndex:
+    """Return a cached spatial index over the world-space vertices of a mesh.
 
-    it_vertex = om.MItMeshVertex(mesh_fn)
+    A cache hit only checks that the shape is the same live node and compares
+    the topology counts and the world matrix; point edits are caught by a
+    dirty callback on the shape. The index is rebuilt when any of those
+    changed, or always with refresh, and the cache is cleared before a new
+    scene is created or opened.
+
+    Arguments:
+        mesh (str, MDagPath or MFnMesh): The mesh.
+        refresh (bool): Rebuild the index even if the cache looks valid.
+
+    Returns:
+        PointGridIndex: The index, vertex ids as point ids.
+    """
 
-    min_distance = float("inf")
-    nearest_vertex = -1
+    mesh_path = _as_mesh_dagpath(mesh)
+    mesh_fn = om.MFnMesh(mesh_path)
+    matrix = mesh_path.inclusiveMatrix()
+    signature = (mesh_fn.numVertices, mesh_fn.numEdges, mesh_fn.numPolygons, tuple(matrix[i] for i in range(16)))
 
-    while not it_vertex.isDone():
-        vertex_pos = it_vertex.position(om.MSpace.kWorld)
-        distance = (vertex_pos - pos1).length()
-        if distance < min_distance:
-            min_distance = distance
-            nearest_vertex = it_vertex.index()
-        it_vertex.next()
+    key = mesh_path.fullPathName()
+    cached = _vertex_index_cache.get(key)
+    shape = mesh_fn.object()
+    if cached is not None:
+        if not refresh and cached.is_valid_for(shape, signature):
+            return cached.index
+        cached.remove_callback()
 
-    if nearest_vertex == -1:
+    points = [(p.x, p.y, p.z) for p in mesh_fn.getPoints(om.MSpace.kWorld)]
+    index = PointGridIndex(points)
+    _watch_scene_for_vertex_index_cache()
+    _vertex_index_cache[key] = _CachedVertexIndex(shape, signature, index)
+    return index
+
+
+def clear_vertex_index_cache() -> None:
+    """Drop every cached mesh vertex index."""
+
+    for cached in _vertex_index_cache.values():
+        cached.remove_callback()
+    _vertex_index_cache.clear()
+
+
+def get_nearest_vertices_on_points(mesh: Text | om.MDagPath | om.MFnMesh, points: Sequence[om.MPoint]) -> list[tuple[int, float]]:
+    """Return ``(vertex index, distance)`` of the nearest vertex for every point."""
+
+    index = get_vertex_index(mesh)
+    if not len(index):
         om.MGlobal.displayError("Vertex not found")
         raise ValueError("Vertex not found")
 
-    return nearest_vertex, min_distance
+    return index.nearest_many(points)
+
+
+def get_nearest_vertex_on_point(mesh_fn: om.MFnMesh, pos1: om.MPoint) -> tuple[int, float]:
+
+    return get_nearest_vertices_on_points(mesh_fn, [pos1])[0]
 
 
 def create_dummy_edges_from_positions(positions: List[Tuple[float, float, float]]) -> Tuple[List[Text], om.MFnMesh]:
@@ -4,6 +4,7 @@ from __future__ import annotations
 #############################################
 # GLOBAL
 #############################################
+import bisect
 import math
 import six
 import sys
@@ -24,6 +25,7 @@ import maya.OpenMaya as om
 import maya.api.OpenMaya as om2
 
 from mgear.core import applyop
+from ymt_shifter_utility.spatial_index import PointGridIndex
 from ymt_shifter_utility.type_protocols import DagNodeLike, MatrixLike, PymelNode, VectorLike, WorldPoint
 from mgear.core.transform import (
     getTransform,
@@ -444,17 +446,22 @@ def getCurveParamAtPosition(crv: PymelNode, position: Sequence[float]) -> tuple[
     return param, length
 
 
-def getCurveParamByRatio(crv: PymelNode, ratio: float) -> tuple[float, float]:
+def getCurveParamByRatio(crv: PymelNode, ratio: float, arc_table: ArcLengthTable | None = None) -> tuple[float, float]:
     """Get curve parameter from a ratio
 
     Arguments:
         crv (curve): The  source curve to get the parameter.
         ratio (float): Ratio on the curve
+        arc_table (ArcLengthTable): Optional prebuilt table of ``crv``.
 
     Returns:
         list: paramenter and curve length
     """
 
+    if arc_table is not None:
+        param = (arc_table.param_end - arc_table.param_start) * ratio + arc_table.param_start
+        return param, arc_table.total_length
+
     sc = getMFnNurbsCurve(crv.name())
     length = sc.length()
     paramStart = sc.findParamFromLength(0.0)
@@ -473,29 +480,177 @@ def getCurveLength(crv: str|dt.Transform|om2.MObject|om2.MDagPath|om2.MFnNurbsCu
     return crv.length()
 
 
-def getPositionByRatio(crv: PymelNode, ratio: float) -> object:
+def getPositionByRatio(crv: PymelNode, ratio: float, arc_table: ArcLengthTable | None = None) -> object:
     """Get position on curve from a ratio
 
     Arguments:
         crv (curve): The  source curve to get the parameter.
         ratio (float): Ratio on the curve
+        arc_table (ArcLengthTable): Optional prebuilt table of ``crv``.
 
     Returns:
         float: position
     """
-    param, length = getCurveParamByRatio(crv, ratio)
+    param, length = getCurveParamByRatio(crv, ratio, arc_table)
     point = crv.getShape().getPointAtParam(param, space='world')
     return point
 
 
-def findLenghtFromParam(crv: PymelNode, param: float, close: bool = False) -> float:
+# 5-point Gauss-Legendre abscissae and weights on [-1, 1].
+_GAUSS_LEGENDRE_5 = (
+    (0.0, 0.5688888888888889),
+    (-0.5384693101056831, 0.4786286704993665),
+    (0.5384693101056831, 0.4786286704993665),
+    (-0.9061798459386640, 0.2369268850561891),
+    (0.9061798459386640, 0.2369268850561891),
+)
+
+
+class ArcLengthTable(object):
+    """Reusable param <-> length <-> ratio table of a NURBS curve.
+
+    The table is built once per curve by adaptive Gauss-Legendre integration
+    of the curve speed over every knot span. Queries then bisect the sorted
+    breakpoints in O(log n); length to param queries finish with a few Newton
+    steps on the curve speed. Build a new table after the curve changes.
+
+    Arguments:
+        crv (curve): Curve name, node, MObject, MDagPath or MFnNurbsCurve.
+        space (om2.MSpace): Space lengths are measured in. ``kObject`` matches
+            ``MFnNurbsCurve.length`` / ``findParamFromLength``.
+        tolerance (float): Absolute length tolerance per integrated interval.
+        max_depth (int): Maximum adaptive subdivision depth per knot span.
+    """
+
+    def __init__(
+        self,
+        crv: str | PymelNode | om2.MObject | om2.MDagPath | om2.MFnNurbsCurve,
+        space: int = om2.MSpace.kObject,
+        tolerance: float = 1e-6,
+        max_depth: int = 12,
+    ) -> None:
+        if isinstance(crv, om2.MFnNurbsCurve):
+            self._fn = crv
+        elif isinstance(crv, (om2.MObject, om2.MDagPath)):
+            self._fn = om2.MFnNurbsCurve(crv)
+        else:
+            self._fn = getMFnNurbsCurve(crv)
+        self._fn.updateCurve()
+        self.space = space
+        self.tolerance = tolerance
+
+        self.param_start, self.param_end = (float(v) for v in self._fn.knotDomain)
+        breaks = sorted(set(
+            float(k) for k in self._fn.knots()
+            if self.param_start < float(k) < self.param_end
+        ))
+        spans = [self.param_start] + breaks + [self.param_end]
+
+        self.params = [self.param_start]
+        self.lengths = [0.0]
+        for a, b in zip(spans[:-1], spans[1:]):
+            if b > a:
+                self._integrate_adaptive(a, b, self._gauss_legendre(a, b), max_depth)
+
+        self.total_length = self.lengths[-1]
+
+    def _speed(self, param: float) -> float:
+        return self._fn.getDerivativesAtParam(param, self.space)[1].length()
+
+    def _gauss_legendre(self, a: float, b: float) -> float:
+        half = (b - a) * 0.5
+        mid = (a + b) * 0.5
+        return half * sum(w * self._speed(mid + half * x) for x, w in _GAUSS_LEGENDRE_5)
+
+    def _integrate_adaptive(self, a: float, b: float, whole: float, depth: int) -> None:
+        mid = (a + b) * 0.5
+        left = self._gauss_legendre(a, mid)
+        right = self._gauss_legendre(mid, b)
+        if depth <= 0 or abs(left + right - whole) <= self.tolerance:
+            self.params.append(mid)
+            self.lengths.append(self.lengths[-1] + left)
+            self.params.append(b)
+            self.lengths.append(self.lengths[-1] + right)
+            return
+
+        self._integrate_adaptive(a, mid, left, depth - 1)
+        self._integrate_adaptive(mid, b, right, depth - 1)
+
+    def length_at_param(self, param: float) -> float:
+        """Return the arc length from the curve start to ``param``."""
+        if param <= self.param_start:
+            return 0.0
+        if param >= self.param_end:
+            return self.total_length
+
+        index = bisect.bisect_right(self.params, param) - 1
+        return self.lengths[index] + self._gauss_legendre(self.params[index], param)
+
+    def param_at_length(self, length: float) -> float:
+        """Return the curve parameter at arc ``length`` from the start."""
+        if length <= 0.0:
+            return self.param_start
+        if length >= self.total_length:
+            return self.param_end
+
+        index = bisect.bisect_right(self.lengths, length) - 1
+        index = min(index, len(self.params) - 2)
+        low = self.params[index]
+        high = self.params[index + 1]
+        low_length = self.lengths[index]
+        segment = self.lengths[index + 1] - low_length
+        if segment <= 0.0:
+            return low
+
+        param = low + (high - low) * (length - low_length) / segment
+        for _ in range(8):
+            error = low_length + self._gauss_legendre(low, param) - length
+            if abs(error) <= self.tolerance:
+                break
+            speed = self._speed(param)
+            if speed <= 0.0:
+                break
+            param = min(max(param - error / speed, low), high)
+
+        return param
+
+    def ratio_at_param(self, param: float) -> float:
+        """Return the arc length ratio ``[0, 1]`` at ``param``."""
+        if self.total_length <= 0.0:
+            return 0.0
+        return self.length_at_param(param) / self.total_length
+
+    def param_at_ratio(self, ratio: float) -> float:
+        """Return the curve parameter at arc length ``ratio`` ``[0, 1]``."""
+        return self.param_at_length(self.total_length * ratio)
+
+    def length_at_ratio(self, ratio: float) -> float:
+        return self.total_length * ratio
+
+    def ratio_at_length(self, length: float) -> float:
+        if self.total_length <= 0.0:
+            return 0.0
+        return length / self.total_length
+
+
+def findLenghtFromParam(crv: PymelNode, param: float, close: bool = False, arc_table: ArcLengthTable | None = None) -> float:
     """
     Find lengtht from a curve parameter
 
+    Open curves are measured in world space, like the ``arcLengthDimension``
+    node this function used to create, but without touching the DG. Closed
+    curves are measured in object space by ``MFnNurbsCurve``.
+
     Arguments:
         crv (curve): The source curve.
         param (float): The parameter to get the legth
         close (bool): If the curve is close or not.
+        arc_table (ArcLengthTable): Optional prebuilt table of ``crv``, built
+            with ``space=om2.MSpace.kWorld`` for open curves and the default
+            ``kObject`` for closed ones.
+
+    Raises:
+        ValueError: If arc_table was built in the other space.
 
     Returns:
         float: Curve uLength
@@ -509,19 +664,20 @@ def findLenghtFromParam(crv: PymelNode, param: float, close: bool = False) -> fl
 
     """
 
+    if arc_table is not None:
+        space = om2.MSpace.kObject if close else om2.MSpace.kWorld
+        if arc_table.space != space:
+            raise ValueError(
+                "findLenghtFromParam measures {} curves in {} space, the arc table is not.".format(
+                    "closed" if close else "open", "object" if close else "world"))
+        return arc_table.length_at_param(param)
+
     if close:
         sc = getMFnNurbsCurve(crv.name())
         return sc.findLengthFromParam(param)
     else:
-        node = pm.createNode("arcLengthDimension")
-        pm.connectAttr(
-            crv.getShape().attr("worldSpace[0]"),
-            node.attr("nurbsGeometry")
-        )
-        node.attr("uParamValue").set(param)
-        uLength = node.attr("arcLength").get()
-        pm.delete(node.getParent())
-        return uLength
+        table = ArcLengthTable(crv.name(), space=om2.MSpace.kWorld)
+        return table.length_at_param(param)
 
 
 # ========================================
@@ -1090,7 +1246,12 @@ def applyPathCnsLocal(target: dt.Transform, curve: dt.Transform, u: float, maint
     return cns
 
 
-def applyPathConstrainLocal(target: PymelNode | str, src_curve: PymelNode | str, maintainOffset: bool = True) -> None:
+def applyPathConstrainLocal(
+    target: PymelNode | str,
+    src_curve: PymelNode | str,
+    maintainOffset: bool = True,
+    arc_table: ArcLengthTable | None = None,
+) -> None:
 
     if isinstance(target, six.string_types) or isinstance(target, six.text_type):
         target = pm.PyNode(target)
@@ -1103,7 +1264,7 @@ def applyPathConstrainLocal(target: PymelNode | str, src_curve: PymelNode | str,
         m = om2.MMatrix(ma * mb.inverse())
         pos = dt.Vector(m[12], m[13], m[14])
         param, length = getCurveParamAtPosition(src_curve, pos)
-        u_length = findLenghtFromParam(src_curve, param)
+        u_length = findLenghtFromParam(src_curve, param, arc_table=arc_table)
         u_param = u_length / length
 
         cns = applyPathCnsLocal(target, src_curve, u_param, maintainOffset)
@@ -1115,97 +1276,155 @@ def applyPathConstrainLocal(target: PymelNode | str, src_curve: PymelNode | str,
     return cns
 
 
-def applyRopeCnsLocal(target: PymelNode, ctl_curve: PymelNode, rope: str, cv: Sequence[float]) -> None:
+def getEditPoints(crv: str | PymelNode | om2.MFnNurbsCurve, space: int = om2.MSpace.kObject) -> list[om2.MPoint]:
+    """Return the edit points of a curve read in one pass through MFnNurbsCurve.
 
-    def _searchNearestEditPoint(curve: str, cv: Sequence[float]) -> int:
+    The points are evaluated at the span boundary knots, so they match the
+    ``.editPoints[i]`` plugs (object space) without a getAttr per span.
 
-        candidate = math.inf
-        index = 0
-        numberOfSpans = cmds.getAttr(curve + ".spans")
+    Arguments:
+        crv (str or PyNode or MFnNurbsCurve): The curve transform or shape.
+        space (om2.MSpace): Space to evaluate the points in.
 
-        for i in range(numberOfSpans):
-            point = cmds.getAttr(curve + ".editPoints["+str(i)+"]")[0]
-            dist = math.sqrt((point[0] - cv[0])**2 + (point[1] - cv[1])**2 + (point[2] - cv[2])**2)
-            if dist < candidate:
-                candidate = dist
-                index = i
+    Returns:
+        list of om2.MPoint: One point per span boundary.
+    """
+    if isinstance(crv, om2.MFnNurbsCurve):
+        curveFn = crv
+    else:
+        curveFn = getMFnNurbsCurve(crv)
 
-        return index
+    knots = curveFn.knots()
+    degree = curveFn.degree
+    numEditPoints = curveFn.numSpans
+    if curveFn.form == om2.MFnNurbsCurve.kOpen:
+        numEditPoints += 1
 
-    nearestIndex = _searchNearestEditPoint(rope, cv)
+    return [
+        curveFn.getPointAtParam(knots[degree - 1 + i], space)
+        for i in range(numEditPoints)
+    ]
 
-    nearestPointOnCurve = cmds.createNode("nearestPointOnCurve")
-    cmds.connectAttr(rope+ ".editPoints["+str(nearestIndex)+"]", nearestPointOnCurve + ".inPosition")
-    cmds.connectAttr(rope + ".local", nearestPointOnCurve + ".inputCurve")
 
-    motionPath = cmds.createNode("motionPath")
-    cmds.connectAttr(nearestPointOnCurve + ".parameter", motionPath + ".uValue")
-    cmds.connectAttr(rope + ".local", motionPath + ".geometryPath")
+def searchNearestEditPoints(crv: str | PymelNode, positions: Sequence[Sequence[float]]) -> list[int]:
+    """Return the index of the nearest edit point for every position.
 
-    cmds.setAttr(motionPath + ".fractionMode", 0)
-    cmds.setAttr(motionPath + ".frontAxis", 0)
-    cmds.setAttr(motionPath + ".worldUpType", 2)
-    cmds.setAttr(motionPath + ".worldUpVector", 0, 1, 0)
-    cmds.connectAttr(ctl_curve.longName() + ".matrix", motionPath + ".worldUpMatrix")  # object rotation up
-    cmds.setAttr(motionPath + ".frontAxis", 0)
-    cmds.setAttr(motionPath + ".upAxis", 2)
+    Only the first ``spans`` edit points are candidates, which is the range the
+    rope constraints have always searched.
 
-    cmds.connectAttr(nearestPointOnCurve + ".position", target.longName() + ".translate")
-    cmds.connectAttr(motionPath + ".rotate", target.longName() + ".rotate")
+    Arguments:
+        crv (str or PyNode): The curve to search.
+        positions (list of float triples): Object space query positions.
 
+    Returns:
+        list of int: Edit point index per position.
+    """
+    curveFn = getMFnNurbsCurve(crv)
+    editPoints = getEditPoints(curveFn)[:curveFn.numSpans]
+    index = PointGridIndex([(p.x, p.y, p.z) for p in editPoints])
+    return [i for i, _ in index.nearest_many(positions)]
 
-def applyRopeCnsLocalWithUpv(target: dt.Transform, upv: dt.Transform, ctl_curve: dt.Transform, rope: dt.Transform, cv: om2.MPoint) -> None:
-    """Apply a rope constraint to a target object.
+
+def _createRopeNetworks(rope: str | PymelNode, cvs: Sequence[Sequence[float]]) -> list[tuple[str, str]]:
+    """Create the nearestPointOnCurve / motionPath pair for each cv on a rope."""
+
+    rope = str(rope)
+    nearestIndices = searchNearestEditPoints(rope, cvs)
+
+    networks = []
+    for nearestIndex in nearestIndices:
+        nearestPointOnCurve = cmds.createNode("nearestPointOnCurve")
+        cmds.connectAttr(rope + ".editPoints[" + str(nearestIndex) + "]", nearestPointOnCurve + ".inPosition")
+        cmds.connectAttr(rope + ".local", nearestPointOnCurve + ".inputCurve")
+
+        motionPath = cmds.createNode("motionPath")
+        cmds.connectAttr(nearestPointOnCurve + ".parameter", motionPath + ".uValue")
+        cmds.connectAttr(rope + ".local", motionPath + ".geometryPath")
+        cmds.setAttr(motionPath + ".fractionMode", 0)
+
+        networks.append((nearestPointOnCurve, motionPath))
+
+    return networks
+
+
+def applyRopeCnsLocalBatch(targets: Sequence[PymelNode], ctl_curve: PymelNode, rope: str | PymelNode, cvs: Sequence[Sequence[float]]) -> None:
+    """Apply rope constraints to many targets sharing the same rope.
+
+    The rope edit points are read once and the nearest edit point of every
+    cv is resolved together before the node networks are created.
 
     Arguments:
-        target (dt.Transform): The target object to constraint.
-        upv (dt.Transform): The up vector object.
-        ctl_curve (dt.Transform): The control curve object.
-        rope (dt.Transform): The rope object.
-        cv (dt.Vector): The control vertex position.
+        targets (list of PyNode): The target objects to constraint.
+        ctl_curve (PyNode): The control curve driving the up matrix.
+        rope (str or PyNode): The rope curve.
+        cvs (list of float triples): Object space position per target.
 
     Returns:
         None
     """
+    if len(targets) != len(cvs):
+        raise ValueError("targets and cvs must have the same length.")
 
-    def _searchNearestEditPoint(curve: str, cv: Sequence[float]) -> int:
+    upMatrix = ctl_curve.longName() + ".matrix"
+    for target, (nearestPointOnCurve, motionPath) in zip(targets, _createRopeNetworks(rope, cvs)):
+        cmds.setAttr(motionPath + ".frontAxis", 0)
+        cmds.setAttr(motionPath + ".worldUpType", 2)
+        cmds.setAttr(motionPath + ".worldUpVector", 0, 1, 0)
+        cmds.connectAttr(upMatrix, motionPath + ".worldUpMatrix")  # object rotation up
+        cmds.setAttr(motionPath + ".upAxis", 2)
 
-        candidate = math.inf
-        index = 0
-        numberOfSpans = cmds.getAttr(curve + ".spans")
+        cmds.connectAttr(nearestPointOnCurve + ".position", target.longName() + ".translate")
+        cmds.connectAttr(motionPath + ".rotate", target.longName() + ".rotate")
 
-        for i in range(numberOfSpans):
-            point = cmds.getAttr(curve + ".editPoints["+str(i)+"]")[0]
-            dist = math.sqrt((point[0] - cv[0])**2 + (point[1] - cv[1])**2 + (point[2] - cv[2])**2)
-            if dist < candidate:
-                candidate = dist
-                index = i
 
-        return index
+def applyRopeCnsLocal(target: PymelNode, ctl_curve: PymelNode, rope: str, cv: Sequence[float]) -> None:
+    applyRopeCnsLocalBatch([target], ctl_curve, rope, [cv])
 
-    nearestIndex = _searchNearestEditPoint(rope, cv)
 
-    nearestPointOnCurve = cmds.createNode("nearestPointOnCurve")
-    cmds.connectAttr(rope+ ".editPoints["+str(nearestIndex)+"]", nearestPointOnCurve + ".inPosition")
-    cmds.connectAttr(rope + ".local", nearestPointOnCurve + ".inputCurve")
+def applyRopeCnsLocalWithUpvBatch(targets: Sequence[dt.Transform], upvs: Sequence[dt.Transform], ctl_curve: dt.Transform, rope: dt.Transform, cvs: Sequence[Sequence[float]]) -> None:
+    """Apply rope constraints with up vector objects to many targets.
 
-    motionPath = cmds.createNode("motionPath")
-    cmds.connectAttr(nearestPointOnCurve + ".parameter", motionPath + ".uValue")
-    cmds.connectAttr(rope + ".local", motionPath + ".geometryPath")
+    Arguments:
+        targets (list of dt.Transform): The target objects to constraint.
+        upvs (list of dt.Transform): The up vector object per target.
+        ctl_curve (dt.Transform): The control curve object.
+        rope (dt.Transform): The rope object.
+        cvs (list of dt.Vector): The control vertex position per target.
 
-    cmds.setAttr(motionPath + ".fractionMode", 0)
+    Returns:
+        None
+    """
+    if not (len(targets) == len(upvs) == len(cvs)):
+        raise ValueError("targets, upvs and cvs must have the same length.")
+
+    for target, upv, (nearestPointOnCurve, _) in zip(targets, upvs, _createRopeNetworks(rope, cvs)):
+        cmds.connectAttr(nearestPointOnCurve + ".position", target.longName() + ".translate")
+        cmds.aimConstraint(
+            upv.longName(),
+            target.longName(),
+            maintainOffset=False,
+            aimVector=(0, 0, 1),
+            upVector=(1, 0, 0),
+            worldUpType="objectrotation",
+            worldUpObject=upv.longName(),
+            worldUpVector=(1, 0, 0)
+        )
 
-    cmds.connectAttr(nearestPointOnCurve + ".position", target.longName() + ".translate")
-    _cns = cmds.aimConstraint(
-        upv.longName(),
-        target.longName(),
-        maintainOffset=False,
-        aimVector=(0, 0, 1),
-        upVector=(1, 0, 0),
-        worldUpType="objectrotation",
-        worldUpObject=upv.longName(),
-        worldUpVector=(1, 0, 0)
-    )
+
+def applyRopeCnsLocalWithUpv(target: dt.Transform, upv: dt.Transform, ctl_curve: dt.Transform, rope: dt.Transform, cv: om2.MPoint) -> None:
+    """Apply a rope constraint to a target object.
+
+    Arguments:
+        target (dt.Transform): The target object to constraint.
+        upv (dt.Transform): The up vector object.
+        ctl_curve (dt.Transform): The control curve object.
+        rope (dt.Transform): The rope object.
+        cv (dt.Vector): The control vertex position.
+
+    Returns:
+        None
+    """
+    applyRopeCnsLocalWithUpvBatch([target], [upv], ctl_curve, rope, [cv])
 
 
 def curvecns_op(crv: str, inputs: Sequence[str] = ()) -> str:
@@ -1455,18 +1674,22 @@ def applyCurveParamCns(src: dt.Transform, target: dt.Transform) -> None:
         cmds.connectAttr(pointOnCurveInfo + ".position", target + ".controlPoints[%s]" % i, force=True)
 
 
-def getCvParamRatio(crv: str) -> list[float]:
+def getCvParamRatio(crv: str, arc_table: ArcLengthTable | None = None) -> list[float]:
     """Return the ratio of each control point in a curve"""
 
     sc = getMFnNurbsCurve(crv)
     sc.updateCurve()
 
-    length = sc.length()
-    paramStart = sc.findParamFromLength(0.0)
-    try:
-        paramEnd = sc.findParamFromLength(length)
-    except RuntimeError:
-        paramEnd = sc.findParamFromLength(length - 0.001)
+    if arc_table is not None:
+        paramStart = arc_table.param_start
+        paramEnd = arc_table.param_end
+    else:
+        length = sc.length()
+        paramStart = sc.findParamFromLength(0.0)
+        try:
+            paramEnd = sc.findParamFromLength(length)
+        except RuntimeError:
+            paramEnd = sc.findParamFromLength(length - 0.001)
 
     paramLength = paramEnd - paramStart
 
@@ -1480,26 +1703,24 @@ def getCvParamRatio(crv: str) -> list[float]:
     return ratios
 
 
-def getCvLengthRatio(crv: str) -> list[float]:
+def getCvLengthRatio(crv: str, arc_table: ArcLengthTable | None = None) -> list[float]:
     """Return the ratio of each control point in a curve"""
 
     sc = getMFnNurbsCurve(crv)
     sc.updateCurve()
 
-    totalLength = sc.length()
-    paramStart = sc.findParamFromLength(0.0)
-    try:
-        paramEnd = sc.findParamFromLength(totalLength)
-    except RuntimeError:
-        paramEnd = sc.findParamFromLength(totalLength - 0.001)
-
-    paramLength = paramEnd - paramStart
+    if arc_table is not None:
+        totalLength = arc_table.total_length
+        findLengthFromParam = arc_table.length_at_param
+    else:
+        totalLength = sc.length()
+        findLengthFromParam = sc.findLengthFromParam
 
     ratios = []
     for pos in sc.cvPositions():
         closest = sc.closestPoint(pos)[0]
         param = sc.getParamAtPoint(closest)
-        length = sc.findLengthFromParam(param)
+        length = findLengthFromParam(param)
         try:
             ratio = length / totalLength
         except ZeroDivisionError:
@@ -1509,22 +1730,22 @@ def getCvLengthRatio(crv: str) -> list[float]:
     return ratios
 
 
-def setCvParamRatio(crv: str, ratios: list[float]) -> None:
+def setCvParamRatio(crv: str, ratios: list[float], arc_table: ArcLengthTable | None = None) -> None:
     """Set the ratio of each control point in a curve"""
 
     sc = getMFnNurbsCurve(crv)
     sc.updateCurve()
 
-    length = sc.length()
-    paramStart = sc.findParamFromLength(0.0)
-    try:
-        paramEnd = sc.findParamFromLength(length)
-    except RuntimeError:
-        paramEnd = sc.findParamFromLength(length - 0.001)
+    if arc_table is not None:
+        length = arc_table.total_length
+        findParamFromLength = arc_table.param_at_length
+    else:
+        length = sc.length()
+        findParamFromLength = sc.findParamFromLength
 
     newPositions = []
     for ratio in ratios:
-        param = sc.findParamFromLength(ratio * length)
+        param = findParamFromLength(ratio * length)
         point = sc.getPointAtParam(param, space=om2.MSpace.kObject)
         newPositions.append(point)
 
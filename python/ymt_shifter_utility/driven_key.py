@@ -24,16 +24,38 @@ While Maya allows you to copy/paste driven‑keys between scenes via the
 GUI, there is no out‑of‑the‑box way to persist them in source control or
 apply them in an automated pipeline.  JSON is human‑readable, diffable
 and easy to patch, so we use it as the interchange format.
+
+Library files
+~~~~~~~~~~~~~
+Full face libraries get large, so files are written as a *chunked* JSON
+library by default: a fixed size header line, one compact JSON record per
+driven node and an index line (node name, byte offset, length) at the end.
+Export streams one node at a time, and import seeks straight to the nodes
+that exist in the current scene while a thread pool reads and decodes the
+next records.  The older single list‑of‑dicts JSON is still read.
+
+Incremental import
+~~~~~~~~~~~~~~~~~~
+With ``incremental=True`` each curve is hashed (:func:`curve_signature`)
+and compared with the animCurve already driving the same target from the
+same driver, so re‑importing a library only touches what changed.
+``dry_run=True`` reports the planned create / update / remove actions
+without editing the scene.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Optional, Sequence, Union
 
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import maya.cmds as cmds
 
 # -------------------------------------------------------------
@@ -76,43 +98,205 @@ def _iter_anim_curves(driven_node: str) -> Iterator[tuple[str, str]]:
             yield target_plug, anim
 
 
+# Tangent type names as used by ``cmds.keyTangent`` and stored in the JSON.
+_TANGENT_TYPE_NAMES = (
+    ("global", "kTangentGlobal"),
+    ("fixed", "kTangentFixed"),
+    ("linear", "kTangentLinear"),
+    ("flat", "kTangentFlat"),
+    ("spline", "kTangentSmooth"),
+    ("step", "kTangentStep"),
+    ("slow", "kTangentSlow"),
+    ("fast", "kTangentFast"),
+    ("clamped", "kTangentClamped"),
+    ("plateau", "kTangentPlateau"),
+    ("stepnext", "kTangentStepNext"),
+    ("auto", "kTangentAuto"),
+    ("automix", "kTangentAutoMix"),
+    ("autoease", "kTangentAutoEase"),
+    ("autocustom", "kTangentAutoCustom"),
+)
+_TANGENT_TYPES = {
+    name: getattr(oma.MFnAnimCurve, const)
+    for name, const in _TANGENT_TYPE_NAMES
+    if hasattr(oma.MFnAnimCurve, const)
+}
+_TANGENT_NAMES = {value: name for name, value in _TANGENT_TYPES.items()}
+
+_ANGULAR_OUTPUT = ("animCurveTA", "animCurveUA")
+_LINEAR_OUTPUT = ("animCurveTL", "animCurveUL")
+_TIME_OUTPUT = ("animCurveTT", "animCurveUT")
+
+
+def _anim_curve_fn(anim: str) -> oma.MFnAnimCurve:
+    sel = om.MSelectionList()
+    sel.add(anim)
+    return oma.MFnAnimCurve(sel.getDependNode(0))
+
+
+def _is_time_input(node_type: str) -> bool:
+    return node_type.startswith("animCurveT")
+
+
+def _value_to_ui(node_type: str, value: float) -> float:
+    """Convert an internal curve value to the UI units ``cmds.keyframe`` reports."""
+    if node_type in _ANGULAR_OUTPUT:
+        return om.MAngle(value).asUnits(om.MAngle.uiUnit())
+    if node_type in _LINEAR_OUTPUT:
+        return om.MDistance(value).asUnits(om.MDistance.uiUnit())
+    if node_type in _TIME_OUTPUT:
+        return om.MTime(value, om.MTime.kSeconds).asUnits(om.MTime.uiUnit())
+    return value
+
+
+def _value_from_ui(node_type: str, value: float) -> float:
+    if node_type in _ANGULAR_OUTPUT:
+        return om.MAngle(value, om.MAngle.uiUnit()).asRadians()
+    if node_type in _LINEAR_OUTPUT:
+        return om.MDistance(value, om.MDistance.uiUnit()).asCentimeters()
+    if node_type in _TIME_OUTPUT:
+        return om.MTime(value, om.MTime.uiUnit()).asUnits(om.MTime.kSeconds)
+    return value
+
+
+def _driver_plug(fn: oma.MFnAnimCurve) -> str:
+    """Return the plug feeding the curve input, looking through unitConversion nodes."""
+    plug = fn.findPlug("input", False)
+    source = plug.source()
+    while not source.isNull:
+        node = om.MFnDependencyNode(source.node())
+        if node.typeName != "unitConversion":
+            return source.partialName(includeNodeName=True, useLongNames=True)
+        source = node.findPlug("input", False).source()
+    return ""
+
+
 def _anim_curve_data(anim: str) -> dict[str, Any]:
-    """Return a full serialisable dump of *anim* curve (keys, tangents, etc.)."""
-    key_count = cmds.keyframe(anim, query=True, keyframeCount=True)
+    """Return a full serialisable dump of *anim* curve (keys, tangents, etc.).
+
+    Everything is read through one ``MFnAnimCurve``; values are stored in UI
+    units like ``cmds.keyframe`` reports them, tangent angles in degrees.
+    """
+    fn = _anim_curve_fn(anim)
+    key_count = fn.numKeys
     if not key_count:
         cmds.warning(f"AnimCurve '{anim}' has no keys.")
         return {}
 
-    # Maya returns values only when an index range is supplied for some curve types.
-    times = cmds.keyframe(anim, query=True, index=(0, key_count - 1), fc=True)
-    values = cmds.keyframe(anim, query=True, index=(0, key_count - 1), vc=True)
-    in_tan = cmds.keyTangent(anim, query=True, index=(0, key_count - 1), itt=True)
-    out_tan = cmds.keyTangent(anim, query=True, index=(0, key_count - 1), ott=True)
-
-    keys = [
-        {
-            "input": times[i],
-            "output": values[i],
-            "inTan": in_tan[i],
-            "outTan": out_tan[i],
-        }
-        for i in range(key_count)
-    ]
-
-    # The driver plug is the *source* connected to anim.input
-    driver = cmds.connectionInfo(f"{anim}.input", sfd=True)
+    node_type = fn.typeName
+    time_input = _is_time_input(node_type)
+    ui_time = om.MTime.uiUnit()
+
+    keys = []
+    for i in range(key_count):
+        in_angle, in_weight = fn.getTangentAngleWeight(i, True)
+        out_angle, out_weight = fn.getTangentAngleWeight(i, False)
+        keys.append({
+            "input": fn.input(i).asUnits(ui_time) if time_input else fn.unitlessInput(i),
+            "output": _value_to_ui(node_type, fn.value(i)),
+            "inTan": _TANGENT_NAMES.get(fn.inTangentType(i), "auto"),
+            "outTan": _TANGENT_NAMES.get(fn.outTangentType(i), "auto"),
+            "inAngle": in_angle.asDegrees(),
+            "inWeight": in_weight,
+            "outAngle": out_angle.asDegrees(),
+            "outWeight": out_weight,
+        })
 
     return {
-        "nodeType": cmds.nodeType(anim),
-        "name": anim,
-        "driver": driver,  # e.g. "pSphere1.rotateY"
+        "nodeType": node_type,
+        "name": fn.name(),
+        "driver": _driver_plug(fn),  # e.g. "pSphere1.rotateY"
         "keys": keys,
-        "preInfinity": cmds.getAttr(f"{anim}.preInfinity"),
-        "postInfinity": cmds.getAttr(f"{anim}.postInfinity"),
-        "weightedTangents": cmds.getAttr(f"{anim}.weightedTangents"),
+        "preInfinity": fn.preInfinityType,
+        "postInfinity": fn.postInfinityType,
+        "weightedTangents": fn.isWeighted,
     }
 
 
+def _add_keys(fn: oma.MFnAnimCurve, node_type: str, keys: Sequence[dict[str, Any]]) -> None:
+    """Add every key of *keys* to an empty curve in one ``addKeys`` call."""
+    ui_time = om.MTime.uiUnit()
+    values = [_value_from_ui(node_type, k["output"]) for k in keys]
+
+    if _is_time_input(node_type):
+        fn.addKeys([om.MTime(k["input"], ui_time) for k in keys], values)
+    else:
+        try:
+            fn.addKeys([float(k["input"]) for k in keys], values)
+        except TypeError:
+            # Older Maya releases only take MTime arrays in addKeys.
+            for k, value in zip(keys, values):
+                fn.addKey(float(k["input"]), value)
+
+
+def _apply_tangents(fn: oma.MFnAnimCurve, keys: Sequence[dict[str, Any]], weighted: bool) -> None:
+    """Restore tangent angles / weights, then the tangent types of every key."""
+    fn.setIsWeighted(bool(weighted))
+
+    for i, k in enumerate(keys):
+        for is_in, side in ((True, "in"), (False, "out")):
+            tangent = k.get(f"{side}Tan", "auto")
+            angle = k.get(f"{side}Angle")
+            if angle is None or not (weighted or tangent == "fixed"):
+                continue
+            fn.setTangent(i, om.MAngle(angle, om.MAngle.kDegrees), k.get(f"{side}Weight", 1.0), is_in)
+
+    for i, k in enumerate(keys):
+        in_type = _TANGENT_TYPES.get(k.get("inTan", "auto"))
+        out_type = _TANGENT_TYPES.get(k.get("outTan", "auto"))
+        if in_type is not None and in_type != _TANGENT_TYPES["fixed"]:
+            fn.setInTangentType(i, in_type)
+        if out_type is not None and out_type != _TANGENT_TYPES["fixed"]:
+            fn.setOutTangentType(i, out_type)
+
+
+def _connect_driven(anim: str, target: str) -> None:
+    """Connect *anim* to *target*, blending with an existing input like setDrivenKeyframe."""
+    source = cmds.connectionInfo(target, sourceFromDestination=True)
+    if not source:
+        cmds.connectAttr(f"{anim}.output", target)
+        return
+
+    source_node = source.split(".")[0]
+    if cmds.nodeType(source_node) == "blendWeighted":
+        blend = source_node
+    else:
+        blend = cmds.createNode("blendWeighted")
+        cmds.connectAttr(source, f"{blend}.input[0]")
+        cmds.connectAttr(f"{blend}.output", target, force=True)
+
+    indices = cmds.getAttr(f"{blend}.input", multiIndices=True) or []
+    index = max(indices) + 1 if indices else 0
+    cmds.connectAttr(f"{anim}.output", f"{blend}.input[{index}]")
+
+
+def _apply_namespace_map(plug: str, namespace_map: Optional[dict[str, str]]) -> str:
+    if not namespace_map:
+        return plug
+    out = plug
+    for old, new in namespace_map.items():
+        out = re.sub(fr"^{re.escape(old)}(?=[:]|\.)", new, out)
+    return out
+
+
+def _create_anim_curve(curve: dict[str, Any], driver: str, target: str) -> str:
+    """Create one driven-key curve with the API and connect it."""
+    node_type = curve.get("nodeType") or "animCurveUU"
+    anim = cmds.createNode(node_type, name=curve.get("name") or target.replace(".", "_"))
+    fn = _anim_curve_fn(anim)
+
+    keys = curve["keys"]
+    _add_keys(fn, node_type, keys)
+    _apply_tangents(fn, keys, curve.get("weightedTangents", False))
+    fn.setPreInfinityType(curve.get("preInfinity", oma.MFnAnimCurve.kConstant))
+    fn.setPostInfinityType(curve.get("postInfinity", oma.MFnAnimCurve.kConstant))
+
+    cmds.connectAttr(driver, f"{anim}.input")
+    _connect_driven(anim, target)
+
+    return anim
+
+
 # -------------------------------------------------------------
 # Public API
 # -------------------------------------------------------------
@@ -145,7 +329,7 @@ def dump_driven_keys(
 
     data: dict[str, Any] = {
         "maya": cmds.about(version=True),
-        "exporter": "driven_key_transfer 0.1",
+        "exporter": "driven_key_transfer 0.2",
         "drivenNode": node,
         "curves": [],
     }
@@ -163,47 +347,258 @@ def dump_driven_keys(
     return result
 
 
+LIBRARY_FORMAT = "ymt-driven-keys"
+LIBRARY_VERSION = 1
+_LIBRARY_HEADER_SIZE = 128
+
+
+def _library_header(index_offset: int) -> bytes:
+    header = json.dumps(
+        {"format": LIBRARY_FORMAT, "version": LIBRARY_VERSION, "indexOffset": index_offset},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return header.ljust(_LIBRARY_HEADER_SIZE - 1) + b"\n"
+
+
 def export_driven_keys_to_file(
-    node: str,
+    node: Union[str, Sequence[str]],
     filepath: str,
     *,
     world_space: bool = False,
+    chunked: bool = True,
 ) -> str:
     """Export all driven‑key relationships that affect *node* to *filepath*.
 
     Parameters
     ----------
     node
-        The *driven* node you want to export from.  Must exist.
+        The *driven* node (or nodes) you want to export from.  Must exist.
     filepath
         Destination .json path.  Parent folder is created automatically.
     world_space
         If *True*, bake local‑space curves to world‑space values before
         export.  (This is rarely needed; default *False*.)
+    chunked
+        Write the chunked library format, one record per node streamed to
+        disk as it is dumped.  The file only replaces *filepath* once it is
+        complete.  If *False*, write the single indented JSON
+        list older tools expect.
 
     Returns the absolute file path written so callers can print/log it.
     """
-    data = dump_driven_keys(node, world_space=world_space)
-    if not os.path.isdir(os.path.dirname(filepath)):
+    if os.path.dirname(filepath) and not os.path.isdir(os.path.dirname(filepath)):
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-    with open(filepath, "w", encoding="utf‑8") as fh:
-        json.dump(data, fh, indent=4)
+    if not chunked:
+        data = dump_driven_keys(node, world_space=world_space)
+        with open(filepath, "w", encoding="utf‑8") as fh:
+            json.dump(data, fh, indent=4)
+
+        return os.path.abspath(filepath)
+
+    # stream into a temporary file so a failing dump (missing node, no
+    # driven keys) leaves any existing library at filepath untouched
+    nodes = [node] if isinstance(node, str) else list(node)
+    index = []
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(_library_header(0))
+            for n in nodes:
+                for data in dump_driven_keys(n, world_space=world_space):
+                    record = json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+                    index.append({
+                        "node": data["drivenNode"],
+                        "offset": fh.tell(),
+                        "length": len(record),
+                        "curves": len(data["curves"]),
+                    })
+                    fh.write(record)
+
+            index_offset = fh.tell()
+            fh.write(json.dumps({"index": index}, separators=(",", ":")).encode("utf-8") + b"\n")
+            fh.seek(0)
+            fh.write(_library_header(index_offset))
+
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
     return os.path.abspath(filepath)
 
 
+def read_driven_key_index(filepath: str) -> Optional[list[dict[str, Any]]]:
+    """Return the record index of a chunked library, or *None* for legacy JSON.
+
+    Each entry holds ``node``, ``offset``, ``length`` and ``curves``.
+    """
+    with open(filepath, "rb") as fh:
+        first = fh.read(_LIBRARY_HEADER_SIZE)
+        if not first.startswith(b'{"format":"' + LIBRARY_FORMAT.encode("utf-8")):
+            return None
+
+        header = json.loads(first.decode("utf-8"))
+        if header.get("version", 0) > LIBRARY_VERSION:
+            raise RuntimeError(f"Driven key library '{filepath}' is newer than this tool (version {header['version']}).")
+
+        fh.seek(header["indexOffset"])
+        return json.loads(fh.readline().decode("utf-8"))["index"]
+
+
+def _read_record(filepath: str, entry: dict[str, Any]) -> dict[str, Any]:
+    with open(filepath, "rb") as fh:
+        fh.seek(entry["offset"])
+        return json.loads(fh.read(entry["length"]).decode("utf-8"))
+
+
+def iter_driven_key_records(
+    filepath: str,
+    entries: Sequence[dict[str, Any]],
+    max_workers: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """Yield the decoded records of *entries* in order.
+
+    Records are read and decoded on a thread pool, keeping at most a couple
+    of records per worker in flight so memory stays bounded.
+    """
+    window = max(1, max_workers) * 2
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        pending: deque = deque()
+        for entry in entries:
+            pending.append(pool.submit(_read_record, filepath, entry))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+@dataclass
+class DrivenKeyChange:
+    """One planned or applied change of an incremental import."""
+
+    action: str  # "create", "update", "remove" or "unchanged"
+    target: str
+    driver: str
+    anim: Optional[str] = None
+
+
+def _key_fields(keys: Sequence[dict[str, Any]]) -> tuple[str, ...]:
+    # Legacy files carry no tangent angles / weights; only compare what the
+    # incoming data actually describes.
+    fields = ("input", "output", "inTan", "outTan")
+    if keys and "inAngle" in keys[0]:
+        fields += ("inAngle", "inWeight", "outAngle", "outWeight")
+    return fields
+
+
+def curve_signature(curve: dict[str, Any], key_fields: Optional[Sequence[str]] = None) -> str:
+    """Return a hash of the key data of a serialised curve.
+
+    Floats are rounded to 6 decimals so UI unit round trips do not show up
+    as changes.
+    """
+    keys = curve.get("keys") or []
+    fields = key_fields or _key_fields(keys)
+
+    def _canonical(value: Any) -> Any:
+        return round(value, 6) if isinstance(value, float) else value
+
+    canonical = {
+        "nodeType": curve.get("nodeType"),
+        "preInfinity": int(curve.get("preInfinity", 0)),
+        "postInfinity": int(curve.get("postInfinity", 0)),
+        "weightedTangents": bool(curve.get("weightedTangents", False)),
+        "keys": [[_canonical(k.get(f)) for f in fields] for k in keys],
+    }
+    return hashlib.sha1(json.dumps(canonical, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _target_driven_curves(target_plug: str) -> dict[str, str]:
+    """Return ``{driver_plug: animCurve}`` currently driving *target_plug*.
+
+    Curves blended through a blendWeighted node are included.
+    """
+    source = cmds.connectionInfo(target_plug, sourceFromDestination=True)
+    if not source:
+        return {}
+
+    source_node = source.split(".")[0]
+    if cmds.nodeType(source_node) == "blendWeighted":
+        anims = cmds.listConnections(f"{source_node}.input", source=True, destination=False, type="animCurve") or []
+    else:
+        anims = [source_node]
+
+    return {
+        _driver_plug(_anim_curve_fn(anim)): anim
+        for anim in anims
+        if cmds.nodeType(anim) in _ANIM_TYPES
+    }
+
+
+def _existing_driven_curves(driven_node: str) -> dict[tuple[str, str], str]:
+    """Return ``{(target_plug, driver_plug): animCurve}`` currently driving *driven_node*.
+
+    Curves blended through a blendWeighted node are included.
+    """
+    result: dict[tuple[str, str], str] = {}
+    for attr in cmds.listAttr(driven_node, k=True, s=True) or []:
+        target_plug = f"{driven_node}.{attr}"
+        for driver, anim in _target_driven_curves(target_plug).items():
+            result[(target_plug, driver)] = anim
+
+    return result
+
+
+def _rewrite_anim_curve(anim: str, curve: dict[str, Any], driver: str, target: str) -> str:
+    """Replace the keys of an existing curve in place, keeping its connections."""
+    node_type = curve.get("nodeType") or "animCurveUU"
+    if cmds.nodeType(anim) != node_type:
+        cmds.delete(anim)
+        return _create_anim_curve(curve, driver, target)
+
+    fn = _anim_curve_fn(anim)
+    for i in range(fn.numKeys - 1, -1, -1):
+        fn.remove(i)
+
+    keys = curve["keys"]
+    _add_keys(fn, node_type, keys)
+    _apply_tangents(fn, keys, curve.get("weightedTangents", False))
+    fn.setPreInfinityType(curve.get("preInfinity", oma.MFnAnimCurve.kConstant))
+    fn.setPostInfinityType(curve.get("postInfinity", oma.MFnAnimCurve.kConstant))
+
+    return anim
+
+
+def format_driven_key_report(changes: Sequence[DrivenKeyChange]) -> str:
+    """Return a readable summary of *changes*, one line per non trivial change."""
+    counts: dict[str, int] = defaultdict(int)
+    lines = []
+    for change in changes:
+        counts[change.action] += 1
+        if change.action != "unchanged":
+            lines.append(f"{change.action:<8} {change.target} <- {change.driver}" + (f" ({change.anim})" if change.anim else ""))
+
+    summary = ", ".join(f"{counts[a]} {a}" for a in ("create", "update", "remove", "unchanged"))
+    return "\n".join(lines + [summary])
+
+
 def import_driven_keys(
     data: Union[list[dict[str, Any]], dict[str, Any]],
     namespace_map: Optional[dict[str, str]] = None,
     strict: bool = False,
+    incremental: bool = False,
+    dry_run: bool = False,
+    report: Optional[list[DrivenKeyChange]] = None,
 ) -> list[str]:
     """Import driven‑key relationships from *filepath* into the current scene.
 
     Parameters
     ----------
     data:
-
+        One driven node record or a list of them, as returned by
+        :func:`dump_driven_keys`.
     namespace_map
         Optional mapping ``{"old": "new"}`` that will be *regex*‑applied to
         both driver and target plugs **before** connections are made.  This
@@ -213,12 +608,31 @@ def import_driven_keys(
         If *True*, raise an error as soon as a target or driver plug is not
         found.  If *False* (default), missing plugs are skipped with a
         warning so that partial imports still succeed.
-
-    Returns a list of newly created animCurve nodes.
+    incremental
+        Compare every curve against the animCurve already driving the same
+        target from the same driver, by :func:`curve_signature`.  Identical
+        curves are left alone, changed ones are rewritten in place, missing
+        ones created and curves on the driven node that are no longer in
+        *data* removed.
+    dry_run
+        Plan an incremental import without touching the scene.
+    report
+        Optional list that receives a :class:`DrivenKeyChange` per curve.
+
+    Returns a list of newly created or updated animCurve nodes.
     """
     if isinstance(data, list):
+        result: list[str] = []
         for d in data:
-            import_driven_keys(d, namespace_map=namespace_map, strict=strict)
+            result.extend(import_driven_keys(
+                d,
+                namespace_map=namespace_map,
+                strict=strict,
+                incremental=incremental,
+                dry_run=dry_run,
+                report=report,
+            ))
+        return result
 
     if not isinstance(data, dict):
         raise TypeError("Invalid data format: expected a list of dicts.")
@@ -228,14 +642,18 @@ def import_driven_keys(
         raise KeyError("Missing 'drivenNode' key in data.")
 
     def _map(plug: str) -> str:
-        if not namespace_map:
-            return plug
-        out = plug
-        for old, new in namespace_map.items():
-            out = re.sub(fr"^{re.escape(old)}(?=[:]|\.)", new, out)
-        return out
+        return _apply_namespace_map(plug, namespace_map)
+
+    incremental = incremental or dry_run
+    changes: list[DrivenKeyChange] = []
+    existing: dict[tuple[str, str], str] = {}
+    if incremental:
+        driven_node = _map(data["drivenNode"] + ".")[:-1]
+        if cmds.objExists(driven_node):
+            existing = _existing_driven_curves(driven_node)
 
     created_anim_curves: list[str] = []
+    seen: set[tuple[str, str]] = set()
 
     for curve in data.get("curves", []):
 
@@ -264,29 +682,66 @@ def import_driven_keys(
             print("[driven_key_transfer] WARNING:", msg)
             continue
 
-        # Build keys via Maya’s native driven‑key command
-        for k in curve["keys"]:
-            cmds.setDrivenKeyframe(
-                target,
-                cd=driver,
-                dv=k["input"],
-                v=k["output"],
-                itt=k["inTan"],
-                ott=k["outTan"],
-            )
-
-        # Fetch the freshly created animCurve and set infinity / weighting
-        anim = cmds.listConnections(target, s=True, d=False, t="animCurve")[-1]
-        created_anim_curves.append(anim)
-        cmds.setAttr(f"{anim}.preInfinity", curve["preInfinity"])
-        cmds.setAttr(f"{anim}.postInfinity", curve["postInfinity"])
-        try:
-            cmds.setAttr(f"{anim}.weightedTangents", curve["weightedTangents"])
-        except RuntimeError:
-            # weightedTangents is not available on all curve types
-            pass
+        if not curve.get("keys"):
+            if incremental:
+                # nothing to import, but keep the scene curve
+                seen.add((target, driver))
+                anim = existing.get((target, driver))
+                if anim is not None:
+                    changes.append(DrivenKeyChange("unchanged", target, driver, anim))
+            continue
 
-    print(f"[driven_key_transfer] Imported {len(created_anim_curves)} driven‑key curves")
+        if not incremental:
+            # like setDrivenKeyframe, a curve from the same driver gets the
+            # keys; only a different driver is blended in
+            anim = _target_driven_curves(target).get(driver)
+            if anim is None:
+                anim = _create_anim_curve(curve, driver, target)
+            else:
+                anim = _rewrite_anim_curve(anim, curve, driver, target)
+            created_anim_curves.append(anim)
+            continue
+
+        seen.add((target, driver))
+        anim = existing.get((target, driver))
+        if anim is None:
+            action = "create"
+        else:
+            fields = _key_fields(curve["keys"])
+            same = curve_signature(curve, fields) == curve_signature(_anim_curve_data(anim), fields)
+            action = "unchanged" if same else "update"
+
+        if not dry_run:
+            if action == "create":
+                anim = _create_anim_curve(curve, driver, target)
+                created_anim_curves.append(anim)
+            elif action == "update":
+                anim = _rewrite_anim_curve(anim, curve, driver, target)
+                created_anim_curves.append(anim)
+
+        changes.append(DrivenKeyChange(action, target, driver, anim))
+
+    for (target, driver), anim in existing.items():
+        if (target, driver) in seen:
+            continue
+        if not dry_run:
+            cmds.delete(anim)
+        changes.append(DrivenKeyChange("remove", target, driver, anim))
+
+    if report is not None:
+        report.extend(changes)
+
+    if incremental:
+        counts: dict[str, int] = defaultdict(int)
+        for change in changes:
+            counts[change.action] += 1
+        prefix = "Would apply" if dry_run else "Applied"
+        print(
+            f"[driven_key_transfer] {prefix} on '{data['drivenNode']}': "
+            + ", ".join(f"{counts[a]} {a}" for a in ("create", "update", "remove", "unchanged"))
+        )
+    else:
+        print(f"[driven_key_transfer] Imported {len(created_anim_curves)} driven‑key curves")
     return created_anim_curves
 
 
@@ -294,11 +749,47 @@ def import_driven_keys_from_file(
     filepath: str,
     namespace_map: Optional[dict[str, str]] = None,
     strict: bool = False,
+    nodes: Optional[Sequence[str]] = None,
+    max_workers: int = 4,
+    incremental: bool = False,
+    dry_run: bool = False,
+    report: Optional[list[DrivenKeyChange]] = None,
 ) -> list[str]:
-    with open(filepath, "r", encoding="utf‑8") as fh:
-        data = json.load(fh)
+    """Import a driven key file written by :func:`export_driven_keys_to_file`.
+
+    For chunked libraries only the records whose driven node (after
+    *namespace_map*) is in *nodes*, or exists in the scene when *nodes* is
+    *None*, are read.  Legacy list‑of‑dicts files are loaded whole.
+    *incremental*, *dry_run* and *report* are passed to
+    :func:`import_driven_keys`.
+    """
+    options = dict(namespace_map=namespace_map, strict=strict, incremental=incremental, dry_run=dry_run, report=report)
+    index = read_driven_key_index(filepath)
+    if index is None:
+        with open(filepath, "r", encoding="utf‑8") as fh:
+            data = json.load(fh)
+
+        return import_driven_keys(data, **options)
 
-    return import_driven_keys(data, namespace_map=namespace_map, strict=strict)
+    wanted = set(nodes) if nodes is not None else None
+
+    def _is_wanted(entry: dict[str, Any]) -> bool:
+        # map "node." so the namespace pattern sees its plug separator
+        node = _apply_namespace_map(entry["node"] + ".", namespace_map)[:-1]
+        if wanted is not None:
+            return node in wanted
+        return cmds.objExists(node)
+
+    entries = [entry for entry in index if _is_wanted(entry)]
+    skipped = len(index) - len(entries)
+    if skipped:
+        print(f"[driven_key_transfer] Skipped {skipped} driven nodes not present in the scene")
+
+    created_anim_curves: list[str] = []
+    for record in iter_driven_key_records(filepath, entries, max_workers=max_workers):
+        created_anim_curves.extend(import_driven_keys(record, **options))
+
+    return created_anim_curves
 
 
 # -------------------------------------------------------------
@@ -318,6 +809,8 @@ if __name__ == "__main__":
     imp = sub.add_parser("import")
     imp.add_argument("filepath", help="Source JSON file.")
     imp.add_argument("--strict", action="store_true", help="Fail if any plug is missing.")
+    imp.add_argument("--incremental", action="store_true", help="Only rewrite curves that changed.")
+    imp.add_argument("--dry-run", action="store_true", help="Print the changes an incremental import would make.")
 
     args = parser.parse_args()
 
@@ -328,7 +821,16 @@ if __name__ == "__main__":
     if args.cmd == "export":
         export_driven_keys(args.node, args.filepath)
     elif args.cmd == "import":
-        import_driven_keys(args.filepath, strict=args.strict)
+        changes: list[DrivenKeyChange] = []
+        import_driven_keys_from_file(
+            args.filepath,
+            strict=args.strict,
+            incremental=args.incremental,
+            dry_run=args.dry_run,
+            report=changes,
+        )
+        if changes:
+            print(format_driven_key_report(changes))
     else:
         parser.print_help()
         sys.exit(1)
@@ -6,16 +6,24 @@ This module intentionally keeps the scope narrow:
 * fixed sample parameters captured from the initial curves
 * analytic distance-loss gradients
 * one optional scene write-back at the end
+* an optional NumPy array backend for the optimization loop
 """
 from __future__ import annotations
 
+import functools
 import math
-from collections.abc import Iterable, Iterator, Sequence
-from contextlib import contextmanager
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from logging import DEBUG, INFO, StreamHandler, getLogger
 from typing import Literal, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import maya.api.OpenMaya as om2
 import maya.cmds as cmds
@@ -31,7 +39,8 @@ BasisSequence = Sequence[SparseBasis]
 PointSequence = Sequence[om2.MPoint]
 VectorSequence = Sequence[om2.MVector]
 SourceSampleMode = Literal["parameter", "length"]
-OptimizerName = Literal["adam", "lion"]
+OptimizerName = Literal["adam", "lion", "lstsq"]
+FitBackend = Literal["auto", "python", "numpy"]
 SymmetryAxis = Literal["X", "Y", "Z", "x", "y", "z"]
 
 
@@ -98,12 +107,29 @@ class FitResult:
     smoothness_complexity_scale: float = 1.0
     symmetry: bool = False
     symmetry_axis: str = "X"
+    backend: str = "python"
+    loss_history: list[float] = field(default_factory=list)
+    converged: bool = False
+    stop_reason: str = "max_iterations"
     scene_loss_after_write: float | None = None
     scene_smoothness_loss_after_write: float | None = None
     scene_objective_loss_after_write: float | None = None
     max_write_error: float | None = None
 
 
+@dataclass
+class BatchFitResult:
+    """Per-curve results and aggregate timing of :func:`fit_curves_batch`."""
+
+    results: list[FitResult]
+    build_seconds: float
+    optimize_seconds: float
+    write_seconds: float
+    total_seconds: float
+    target_cache_hits: int = 0
+    target_cache_misses: int = 0
+
+
 @dataclass
 class EvaluatorValidation:
     """Difference between Maya curve evaluation and the local evaluator."""
@@ -202,20 +228,32 @@ def snapshot_curve(curve_like: CurveLike) -> NurbsCurveSnapshot:
     )
 
 
-def _sample_params_by_length(mfn_curve: om2.MFnNurbsCurve, num_samples: int) -> list[float]:
+def _sample_params_by_length(
+    mfn_curve: om2.MFnNurbsCurve,
+    num_samples: int,
+    arc_table: curve.ArcLengthTable | None = None,
+) -> list[float]:
     if num_samples < 2:
         raise ValueError("num_samples must be at least 2.")
 
     mfn_curve.updateCurve()
+    if arc_table is not None:
+        total_length = arc_table.total_length
+        find_length_from_param = arc_table.length_at_param
+        find_param_from_length = arc_table.param_at_length
+    else:
+        total_length = float(mfn_curve.length())
+        find_length_from_param = mfn_curve.findLengthFromParam
+        find_param_from_length = mfn_curve.findParamFromLength
+
     is_closed = _is_closed_form(int(mfn_curve.form))
     cycle_count = num_samples if is_closed else num_samples - 1
-    total_length = float(mfn_curve.length())
     segment_length = total_length / float(cycle_count)
 
     if is_closed:
         pos0 = mfn_curve.cvPosition(0)
         _, start_param = mfn_curve.closestPoint(pos0)
-        start_length = float(mfn_curve.findLengthFromParam(start_param))
+        start_length = float(find_length_from_param(start_param))
     else:
         start_length = 0.0
 
@@ -227,7 +265,7 @@ def _sample_params_by_length(mfn_curve: om2.MFnNurbsCurve, num_samples: int) ->
                 length -= total_length
             else:
                 length = total_length
-        params.append(float(mfn_curve.findParamFromLength(length)))
+        params.append(float(find_param_from_length(length)))
 
     return params
 
@@ -298,18 +336,119 @@ def _basis_funs(span: int, u: float, degree: int, knots: Sequence[float]) -> lis
     return values
 
 
-def basis_at_param(snapshot: NurbsCurveSnapshot, u: float) -> Basis:
-    """Return non-zero basis weights as ``(cv_index, weight)`` pairs."""
-    span = _find_span(snapshot.num_cvs, snapshot.degree, u, snapshot.knots)
-    weights = _basis_funs(span, u, snapshot.degree, snapshot.knots)
-    first = span - snapshot.degree
+def _basis_at_param(num_cvs: int, degree: int, knots: Sequence[float], u: float) -> Basis:
+    span = _find_span(num_cvs, degree, u, knots)
+    weights = _basis_funs(span, u, degree, knots)
+    first = span - degree
     return [
         (first + i, weight)
         for i, weight in enumerate(weights)
-        if weight != 0.0 and 0 <= first + i < snapshot.num_cvs
+        if weight != 0.0 and 0 <= first + i < num_cvs
     ]
 
 
+def basis_at_param(snapshot: NurbsCurveSnapshot, u: float) -> Basis:
+    """Return non-zero basis weights as ``(cv_index, weight)`` pairs."""
+    return _basis_at_param(snapshot.num_cvs, snapshot.degree, snapshot.knots, u)
+
+
+@dataclass
+class BasisCacheInfo:
+    """Statistics of a :class:`BasisCache`."""
+
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+class BasisCache:
+    """LRU cache of sparse basis tables.
+
+    Curves sharing a degree, knot vector and sample parameters, such as
+    mirrored L/R pairs or rebuilt guide curves, evaluate to identical bases.
+    Tables are keyed by ``(degree, knots, params)`` and stored as tuples so
+    cached entries cannot be mutated through a returned table.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self._entries: OrderedDict[tuple, tuple[tuple[SparseBasis, ...], ...]] = OrderedDict()
+        self._max_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_size must not be negative.")
+        self._max_size = int(value)
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def info(self) -> BasisCacheInfo:
+        return BasisCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            max_size=self._max_size,
+            current_size=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, degree: int, knots: Sequence[float], params: Sequence[float]) -> list[Basis]:
+        """Return the basis table for ``params``, computing it on a miss."""
+        key = (int(degree), tuple(float(k) for k in knots), tuple(float(u) for u in params))
+        table = self._entries.get(key)
+        if table is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            num_cvs = len(key[1]) - key[0] - 1
+            table = tuple(
+                tuple(_basis_at_param(num_cvs, key[0], key[1], u))
+                for u in key[2]
+            )
+            if self._max_size > 0:
+                self._entries[key] = table
+                self._trim()
+        return [list(basis) for basis in table]
+
+
+_basis_cache = BasisCache()
+
+
+def basis_table(snapshot: NurbsCurveSnapshot, params: Sequence[float]) -> list[Basis]:
+    """Return sparse bases for every param through the process basis cache."""
+    return _basis_cache.get(snapshot.degree, snapshot.knots, params)
+
+
+def basis_cache_info() -> BasisCacheInfo:
+    """Return hit/miss statistics of the process basis cache."""
+    return _basis_cache.info()
+
+
+def set_basis_cache_size(max_size: int) -> None:
+    """Resize the process basis cache. ``0`` disables caching."""
+    _basis_cache.max_size = max_size
+
+
+def clear_basis_cache() -> None:
+    """Drop every cached basis table and reset the counters."""
+    _basis_cache.clear()
+
+
 def _master_cv_index(snapshot: NurbsCurveSnapshot, cv_index: int) -> int:
     if snapshot.is_periodic and cv_index >= snapshot.num_cvs - snapshot.degree:
         return cv_index - (snapshot.num_cvs - snapshot.degree)
@@ -327,6 +466,14 @@ def _sync_periodic_bound_cvs(snapshot: NurbsCurveSnapshot, cvs_world: PointSeque
     return synced
 
 
+def _expand_periodic_cvs(snapshot: NurbsCurveSnapshot, independent_cvs: PointSequence) -> list[om2.MPoint]:
+    """Append copies of the first ``degree`` CVs for periodic curves."""
+    expanded = [om2.MPoint(point) for point in independent_cvs]
+    if snapshot.is_periodic:
+        expanded.extend(om2.MPoint(point) for point in expanded[:snapshot.degree])
+    return expanded
+
+
 def _normalized_cv_indices(snapshot: NurbsCurveSnapshot, cv_indices: Sequence[int] | None) -> list[int]:
     if cv_indices is None:
         limit = snapshot.num_cvs - snapshot.degree if snapshot.is_periodic else snapshot.num_cvs
@@ -523,9 +670,9 @@ def validate_snapshot_evaluator(curve_like: CurveLike, num_samples: int = 100) -
 
     total_error = 0.0
     max_error = 0.0
-    for u in sample_params:
+    for u, basis in zip(sample_params, basis_table(snapshot, sample_params)):
         maya_point = mfn_curve.getPointAtParam(u, space=om2.MSpace.kWorld)
-        poc_point = evaluate_point(snapshot.cvs_world, basis_at_param(snapshot, u))
+        poc_point = evaluate_point(snapshot.cvs_world, basis)
         error = (maya_point - poc_point).length()
         total_error += error
         max_error = max(max_error, error)
@@ -537,11 +684,69 @@ def validate_snapshot_evaluator(curve_like: CurveLike, num_samples: int = 100) -
     )
 
 
+def sample_target_points(curve_like: CurveLike, num_samples: int = 100) -> list[om2.MPoint]:
+    """Return world-space points sampled by arc length along a target curve."""
+    mfn_curve = _as_mfn_curve(curve_like)
+    return [
+        mfn_curve.getPointAtParam(u, space=om2.MSpace.kWorld)
+        for u in _sample_params_by_length(mfn_curve, num_samples)
+    ]
+
+
+def curve_geometry_hash(curve_like: CurveLike) -> int:
+    """Hash the degree, form, knots and world CV positions of a curve."""
+    mfn_curve = _as_mfn_curve(curve_like)
+    mfn_curve.updateCurve()
+    return hash((
+        int(mfn_curve.degree),
+        int(mfn_curve.form),
+        tuple(float(k) for k in mfn_curve.knots()),
+        tuple((p.x, p.y, p.z) for p in mfn_curve.cvPositions(om2.MSpace.kWorld)),
+    ))
+
+
+class TargetSampleCache:
+    """Arc-length target samples shared between fits against the same curve.
+
+    Entries are keyed by the curve DAG path and the sample count, and store a
+    geometry hash next to the samples. Editing the target curve changes the
+    hash, so the stale samples are replaced on the next lookup.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, int], tuple[int, list[om2.MPoint]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_points(self, curve_like: CurveLike, num_samples: int) -> list[om2.MPoint]:
+        mfn_curve = _as_mfn_curve(curve_like)
+        key = (mfn_curve.getPath().fullPathName(), int(num_samples))
+        geometry_hash = curve_geometry_hash(mfn_curve)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == geometry_hash:
+            self.hits += 1
+            points = entry[1]
+        else:
+            self.misses += 1
+            points = sample_target_points(mfn_curve, num_samples)
+            self._entries[key] = (geometry_hash, points)
+        return [om2.MPoint(point) for point in points]
+
+
 def build_fit_context(
     curve_a: CurveLike,
     curve_b: CurveLike,
     num_samples: int = 100,
     source_sample_mode: SourceSampleMode = "parameter",
+    target_cache: TargetSampleCache | None = None,
 ) -> FitContext:
     """Precompute fixed source bases and target points.
 
@@ -549,7 +754,8 @@ def build_fit_context(
     same source locations. Closed and periodic curves use arc-length samples
     from the source CV 0 region because their knot parameter start can be
     offset from CV 0. Target samples are captured by arc length because the
-    target curve is not modified during optimization.
+    target curve is not modified during optimization. Pass ``target_cache`` to
+    reuse those samples across fits against the same target.
     """
     mfn_a = _as_mfn_curve(curve_a)
     mfn_b = _as_mfn_curve(curve_b)
@@ -566,12 +772,11 @@ def build_fit_context(
     else:
         raise ValueError("Unsupported source_sample_mode: {}".format(source_sample_mode))
 
-    target_params = _sample_params_by_length(mfn_b, num_samples)
-    sample_basis = [basis_at_param(source, u) for u in sample_params]
-    target_points = [
-        mfn_b.getPointAtParam(u, space=om2.MSpace.kWorld)
-        for u in target_params
-    ]
+    sample_basis = basis_table(source, sample_params)
+    if target_cache is None:
+        target_points = sample_target_points(mfn_b, num_samples)
+    else:
+        target_points = target_cache.get_points(mfn_b, num_samples)
 
     return FitContext(
         source=source,
@@ -592,22 +797,28 @@ def compute_distance_loss(cvs_world: PointSequence, context: FitContext) -> floa
     return loss / float(len(context.target_points))
 
 
-def compute_distance_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> list[om2.MVector]:
-    """Compute analytic gradients for the fixed-basis distance loss."""
+def _distance_loss_and_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> tuple[float, list[om2.MVector]]:
     gradients = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
     active = None if cv_indices is None else set(_normalized_cv_indices(context.source, cv_indices))
     scale = 2.0 / float(len(context.target_points))
 
+    loss = 0.0
     for basis, target_point in zip(context.sample_basis, context.target_points):
         source_point = evaluate_point(cvs_world, basis)
         diff = source_point - target_point
+        loss += diff.x**2 + diff.y**2 + diff.z**2
         for cv_index, weight in basis:
             master_index = _master_cv_index(context.source, cv_index)
             if active is not None and master_index not in active:
                 continue
             gradients[master_index] += diff * (scale * weight)
 
-    return gradients
+    return loss / float(len(context.target_points)), gradients
+
+
+def compute_distance_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> list[om2.MVector]:
+    """Compute analytic gradients for the fixed-basis distance loss."""
+    return _distance_loss_and_gradients(cvs_world, context, cv_indices)[1]
 
 
 def _independent_cv_count(snapshot: NurbsCurveSnapshot) -> int:
@@ -729,18 +940,19 @@ def compute_smoothness_loss(cvs_world: PointSequence, context: FitContext) -> fl
     return loss / float(len(triples))
 
 
-def compute_smoothness_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> list[om2.MVector]:
-    """Compute gradients for the second-difference smoothness loss."""
+def _smoothness_loss_and_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> tuple[float, list[om2.MVector]]:
     gradients = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
     triples = _smoothness_indices(context.source)
     if not triples:
-        return gradients
+        return 0.0, gradients
 
     active = None if cv_indices is None else set(_normalized_cv_indices(context.source, cv_indices))
     scale = 2.0 / float(len(triples))
 
+    loss = 0.0
     for prev_index, cv_index, next_index in triples:
         diff = _second_difference(cvs_world, prev_index, cv_index, next_index)
+        loss += diff.x**2 + diff.y**2 + diff.z**2
         contributions = (
             (prev_index, diff * scale),
             (cv_index, diff * (-2.0 * scale)),
@@ -752,7 +964,12 @@ def compute_smoothness_gradients(cvs_world: PointSequence, context: FitContext,
                 continue
             gradients[master_index] += contribution
 
-    return gradients
+    return loss / float(len(triples)), gradients
+
+
+def compute_smoothness_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None) -> list[om2.MVector]:
+    """Compute gradients for the second-difference smoothness loss."""
+    return _smoothness_loss_and_gradients(cvs_world, context, cv_indices)[1]
 
 
 def compute_objective_loss(cvs_world: PointSequence, context: FitContext, smoothness_weight: float) -> tuple[float, float, float]:
@@ -766,16 +983,26 @@ def compute_objective_loss(cvs_world: PointSequence, context: FitContext, smooth
     )
 
 
-def compute_objective_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None, smoothness_weight: float = 0.2) -> list[om2.MVector]:
-    """Combine distance and smoothness gradients."""
-    gradients = compute_distance_gradients(cvs_world, context, cv_indices)
+def compute_objective_loss_and_gradients(
+    cvs_world: PointSequence,
+    context: FitContext,
+    cv_indices: Sequence[int] | None = None,
+    smoothness_weight: float = 0.2,
+) -> tuple[float, list[om2.MVector]]:
+    """Return the objective and its gradients from one evaluation pass."""
+    distance_loss, gradients = _distance_loss_and_gradients(cvs_world, context, cv_indices)
     if smoothness_weight == 0.0:
-        return gradients
+        return distance_loss, gradients
 
-    smoothness_gradients = compute_smoothness_gradients(cvs_world, context, cv_indices)
+    smoothness_loss, smoothness_gradients = _smoothness_loss_and_gradients(cvs_world, context, cv_indices)
     for cv_index, smoothness_gradient in enumerate(smoothness_gradients):
         gradients[cv_index] += smoothness_gradient * smoothness_weight
-    return gradients
+    return distance_loss + smoothness_weight * smoothness_loss, gradients
+
+
+def compute_objective_gradients(cvs_world: PointSequence, context: FitContext, cv_indices: Sequence[int] | None = None, smoothness_weight: float = 0.2) -> list[om2.MVector]:
+    """Combine distance and smoothness gradients."""
+    return compute_objective_loss_and_gradients(cvs_world, context, cv_indices, smoothness_weight)[1]
 
 
 def _sign_vector(vector: om2.MVector) -> om2.MVector:
@@ -837,6 +1064,210 @@ def _adam_update_positions(
     return updated
 
 
+# --- NumPy array backend ----------------------------------------------------
+#
+# The array backend mirrors the pure Python loss, gradient and optimizer code
+# above with matrix operations. Periodic bound CVs are folded onto their master
+# CVs up front, so the arrays only hold the independent CVs.
+
+# Dense basis matrices are used up to this many ``samples * cvs`` entries.
+# Larger problems use a CSR layout because each row only has ``degree + 1``
+# non-zero weights.
+DENSE_BASIS_MAX_ENTRIES = 1 << 16
+
+
+def has_numpy() -> bool:
+    """Return whether the NumPy array backend is available."""
+    return np is not None
+
+
+def _resolve_backend(backend: FitBackend) -> str:
+    if backend not in ("auto", "python", "numpy"):
+        raise ValueError("Unsupported backend: {}".format(backend))
+
+    if backend == "python":
+        return "python"
+
+    if np is None:
+        if backend == "numpy":
+            logger.warning("NumPy is not available; fit_curve falls back to the pure Python backend.")
+        return "python"
+
+    return "numpy"
+
+
+class ArrayBasis:
+    """Sample basis matrix stored either dense or as CSR arrays."""
+
+    def __init__(self, sample_basis: Sequence[BasisSequence], num_cols: int, column_map: Sequence[int]) -> None:
+        self.num_rows = len(sample_basis)
+        self.num_cols = num_cols
+
+        indptr = [0]
+        indices = []
+        data = []
+        for basis in sample_basis:
+            for cv_index, weight in basis:
+                indices.append(column_map[cv_index])
+                data.append(weight)
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.data = np.asarray(data, dtype=float)
+        self.rows = np.repeat(np.arange(self.num_rows, dtype=np.intp), np.diff(self.indptr))
+
+        self.dense = None
+        if self.num_rows * self.num_cols <= DENSE_BASIS_MAX_ENTRIES:
+            self.dense = np.zeros((self.num_rows, self.num_cols), dtype=float)
+            np.add.at(self.dense, (self.rows, self.indices), self.data)
+
+    @property
+    def is_dense(self) -> bool:
+        return self.dense is not None
+
+    def dot(self, cvs: "np.ndarray") -> "np.ndarray":
+        """Return ``basis @ cvs`` for an ``(num_cols, 3)`` CV array."""
+        if self.dense is not None:
+            return self.dense @ cvs
+
+        result = np.zeros((self.num_rows, cvs.shape[1]), dtype=float)
+        np.add.at(result, self.rows, cvs[self.indices] * self.data[:, None])
+        return result
+
+    def transpose_dot(self, values: "np.ndarray") -> "np.ndarray":
+        """Return ``basis.T @ values`` for an ``(num_rows, 3)`` array."""
+        if self.dense is not None:
+            return self.dense.T @ values
+
+        result = np.zeros((self.num_cols, values.shape[1]), dtype=float)
+        np.add.at(result, self.indices, values[self.rows] * self.data[:, None])
+        return result
+
+
+@dataclass
+class ArrayFitContext:
+    """Array form of a :class:`FitContext` for the NumPy backend."""
+
+    context: FitContext
+    num_independent_cvs: int
+    basis: ArrayBasis
+    target_points: "np.ndarray"
+    smoothness_prev: "np.ndarray"
+    smoothness_index: "np.ndarray"
+    smoothness_next: "np.ndarray"
+
+
+def build_array_fit_context(context: FitContext) -> ArrayFitContext:
+    """Convert the sparse Python basis and target samples into arrays."""
+    if np is None:
+        raise RuntimeError("NumPy is required for the array fit backend.")
+
+    snapshot = context.source
+    column_map = [_master_cv_index(snapshot, cv_index) for cv_index in range(snapshot.num_cvs)]
+    num_independent_cvs = _independent_cv_count(snapshot)
+    triples = _smoothness_indices(snapshot)
+
+    return ArrayFitContext(
+        context=context,
+        num_independent_cvs=num_independent_cvs,
+        basis=ArrayBasis(context.sample_basis, num_independent_cvs, column_map),
+        target_points=_points_to_array(context.target_points),
+        smoothness_prev=np.asarray([triple[0] for triple in triples], dtype=np.intp),
+        smoothness_index=np.asarray([triple[1] for triple in triples], dtype=np.intp),
+        smoothness_next=np.asarray([triple[2] for triple in triples], dtype=np.intp),
+    )
+
+
+def _points_to_array(points: PointSequence) -> "np.ndarray":
+    return np.asarray([(point.x, point.y, point.z) for point in points], dtype=float).reshape(-1, 3)
+
+
+def _array_to_points(snapshot: NurbsCurveSnapshot, cvs: "np.ndarray") -> list[om2.MPoint]:
+    return _expand_periodic_cvs(snapshot, [om2.MPoint(x, y, z) for x, y, z in cvs.tolist()])
+
+
+def _array_second_differences(cvs: "np.ndarray", array_context: ArrayFitContext) -> "np.ndarray":
+    return (
+        cvs[array_context.smoothness_prev]
+        - cvs[array_context.smoothness_index] * 2.0
+        + cvs[array_context.smoothness_next]
+    )
+
+
+def compute_array_objective_loss(cvs: "np.ndarray", array_context: ArrayFitContext, smoothness_weight: float) -> tuple[float, float, float]:
+    """Array version of :func:`compute_objective_loss`."""
+    diff = array_context.basis.dot(cvs) - array_context.target_points
+    distance_loss = float(np.einsum("ij,ij->", diff, diff)) / float(array_context.basis.num_rows)
+
+    smoothness_loss = 0.0
+    if array_context.smoothness_index.size:
+        second = _array_second_differences(cvs, array_context)
+        smoothness_loss = float(np.einsum("ij,ij->", second, second)) / float(array_context.smoothness_index.size)
+
+    return (
+        distance_loss + smoothness_weight * smoothness_loss,
+        distance_loss,
+        smoothness_loss,
+    )
+
+
+def compute_array_objective_loss_and_gradients(cvs: "np.ndarray", array_context: ArrayFitContext, smoothness_weight: float) -> tuple[float, "np.ndarray"]:
+    """Array version of :func:`compute_objective_loss_and_gradients` for every CV."""
+    diff = array_context.basis.dot(cvs) - array_context.target_points
+    objective = float(np.einsum("ij,ij->", diff, diff)) / float(array_context.basis.num_rows)
+    gradients = array_context.basis.transpose_dot(diff) * (2.0 / float(array_context.basis.num_rows))
+
+    if smoothness_weight == 0.0 or not array_context.smoothness_index.size:
+        return objective, gradients
+
+    count = float(array_context.smoothness_index.size)
+    second = _array_second_differences(cvs, array_context)
+    objective += smoothness_weight * float(np.einsum("ij,ij->", second, second)) / count
+    second *= 2.0 * smoothness_weight / count
+    np.add.at(gradients, array_context.smoothness_prev, second)
+    np.add.at(gradients, array_context.smoothness_index, second * -2.0)
+    np.add.at(gradients, array_context.smoothness_next, second)
+    return objective, gradients
+
+
+def compute_array_objective_gradients(cvs: "np.ndarray", array_context: ArrayFitContext, smoothness_weight: float) -> "np.ndarray":
+    """Array version of :func:`compute_objective_gradients` for every CV."""
+    return compute_array_objective_loss_and_gradients(cvs, array_context, smoothness_weight)[1]
+
+
+def _array_adam_update(
+    cvs: "np.ndarray",
+    first_moment: "np.ndarray",
+    second_moment: "np.ndarray",
+    gradients: "np.ndarray",
+    active: "np.ndarray",
+    learning_rate: float,
+    beta1: float,
+    beta2: float,
+    epsilon: float,
+    step: int,
+) -> None:
+    gradient = gradients[active]
+    first_moment[active] = first_moment[active] * beta1 + gradient * (1.0 - beta1)
+    second_moment[active] = second_moment[active] * beta2 + gradient * gradient * (1.0 - beta2)
+    m_hat = first_moment[active] / (1.0 - beta1**step)
+    v_hat = second_moment[active] / (1.0 - beta2**step)
+    cvs[active] -= m_hat / (np.sqrt(v_hat) + epsilon) * learning_rate
+
+
+def _array_lion_update(
+    cvs: "np.ndarray",
+    momentum: "np.ndarray",
+    gradients: "np.ndarray",
+    active: "np.ndarray",
+    beta: float,
+    learning_rate: float,
+) -> None:
+    momentum[active] = momentum[active] * beta + gradients[active] * (1.0 - beta)
+    cvs[active] -= np.sign(momentum[active]) * learning_rate
+
+
 @contextmanager
 def _undo_chunk(name: str) -> Iterator[None]:
     if not cmds.undoInfo(query=True, state=True):
@@ -922,55 +1353,223 @@ def _max_position_error(points_a: PointSequence, points_b: PointSequence) -> flo
     return max_error
 
 
-def optimize_context(
+# Relative Tikhonov damping that keeps the normal equations solvable when an
+# active CV has no sample support and smoothness is disabled. The damping pulls
+# toward the current position, so well-posed systems are effectively unchanged.
+LSTSQ_DAMPING = 1e-12
+
+
+def build_normal_equations(context: FitContext, smoothness_weight: float) -> tuple[list[list[float]], list[list[float]]]:
+    """Return ``(A, b)`` of the objective's normal equations ``A P = b``.
+
+    The distance loss and the second-difference smoothness loss are both
+    quadratic in the CV positions, so the objective minimum solves
+    ``(B^T B / S + w D^T D / K) P = B^T T / S`` for the independent CVs. The
+    x, y and z columns share ``A``; ``b`` holds one row per independent CV.
+    """
+    snapshot = context.source
+    count = _independent_cv_count(snapshot)
+    matrix = [[0.0] * count for _ in range(count)]
+    rhs = [[0.0, 0.0, 0.0] for _ in range(count)]
+
+    distance_scale = 1.0 / float(len(context.target_points))
+    for basis, target_point in zip(context.sample_basis, context.target_points):
+        folded = {}
+        for cv_index, weight in basis:
+            master_index = _master_cv_index(snapshot, cv_index)
+            folded[master_index] = folded.get(master_index, 0.0) + weight
+
+        for row_index, row_weight in folded.items():
+            row = matrix[row_index]
+            for col_index, col_weight in folded.items():
+                row[col_index] += row_weight * col_weight * distance_scale
+            rhs_row = rhs[row_index]
+            rhs_row[0] += row_weight * target_point.x * distance_scale
+            rhs_row[1] += row_weight * target_point.y * distance_scale
+            rhs_row[2] += row_weight * target_point.z * distance_scale
+
+    triples = _smoothness_indices(snapshot)
+    if smoothness_weight != 0.0 and triples:
+        smoothness_scale = smoothness_weight / float(len(triples))
+        for triple in triples:
+            coefficients = tuple(zip(triple, (1.0, -2.0, 1.0)))
+            for row_index, row_coefficient in coefficients:
+                row = matrix[row_index]
+                for col_index, col_coefficient in coefficients:
+                    row[col_index] += row_coefficient * col_coefficient * smoothness_scale
+
+    return matrix, rhs
+
+
+def _solve_linear_system_python(matrix: list[list[float]], rhs: list[list[float]]) -> list[list[float]]:
+    """Solve ``matrix @ X = rhs`` by Gaussian elimination with partial pivoting."""
+    count = len(matrix)
+    augmented = [list(matrix[i]) + list(rhs[i]) for i in range(count)]
+    num_rhs = len(rhs[0]) if rhs else 0
+
+    for col in range(count):
+        pivot = max(range(col, count), key=lambda row: abs(augmented[row][col]))
+        if augmented[pivot][col] == 0.0:
+            raise ValueError("Least-squares system is singular.")
+        augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+
+        pivot_row = augmented[col]
+        pivot_value = pivot_row[col]
+        for row in range(col + 1, count):
+            current = augmented[row]
+            factor = current[col] / pivot_value
+            if factor == 0.0:
+                continue
+            for k in range(col, count + num_rhs):
+                current[k] -= factor * pivot_row[k]
+
+    solution = [[0.0] * num_rhs for _ in range(count)]
+    for row in range(count - 1, -1, -1):
+        current = augmented[row]
+        for k in range(num_rhs):
+            value = current[count + k]
+            for col in range(row + 1, count):
+                value -= current[col] * solution[col][k]
+            solution[row][k] = value / current[row]
+    return solution
+
+
+def solve_least_squares(
     context: FitContext,
-    cv_indices: Sequence[int] | None = None,
-    num_iterations: int = 30,
-    learning_rate: float = 0.01,
-    beta: float = 0.9,
-    optimizer: OptimizerName = "adam",
-    smoothness_weight: float = 0.2,
-    smoothness_auto_scale: bool = True,
-    smoothness_complexity_gain: float = 1.0,
-    adam_beta1: float = 0.9,
-    adam_beta2: float = 0.999,
-    adam_epsilon: float = 1e-8,
-    symmetry: bool = False,
-    symmetry_axis: SymmetryAxis = "X",
-) -> FitResult:
-    """Optimize the snapshot CV array without updating any scene curve."""
-    cv_indices = _normalized_cv_indices(context.source, cv_indices)
-    if symmetry:
-        _axis_index(symmetry_axis)
+    positions: PointSequence,
+    cv_indices: Sequence[int],
+    smoothness_weight: float,
+    backend: FitBackend = "auto",
+) -> list[om2.MPoint]:
+    """Return the exact objective minimum over the active CVs.
 
-    smoothness_weight_data = compute_effective_smoothness_weight(
-        context,
-        cv_indices,
-        smoothness_weight,
-        smoothness_auto_scale,
-        smoothness_complexity_gain,
-    )
-    effective_smoothness_weight, cv_scale, target_complexity, complexity_scale = smoothness_weight_data
-    positions = _sync_periodic_bound_cvs(context.source, context.source.cvs_world)
+    CVs not listed in ``cv_indices`` keep their ``positions`` and move to the
+    right-hand side. Periodic bound CVs are tied to their master CVs.
+    """
+    snapshot = context.source
+    active = _normalized_cv_indices(snapshot, cv_indices)
+    solved = [om2.MPoint(point) for point in positions[:_independent_cv_count(snapshot)]]
+    if not active:
+        return _expand_periodic_cvs(snapshot, solved)
+
+    matrix, rhs = build_normal_equations(context, smoothness_weight)
+    active_set = set(active)
+    fixed = [index for index in range(len(solved)) if index not in active_set]
+
+    reduced_matrix = [[matrix[row][col] for col in active] for row in active]
+    reduced_rhs = []
+    for row in active:
+        values = list(rhs[row])
+        for col in fixed:
+            coefficient = matrix[row][col]
+            if coefficient == 0.0:
+                continue
+            values[0] -= coefficient * solved[col].x
+            values[1] -= coefficient * solved[col].y
+            values[2] -= coefficient * solved[col].z
+        reduced_rhs.append(values)
+
+    trace = sum(reduced_matrix[i][i] for i in range(len(active)))
+    damping = LSTSQ_DAMPING * trace / float(len(active)) if trace > 0.0 else 1.0
+    for i, row in enumerate(active):
+        reduced_matrix[i][i] += damping
+        reduced_rhs[i][0] += damping * solved[row].x
+        reduced_rhs[i][1] += damping * solved[row].y
+        reduced_rhs[i][2] += damping * solved[row].z
+
+    if _resolve_backend(backend) == "numpy":
+        solution = np.linalg.solve(np.asarray(reduced_matrix), np.asarray(reduced_rhs)).tolist()
+    else:
+        solution = _solve_linear_system_python(reduced_matrix, reduced_rhs)
+
+    for row, (x, y, z) in zip(active, solution):
+        solved[row] = om2.MPoint(x, y, z)
+    return _expand_periodic_cvs(snapshot, solved)
+
+
+class _ConvergenceMonitor:
+    """Record the loss history and decide when the optimizer loop stops."""
+
+    def __init__(self, relative_tolerance: float, gradient_tolerance: float, step_tolerance: float) -> None:
+        self.relative_tolerance = relative_tolerance
+        self.gradient_tolerance = gradient_tolerance
+        self.step_tolerance = step_tolerance
+        self.loss_history: list[float] = []
+        self.stop_reason = "max_iterations"
+        self._history_current = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.relative_tolerance > 0.0 or self.gradient_tolerance > 0.0 or self.step_tolerance > 0.0
 
+    @property
+    def converged(self) -> bool:
+        return self.stop_reason != "max_iterations"
+
+    def should_stop_before_step(self, loss: float, max_gradient_norm: float) -> bool:
+        """Record the loss at the current positions and test loss/gradient criteria."""
+        previous = self.loss_history[-1] if self.loss_history else None
+        self.loss_history.append(loss)
+        self._history_current = True
+
+        if previous is not None and self.relative_tolerance > 0.0:
+            if abs(previous - loss) <= self.relative_tolerance * max(abs(previous), 1e-300):
+                self.stop_reason = "relative_loss"
+                return True
+
+        if self.gradient_tolerance > 0.0 and max_gradient_norm <= self.gradient_tolerance:
+            self.stop_reason = "gradient"
+            return True
+
+        return False
+
+    def should_stop_after_step(self, max_position_delta: float) -> bool:
+        """Test the position-delta criterion after an update moved the CVs."""
+        self._history_current = False
+        if self.step_tolerance > 0.0 and max_position_delta <= self.step_tolerance:
+            self.stop_reason = "step"
+            return True
+        return False
+
+    def finish(self, loss: Callable[[], float]) -> None:
+        """Append the loss at the final positions unless it is already recorded."""
+        if not self._history_current:
+            self.loss_history.append(loss())
+            self._history_current = True
+
+
+def _optimize_python(
+    context: FitContext,
+    positions: list[om2.MPoint],
+    cv_indices: Sequence[int],
+    max_steps: int,
+    learning_rate: float,
+    beta: float,
+    optimizer: OptimizerName,
+    smoothness_weight: float,
+    adam_beta1: float,
+    adam_beta2: float,
+    adam_epsilon: float,
+    monitor: _ConvergenceMonitor,
+) -> tuple[list[om2.MPoint], int]:
     first_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
     second_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
-    initial_objective_loss, initial_loss, initial_smoothness_loss = compute_objective_loss(
-        positions,
-        context,
-        effective_smoothness_weight,
-    )
 
-    if optimizer not in ("adam", "lion"):
-        raise ValueError("Unsupported optimizer: {}".format(optimizer))
-
-    for step in range(1, num_iterations + 1):
-        gradients = compute_objective_gradients(
+    steps = 0
+    for step in range(1, max_steps + 1):
+        loss, gradients = compute_objective_loss_and_gradients(
             positions,
             context,
             cv_indices=cv_indices,
-            smoothness_weight=effective_smoothness_weight,
+            smoothness_weight=smoothness_weight,
         )
+        max_gradient_norm = 0.0
+        if monitor.gradient_tolerance > 0.0:
+            max_gradient_norm = max((gradients[i].length() for i in cv_indices), default=0.0)
+        if monitor.should_stop_before_step(loss, max_gradient_norm):
+            break
+
+        previous = positions
         if optimizer == "adam":
             positions = _adam_update_positions(
                 positions,
@@ -994,20 +1593,187 @@ def optimize_context(
                 learning_rate,
             )
         positions = _sync_periodic_bound_cvs(context.source, positions)
+        steps = step
+
+        max_position_delta = 0.0
+        if monitor.step_tolerance > 0.0:
+            max_position_delta = max(((positions[i] - previous[i]).length() for i in cv_indices), default=0.0)
+        if monitor.should_stop_after_step(max_position_delta):
+            break
+
+    monitor.finish(lambda: compute_objective_loss(positions, context, smoothness_weight)[0])
+    return positions, steps
+
+
+def _optimize_array(
+    array_context: ArrayFitContext,
+    positions: list[om2.MPoint],
+    cv_indices: Sequence[int],
+    max_steps: int,
+    learning_rate: float,
+    beta: float,
+    optimizer: OptimizerName,
+    smoothness_weight: float,
+    adam_beta1: float,
+    adam_beta2: float,
+    adam_epsilon: float,
+    monitor: _ConvergenceMonitor,
+) -> tuple[list[om2.MPoint], int]:
+    cvs = _points_to_array(positions[:array_context.num_independent_cvs])
+    active = np.asarray(cv_indices, dtype=np.intp)
+    first_moment = np.zeros_like(cvs)
+    second_moment = np.zeros_like(cvs)
+
+    steps = 0
+    for step in range(1, max_steps + 1):
+        loss, gradients = compute_array_objective_loss_and_gradients(cvs, array_context, smoothness_weight)
+        max_gradient_norm = 0.0
+        if monitor.gradient_tolerance > 0.0 and active.size:
+            max_gradient_norm = float(np.sqrt(np.einsum("ij,ij->i", gradients[active], gradients[active])).max())
+        if monitor.should_stop_before_step(loss, max_gradient_norm):
+            break
+
+        previous = cvs[active] if monitor.step_tolerance > 0.0 else None
+        if optimizer == "adam":
+            _array_adam_update(
+                cvs,
+                first_moment,
+                second_moment,
+                gradients,
+                active,
+                learning_rate,
+                adam_beta1,
+                adam_beta2,
+                adam_epsilon,
+                step,
+            )
+        else:
+            _array_lion_update(cvs, first_moment, gradients, active, beta, learning_rate)
+        steps = step
+
+        max_position_delta = 0.0
+        if previous is not None and active.size:
+            delta = cvs[active] - previous
+            max_position_delta = float(np.sqrt(np.einsum("ij,ij->i", delta, delta)).max())
+        if monitor.should_stop_after_step(max_position_delta):
+            break
+
+    monitor.finish(lambda: compute_array_objective_loss(cvs, array_context, smoothness_weight)[0])
+    return _array_to_points(array_context.context.source, cvs), steps
 
+
+def optimize_context(
+    context: FitContext,
+    cv_indices: Sequence[int] | None = None,
+    num_iterations: int = 30,
+    learning_rate: float = 0.01,
+    beta: float = 0.9,
+    optimizer: OptimizerName = "adam",
+    smoothness_weight: float = 0.2,
+    smoothness_auto_scale: bool = True,
+    smoothness_complexity_gain: float = 1.0,
+    adam_beta1: float = 0.9,
+    adam_beta2: float = 0.999,
+    adam_epsilon: float = 1e-8,
+    symmetry: bool = False,
+    symmetry_axis: SymmetryAxis = "X",
+    backend: FitBackend = "auto",
+    relative_tolerance: float = 0.0,
+    gradient_tolerance: float = 0.0,
+    step_tolerance: float = 0.0,
+    max_iterations: int | None = None,
+) -> FitResult:
+    """Optimize the snapshot CV array without updating any scene curve.
+
+    ``backend`` selects the loop implementation. ``"numpy"`` runs the loss,
+    gradients and optimizer updates as array operations, ``"python"`` uses the
+    ``MVector`` based functions, and ``"auto"`` picks NumPy when it can be
+    imported. Both backends produce the same result within float tolerance.
+
+    ``optimizer="lstsq"`` skips the iterative loop and solves the normal
+    equations of the quadratic objective once; ``num_iterations`` and the
+    learning-rate settings are ignored in that mode.
+
+    With every tolerance at zero the loop runs exactly ``num_iterations``
+    steps. Setting any tolerance enables convergence control: the loop stops
+    once the relative objective change between steps, the largest active CV
+    gradient norm or the largest CV move of a step falls to its tolerance, and
+    ``max_iterations`` (default ``num_iterations``) caps the step count. The
+    steps taken and the per-step objective history are stored in the result.
+    """
+    cv_indices = _normalized_cv_indices(context.source, cv_indices)
     if symmetry:
-        positions = apply_symmetry_projection(context.source, positions, symmetry_axis)
+        _axis_index(symmetry_axis)
+    if optimizer not in ("adam", "lion", "lstsq"):
+        raise ValueError("Unsupported optimizer: {}".format(optimizer))
+    resolved_backend = _resolve_backend(backend)
 
-    final_objective_loss, final_loss, final_smoothness_loss = compute_objective_loss(
-        positions,
+    smoothness_weight_data = compute_effective_smoothness_weight(
         context,
-        effective_smoothness_weight,
+        cv_indices,
+        smoothness_weight,
+        smoothness_auto_scale,
+        smoothness_complexity_gain,
     )
+    effective_smoothness_weight, cv_scale, target_complexity, complexity_scale = smoothness_weight_data
+    positions = _sync_periodic_bound_cvs(context.source, context.source.cvs_world)
+
+    if resolved_backend == "numpy":
+        array_context = build_array_fit_context(context)
+
+        def objective_loss(points: PointSequence) -> tuple[float, float, float]:
+            cvs = _points_to_array(points[:array_context.num_independent_cvs])
+            return compute_array_objective_loss(cvs, array_context, effective_smoothness_weight)
+
+        run_optimizer = functools.partial(_optimize_array, array_context)
+    else:
+
+        def objective_loss(points: PointSequence) -> tuple[float, float, float]:
+            return compute_objective_loss(points, context, effective_smoothness_weight)
+
+        run_optimizer = functools.partial(_optimize_python, context)
+
+    monitor = _ConvergenceMonitor(relative_tolerance, gradient_tolerance, step_tolerance)
+    max_steps = num_iterations
+    if monitor.enabled and max_iterations is not None:
+        max_steps = max_iterations
+
+    initial_objective_loss, initial_loss, initial_smoothness_loss = objective_loss(positions)
+    if optimizer == "lstsq":
+        positions = solve_least_squares(
+            context,
+            positions,
+            cv_indices,
+            effective_smoothness_weight,
+            resolved_backend,
+        )
+        iterations = 1
+        monitor.loss_history = [initial_objective_loss, objective_loss(positions)[0]]
+        monitor.stop_reason = "closed_form"
+    else:
+        positions, iterations = run_optimizer(
+            positions,
+            cv_indices,
+            max_steps,
+            learning_rate,
+            beta,
+            optimizer,
+            effective_smoothness_weight,
+            adam_beta1,
+            adam_beta2,
+            adam_epsilon,
+            monitor,
+        )
+
+    if symmetry:
+        positions = apply_symmetry_projection(context.source, positions, symmetry_axis)
+
+    final_objective_loss, final_loss, final_smoothness_loss = objective_loss(positions)
     return FitResult(
         positions_world=positions,
         initial_loss=initial_loss,
         final_loss=final_loss,
-        iterations=num_iterations,
+        iterations=iterations,
         initial_smoothness_loss=initial_smoothness_loss,
         final_smoothness_loss=final_smoothness_loss,
         initial_objective_loss=initial_objective_loss,
@@ -1019,7 +1785,40 @@ def optimize_context(
         smoothness_complexity_scale=complexity_scale,
         symmetry=bool(symmetry),
         symmetry_axis=symmetry_axis.upper(),
+        backend=resolved_backend,
+        loss_history=monitor.loss_history,
+        converged=monitor.converged,
+        stop_reason=monitor.stop_reason,
+    )
+
+
+def _write_back_result(
+    mfn_curve: om2.MFnNurbsCurve,
+    context: FitContext,
+    result: FitResult,
+    undoable: bool,
+    undo_name: str,
+) -> None:
+    """Write optimized CVs to the scene and record the post-write losses."""
+    set_scene_cv_positions(
+        mfn_curve,
+        result.positions_world,
+        undoable=undoable,
+        undo_name=undo_name,
+    )
+    scene_positions = _sync_periodic_bound_cvs(
+        context.source,
+        mfn_curve.cvPositions(om2.MSpace.kWorld),
+    )
+    scene_objective, scene_distance, scene_smoothness = compute_objective_loss(
+        scene_positions,
+        context,
+        result.effective_smoothness_weight,
     )
+    result.scene_loss_after_write = scene_distance
+    result.scene_smoothness_loss_after_write = scene_smoothness
+    result.scene_objective_loss_after_write = scene_objective
+    result.max_write_error = _max_position_error(result.positions_world, scene_positions)
 
 
 def fit_curve_on_curve(
@@ -1042,6 +1841,11 @@ def fit_curve_on_curve(
     symmetry_axis: SymmetryAxis = "X",
     write_back: bool = True,
     undoable: bool = True,
+    backend: FitBackend = "auto",
+    relative_tolerance: float = 0.0,
+    gradient_tolerance: float = 0.0,
+    step_tolerance: float = 0.0,
+    max_iterations: int | None = None,
 ) -> FitResult:
     """Fit ``curve_a`` toward ``curve_b`` with no loop-time scene updates.
 
@@ -1049,6 +1853,9 @@ def fit_curve_on_curve(
     after the optimization loop. Set it false to benchmark or inspect the result
     without changing the scene. ``undoable`` controls whether that final write
     uses Maya commands so Ctrl+Z/redo can restore it as a single undo item.
+    ``backend`` and the convergence tolerances are passed to
+    :func:`optimize_context`. ``optimizer="lstsq"`` solves the fit in closed
+    form instead of running ``num_iterations`` steps.
     """
     mfn_a = _as_mfn_curve(curve_a)
     context = build_fit_context(
@@ -1072,29 +1879,20 @@ def fit_curve_on_curve(
         adam_epsilon=adam_epsilon,
         symmetry=symmetry,
         symmetry_axis=symmetry_axis,
+        backend=backend,
+        relative_tolerance=relative_tolerance,
+        gradient_tolerance=gradient_tolerance,
+        step_tolerance=step_tolerance,
+        max_iterations=max_iterations,
     )
 
     if write_back:
-        set_scene_cv_positions(
-            mfn_a,
-            result.positions_world,
-            undoable=undoable,
-            undo_name="fit_curve fit",
-        )
-        scene_positions = _sync_periodic_bound_cvs(
-            context.source,
-            mfn_a.cvPositions(om2.MSpace.kWorld),
-        )
-        scene_objective, scene_distance, scene_smoothness = compute_objective_loss(
-            scene_positions,
-            context,
-            result.effective_smoothness_weight,
-        )
-        result.scene_loss_after_write = scene_distance
-        result.scene_smoothness_loss_after_write = scene_smoothness
-        result.scene_objective_loss_after_write = scene_objective
-        result.max_write_error = _max_position_error(result.positions_world, scene_positions)
+        _write_back_result(mfn_a, context, result, undoable, "fit_curve fit")
 
+    om2.MGlobal.displayInfo("fit_curve backend: {}".format(result.backend))
+    om2.MGlobal.displayInfo(
+        "fit_curve iterations: {} ({})".format(result.iterations, result.stop_reason),
+    )
     om2.MGlobal.displayInfo(
         "fit_curve distance loss: {} -> {}".format(result.initial_loss, result.final_loss),
     )
@@ -1135,3 +1933,111 @@ def fit_curve_on_curve(
             ),
         )
     return result
+
+
+def fit_curves_batch(
+    pairs: Iterable[tuple[CurveLike, CurveLike]],
+    cv_indices: Sequence[int] | None = None,
+    num_samples: int = 100,
+    num_iterations: int = 30,
+    learning_rate: float = 0.01,
+    beta: float = 0.9,
+    source_sample_mode: SourceSampleMode = "parameter",
+    optimizer: OptimizerName = "adam",
+    smoothness_weight: float = 0.2,
+    smoothness_auto_scale: bool = True,
+    smoothness_complexity_gain: float = 1.0,
+    adam_beta1: float = 0.9,
+    adam_beta2: float = 0.999,
+    adam_epsilon: float = 1e-8,
+    symmetry: bool = False,
+    symmetry_axis: SymmetryAxis = "X",
+    write_back: bool = True,
+    undoable: bool = True,
+    backend: FitBackend = "auto",
+    relative_tolerance: float = 0.0,
+    gradient_tolerance: float = 0.0,
+    step_tolerance: float = 0.0,
+    max_iterations: int | None = None,
+    target_cache: TargetSampleCache | None = None,
+) -> BatchFitResult:
+    """Fit many ``(source, target)`` curve pairs with shared target sampling.
+
+    Every pair is optimized before any scene write, so a failing fit leaves the
+    scene untouched. The write-backs are then applied together in a single
+    undo chunk. Targets shared between pairs are sampled once through
+    ``target_cache``; pass a persistent :class:`TargetSampleCache` to reuse
+    samples across batches as well.
+    """
+    if target_cache is None:
+        target_cache = TargetSampleCache()
+    hits_before = target_cache.hits
+    misses_before = target_cache.misses
+
+    start_time = time.perf_counter()
+    fits = []
+    for curve_a, curve_b in pairs:
+        mfn_a = _as_mfn_curve(curve_a)
+        context = build_fit_context(
+            mfn_a,
+            curve_b,
+            num_samples=num_samples,
+            source_sample_mode=source_sample_mode,
+            target_cache=target_cache,
+        )
+        fits.append((mfn_a, context))
+    build_time = time.perf_counter()
+
+    results = [
+        optimize_context(
+            context,
+            cv_indices=cv_indices,
+            num_iterations=num_iterations,
+            learning_rate=learning_rate,
+            beta=beta,
+            optimizer=optimizer,
+            smoothness_weight=smoothness_weight,
+            smoothness_auto_scale=smoothness_auto_scale,
+            smoothness_complexity_gain=smoothness_complexity_gain,
+            adam_beta1=adam_beta1,
+            adam_beta2=adam_beta2,
+            adam_epsilon=adam_epsilon,
+            symmetry=symmetry,
+            symmetry_axis=symmetry_axis,
+            backend=backend,
+            relative_tolerance=relative_tolerance,
+            gradient_tolerance=gradient_tolerance,
+            step_tolerance=step_tolerance,
+            max_iterations=max_iterations,
+        )
+        for _, context in fits
+    ]
+    optimize_time = time.perf_counter()
+
+    if write_back and fits:
+        with _undo_chunk("fit_curve batch") if undoable else nullcontext():
+            for (mfn_a, context), result in zip(fits, results):
+                _write_back_result(mfn_a, context, result, undoable, "fit_curve batch")
+    write_time = time.perf_counter()
+
+    batch = BatchFitResult(
+        results=results,
+        build_seconds=build_time - start_time,
+        optimize_seconds=optimize_time - build_time,
+        write_seconds=write_time - optimize_time,
+        total_seconds=write_time - start_time,
+        target_cache_hits=target_cache.hits - hits_before,
+        target_cache_misses=target_cache.misses - misses_before,
+    )
+    om2.MGlobal.displayInfo(
+        "fit_curve batch: {} curves, build {:.3f}s, optimize {:.3f}s, write {:.3f}s, "
+        "target cache hits={}, misses={}".format(
+            len(results),
+            batch.build_seconds,
+            batch.optimize_seconds,
+            batch.write_seconds,
+            batch.target_cache_hits,
+            batch.target_cache_misses,
+        ),
+    )
+    return batch
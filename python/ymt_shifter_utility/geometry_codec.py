@@ -0,0 +1,212 @@
+"""Text container for serialized guide geometry.
+
+Guide surfaces are stored as attribute strings. The original format was the
+``repr`` of a dict of Python lists, which is large and has to be parsed back
+as Python source. This module writes a compact versioned container instead::
+
+    ymtgeo:<version>:<compression>:<base64 payload>
+
+The payload is ``MAGIC``, a little-endian ``(version, header length)`` pair,
+a JSON header and the raw bytes of every packed array. Arrays are stored as
+little-endian float32 (``"f"``), float64 (``"d"``) or int32 (``"i"``) and are
+referenced from the header by index, so any dict / list structure can carry
+them.
+
+:func:`decode` also reads the legacy ``repr`` strings, through
+:func:`ast.literal_eval`; nothing in here evaluates code.
+"""
+from __future__ import annotations
+
+import array
+import ast
+import base64
+import json
+import struct
+import sys
+import zlib
+from collections.abc import Iterable
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+PREFIX = "ymtgeo"
+FORMAT_VERSION = 1
+MAGIC = b"YMTG"
+ARRAY_TYPECODES = ("f", "d", "i")
+COMPRESSIONS = ("none", "zlib", "lz4")
+
+# Packed float data barely compresses better at higher levels, while the
+# cost grows several times over, so favour speed.
+ZLIB_LEVEL = 1
+
+_ARRAY_KEY = "__array__"
+_HEADER = struct.Struct("<HI")
+
+
+class PackedArray(object):
+    """Flat numeric array to be stored as raw bytes.
+
+    Arguments:
+        typecode (str): ``"f"`` float32, ``"d"`` float64 or ``"i"`` int32.
+        values (iterable of numbers): The values; nested point data must be
+            flattened first, see :func:`flatten`.
+    """
+
+    def __init__(self, typecode: str, values: Iterable[float]) -> None:
+        if typecode not in ARRAY_TYPECODES:
+            raise ValueError("Unsupported array typecode: {}".format(typecode))
+        self.typecode = typecode
+        self.values = _new_array(typecode, values)
+
+
+def _new_array(typecode: str, values: Iterable[float] | bytes = ()) -> array.array:
+    # array("i") is 4 bytes on every platform Maya supports, but make sure.
+    if typecode == "i" and array.array("i").itemsize != 4:
+        raise RuntimeError("array('i') is not 4 bytes on this platform.")
+
+    if isinstance(values, bytes):
+        result = array.array(typecode)
+        result.frombytes(values)
+        if sys.byteorder != "little":
+            result.byteswap()
+        return result
+
+    return array.array(typecode, values)
+
+
+def flatten(rows: Iterable[Iterable[float]]) -> list[float]:
+    """Flatten ``[(x, y, z), ...]`` into ``[x, y, z, ...]``."""
+    return [value for row in rows for value in row]
+
+
+def group(values: Iterable[float], size: int = 3) -> list[tuple[float, ...]]:
+    """Inverse of :func:`flatten` for rows of ``size`` values."""
+    it = iter(values)
+    return list(zip(*[it] * size))
+
+
+def has_lz4() -> bool:
+    return lz4_frame is not None
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "none":
+        return data
+    if compression == "zlib":
+        return zlib.compress(data, ZLIB_LEVEL)
+    if compression == "lz4":
+        if lz4_frame is None:
+            raise ValueError("lz4 compression requires the lz4 package.")
+        return lz4_frame.compress(data)
+    raise ValueError("Unsupported compression: {}".format(compression))
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "none":
+        return data
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "lz4":
+        if lz4_frame is None:
+            raise ValueError("This data is lz4 compressed, which requires the lz4 package.")
+        return lz4_frame.decompress(data)
+    raise ValueError("Unsupported compression: {}".format(compression))
+
+
+def encode(data: dict[str, object], compression: str = "zlib") -> str:
+    """Encode ``data`` into a container string.
+
+    ``data`` may hold JSON types and :class:`PackedArray` values at any depth.
+
+    Arguments:
+        data (dict): The data to encode.
+        compression (str): ``"zlib"``, ``"lz4"`` (needs the ``lz4`` package)
+            or ``"none"``.
+
+    Returns:
+        str: The container string.
+    """
+    blobs = []
+    table = []
+
+    def _pack(value: object) -> object:
+        if isinstance(value, PackedArray):
+            values = value.values
+            if sys.byteorder != "little":
+                values = array.array(values.typecode, values)
+                values.byteswap()
+            blob = values.tobytes()
+            table.append([value.typecode, len(blob)])
+            blobs.append(blob)
+            return {_ARRAY_KEY: len(table) - 1}
+        if isinstance(value, dict):
+            return {str(k): _pack(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_pack(v) for v in value]
+        return value
+
+    header = json.dumps({"data": _pack(data), "arrays": table}, separators=(",", ":")).encode("utf-8")
+    payload = MAGIC + _HEADER.pack(FORMAT_VERSION, len(header)) + header + b"".join(blobs)
+    encoded = base64.b64encode(_compress(payload, compression)).decode("ascii")
+
+    return "{}:{}:{}:{}".format(PREFIX, FORMAT_VERSION, compression, encoded)
+
+
+def is_container(text: str) -> bool:
+    return text.startswith(PREFIX + ":")
+
+
+def decode(text: str) -> dict[str, object]:
+    """Decode a container string, or a legacy ``repr`` string.
+
+    Packed arrays come back as :class:`array.array` objects.
+
+    Arguments:
+        text (str): The serialized string.
+
+    Returns:
+        dict: The decoded data.
+    """
+    if not is_container(text):
+        data = ast.literal_eval(text)
+        if not isinstance(data, dict):
+            raise ValueError("Serialized geometry must be a dict, got {}".format(type(data).__name__))
+        return data
+
+    try:
+        _, version, compression, encoded = text.split(":", 3)
+    except ValueError:
+        raise ValueError("Malformed geometry container header.")
+    if int(version) > FORMAT_VERSION:
+        raise ValueError("Geometry container version {} is newer than supported {}".format(version, FORMAT_VERSION))
+
+    payload = _decompress(base64.b64decode(encoded), compression)
+    if payload[:len(MAGIC)] != MAGIC:
+        raise ValueError("Geometry container payload is corrupted.")
+
+    offset = len(MAGIC)
+    _, header_length = _HEADER.unpack_from(payload, offset)
+    offset += _HEADER.size
+    header = json.loads(payload[offset:offset + header_length].decode("utf-8"))
+    offset += header_length
+
+    arrays = []
+    for typecode, length in header["arrays"]:
+        if typecode not in ARRAY_TYPECODES:
+            raise ValueError("Unsupported array typecode in container: {}".format(typecode))
+        arrays.append(_new_array(typecode, payload[offset:offset + length]))
+        offset += length
+
+    def _unpack(value: object) -> object:
+        if isinstance(value, dict):
+            if len(value) == 1 and _ARRAY_KEY in value:
+                return arrays[value[_ARRAY_KEY]]
+            return {k: _unpack(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_unpack(v) for v in value]
+        return value
+
+    return _unpack(header["data"])
@@ -4,10 +4,12 @@
 Provides functionality for matching, connecting, and constraining nodes in Maya.
 """
 import contextlib
+import json
 import math
 import os
 import re
 import sys
+import time
 import xml.etree.ElementTree as ET
 from collections.abc import Iterator, Sequence
 from logging import DEBUG, INFO, WARN, StreamHandler, getLogger  # NOQA
@@ -50,6 +52,13 @@ logger.addHandler(handler)
 logger.propagate = False
 
 
+# Marks definition entries compiled by load_definition: aliases are applied
+# and offsets are (value, relative) tokens.
+COMPILED_KEY = "__compiled__"
+COMPILED_FORMAT_VERSION = 1
+COMPILED_SUFFIX = ".compiled.json"
+
+
 ##############################################################################
 # Classes
 ##############################################################################
@@ -84,6 +93,8 @@ class MGOption:
 
         self.dst_multiple = dst_multiple
         self.alias_definition = None
+        self._alias = _identity
+        self._alias_stamp = None
 
         if self.alias_definition_path is not None and os.path.exists(self.alias_definition_path):
             self._load_alias_definition()
@@ -101,6 +112,8 @@ class MGOption:
             return
 
         logger.warning(f"alias_definition: {self.alias_definition_path}")
+        stat = os.stat(self.alias_definition_path)
+        self._alias_stamp = [os.path.abspath(self.alias_definition_path), stat.st_mtime_ns, stat.st_size]
         try:
             root = ET.parse(self.alias_definition_path).getroot()
             # 単純に root[0] 以下を解析する前提
@@ -115,80 +128,124 @@ class MGOption:
         except (ET.ParseError, IndexError) as e:
             logger.error(f"Failed to parse alias definition: {e}")
 
+        self._alias = compile_alias(self.alias_definition)
+
+    def alias_key(self) -> Optional[list[Any]]:
+        """JSON serializable key of the aliases resolve_src/resolve_dst apply."""
+        if self._alias is _identity or not (self.src_alias or self.dst_alias):
+            return None
+        return self._alias_stamp + [self.src_alias, self.dst_alias]
+
+    def resolve_src(self, name: str) -> str:
+        """Return the source name with the alias applied when src_alias is on."""
+        return self._alias(name) if self.src_alias else name
+
+    def resolve_dst(self, name: str) -> str:
+        """Return the destination name with the alias applied when dst_alias is on."""
+        return self._alias(name) if self.dst_alias else name
+
+
+class NodeCache:
+    """Per run cache of node name to MDagPath lookups.
+
+    Names are resolved once with ``cmds.ls`` and a single MSelectionList.
+    Cached paths that became invalid are looked up again, but the cache does
+    not notice renamed or newly created nodes, so use a fresh one per run.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, list[Union[OpenMaya2.MDagPath, OpenMaya2.MObject]]] = {}
+
+    def get_nodes(self, node_name: str) -> list[Union[OpenMaya2.MDagPath, OpenMaya2.MObject]]:
+        nodes = self._nodes.get(node_name)
+        if nodes is None or not all(_is_valid(n) for n in nodes):
+            nodes = _lookup_nodes(node_name)
+            self._nodes[node_name] = nodes
+        return nodes
+
+    def clear(self) -> None:
+        self._nodes.clear()
+
 
 ##############################################################################
 # Node Utility Functions
 ##############################################################################
 
 
-def get_node(node_name: str) -> Optional[OpenMaya2.MDagPath]:
-    """Get Maya node(s) by name.
+def _identity(name: str) -> str:
+    return name
 
-    Args:
-        node_name: The name of the node to get
 
-    Returns:
-        MDagPath object(s) for the node(s) or None if not found
-    """
+def _is_valid(node: Union[OpenMaya2.MDagPath, OpenMaya2.MObject]) -> bool:
+    if isinstance(node, OpenMaya2.MDagPath):
+        return node.isValid()
+    return not node.isNull()
+
+
+def _lookup_nodes(node_name: str) -> list[Union[OpenMaya2.MDagPath, OpenMaya2.MObject]]:
     candidates = cmds.ls(node_name, recursive=True)
     if not candidates:
-        return None
+        return []
 
-    results = []
+    selection = OpenMaya2.MSelectionList()
     for candidate in candidates:
         try:
-            selection = OpenMaya2.MGlobal.getSelectionListByName(candidate)
-            results.append(selection)
+            selection.add(candidate)
         except RuntimeError:
             pass
 
     dag_paths = []
-    for result in results:
+    for i in range(selection.length()):
         try:
-            dag_paths.append(result.getDagPath(0))
+            dag_paths.append(selection.getDagPath(i))
         except Exception:
             logger.error(f"Cannot getDagPath for {node_name}, using MObject instead")
-            dag_paths.append(result.getDependNode(0))
+            dag_paths.append(selection.getDependNode(i))
+
+    return dag_paths
+
+
+def get_node(node_name: str, cache: Optional[NodeCache] = None) -> Optional[OpenMaya2.MDagPath]:
+    """Get Maya node(s) by name.
+
+    Args:
+        node_name: The name of the node to get
+        cache: Optional NodeCache to resolve the name through
 
+    Returns:
+        MDagPath object(s) for the node(s) or None if not found
+    """
+    dag_paths = get_nodes(node_name, cache)
     if not dag_paths:
         return None
 
     return dag_paths[0]
 
 
-def get_nodes(node_name: str) -> Optional[list[OpenMaya2.MDagPath]]:
+def get_nodes(node_name: str, cache: Optional[NodeCache] = None) -> Optional[list[OpenMaya2.MDagPath]]:
     """Get Maya node(s) by name.
 
     Args:
         node_name: The name of the node to get
+        cache: Optional NodeCache to resolve the name through
 
     Returns:
         MDagPath object(s) for the node(s) or None if not found
     """
-    candidates = cmds.ls(node_name, recursive=True)
-    if not candidates:
-        return None
-
-    results = []
-    for candidate in candidates:
-        try:
-            selection = OpenMaya2.MGlobal.getSelectionListByName(candidate)
-            results.append(selection)
-        except RuntimeError:
-            pass
-
-    dag_paths = []
-    for result in results:
-        try:
-            dag_paths.append(result.getDagPath(0))
-        except Exception:
-            logger.error(f"Cannot getDagPath for {node_name}, using MObject instead")
-            dag_paths.append(result.getDependNode(0))
+    if cache is not None:
+        dag_paths = cache.get_nodes(node_name)
+    else:
+        dag_paths = _lookup_nodes(node_name)
 
     if not dag_paths:
         return None
 
-    return dag_paths
+    return list(dag_paths)
+
+
+def short_name(dag_path: OpenMaya2.MDagPath) -> str:
+    """Return the node name of a dag path without parents and namespaces."""
+    return dag_path.partialPathName().rsplit("|", 1)[-1].rsplit(":", 1)[-1]
 
 
 def apply_alias(name: str, definition: dict[str, str]) -> str:
@@ -206,6 +263,31 @@ def apply_alias(name: str, definition: dict[str, str]) -> str:
     return name
 
 
+def compile_alias(definition: Optional[dict[str, str]]) -> Callable[[str], str]:
+    """Build an alias resolver from a definition once.
+
+    Aliases are exact name matches, so the table is a plain dict with the
+    empty entries dropped; the returned callable does the same as
+    ``apply_alias(name, definition)`` with a single lookup.
+
+    Args:
+        definition: Alias definition dictionary
+
+    Returns:
+        Callable mapping a name to its alias, or to itself
+    """
+    table = {k: v for k, v in (definition or {}).items() if k and v}
+    if not table:
+        return _identity
+
+    lookup = table.get
+
+    def resolve(name: str) -> str:
+        return lookup(name, name)
+
+    return resolve
+
+
 ##############################################################################
 # Transform Functions
 ##############################################################################
@@ -436,22 +518,45 @@ def maintain_children(target: str) -> Iterator[None]:
 ##############################################################################
 
 
-def __tokenize_offset(
-    node: str,
-    offset: Union[str, Sequence[Union[str, float]]],
-    mode: str = "t",
-) -> list[float]:
-    """Tokenize offset values, resolving any relative offsets like "2.5x".
+def parse_offset(offset: Union[str, Sequence[Union[str, float]]]) -> list[tuple[float, bool]]:
+    """Pre-tokenize offset values into (value, relative) pairs.
+
+    "2.5x" becomes (2.5, True), meaning relative to the local transform of
+    the node the offset is applied to, and plain numbers (value, False).
 
     Args:
-        node: Node to apply offset to (str)
         offset: Offset values or specifications
-        mode: 't' for translation, 'r' for rotation
 
     Returns:
-        List of float offset values
+        List of (value, relative) pairs
     """
-    matrix = cmds.xform(node, query=True, os=True, matrix=True)
+    tokens = []
+    for val in offset:
+        if isinstance(val, six.string_types) and val.endswith("x"):
+            try:
+                tokens.append((float(val[:-1]), True))
+            except ValueError:
+                logger.warning(f"Invalid ratio format: {val}")
+                tokens.append((0.0, False))
+            continue
+        # absolute value
+        try:
+            tokens.append((float(val), False))
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid offset value: {val}")
+            tokens.append((0.0, False))
+    return tokens
+
+
+def _resolve_offset(
+    matrix: OpenMaya2.MMatrix,
+    tokens: Sequence[tuple[float, bool]],
+    mode: str = "t",
+) -> list[float]:
+    """Resolve pre-tokenized offset values against a local matrix."""
+    if not any(relative for _, relative in tokens):
+        return [value for value, _ in tokens]
+
     m1 = OpenMaya2.MMatrix(matrix)
     m2 = OpenMaya2.MMatrix(matrix)
 
@@ -462,76 +567,107 @@ def __tokenize_offset(
 
     norm_mat = m1 * m2.inverse()
     norm_xform = OpenMaya2.MTransformationMatrix(norm_mat)
-    norm_pos = norm_xform.translation(OpenMaya2.MSpace.kTransform)
-    norm_rot = norm_xform.rotation().asVector()
+    if mode == "r":
+        norm = norm_xform.rotation().asVector()
+    else:
+        norm = norm_xform.translation(OpenMaya2.MSpace.kTransform)
 
-    def _tokenize_value(val: Union[str, float], idx: int) -> float:
-        # e.g. "2.5x" means relative to local transform
-        if isinstance(val, six.string_types) and val.endswith("x"):
-            try:
-                ratio = float(val[:-1])
-                if mode == "t":
-                    return norm_pos[idx] * ratio
-                elif mode == "r":
-                    return norm_rot[idx] * ratio
-            except ValueError:
-                logger.warning(f"Invalid ratio format: {val}")
-                return 0.0
-        # absolute value
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid offset value: {val}")
-            return 0.0
+    return [norm[i] * value if relative else value for i, (value, relative) in enumerate(tokens)]
 
-    return [_tokenize_value(x, i) for i, x in enumerate(offset)]
 
+def __tokenize_offset(
+    node: str,
+    offset: Union[str, Sequence[Union[str, float]]],
+    mode: str = "t",
+) -> list[float]:
+    """Tokenize offset values, resolving any relative offsets like "2.5x".
 
-def do_match(
+    Args:
+        node: Node to apply offset to (str)
+        offset: Offset values or specifications
+        mode: 't' for translation, 'r' for rotation
+
+    Returns:
+        List of float offset values
+    """
+    matrix = cmds.xform(node, query=True, os=True, matrix=True)
+    return _resolve_offset(OpenMaya2.MMatrix(matrix), parse_offset(offset), mode)
+
+
+def _offset_tokens(entry: dict[str, Any], key: str) -> Optional[list[tuple[float, bool]]]:
+    """Offset of an entry as tokens, compiled entries already carry them."""
+    offset = entry.get(key)
+    if not offset:
+        return None
+    if entry.get(COMPILED_KEY):
+        return [(value, relative) for value, relative in offset]
+    return parse_offset(offset)
+
+
+def _resolve_match(
     entry: dict[str, Any],
-    selection: Optional[list[str]] = None,
+    selection: Optional[Union[set[str], list[str]]] = None,
     option: Optional[MGOption] = None,
-    preserve_children: bool = False,
-) -> None:
-    """Match transform of source node to destination node.
+    cache: Optional[NodeCache] = None,
+) -> Optional[tuple[OpenMaya2.MDagPath, OpenMaya2.MDagPath, list[str]]]:
+    """Resolve the source, destination and mode of a match entry.
 
-    Args:
-        entry: Dict defining the match operation (must contain "src", "dst", etc.)
-        selection: List of selected nodes to restrict operation to
-        option: MGOption for alias handling, etc.
-        preserve_children: Whether to preserve children hierarchies during match
+    Returns:
+        (source, destination, mode) or None when the entry is skipped
     """
     s_query = util.displayable_path(entry["src"])
     d_query = util.displayable_path(entry["dst"])
 
     if not s_query:
         logger.debug(f"Skipping match, no source found in entry: {entry}")
-        return
+        return None
 
-    if option and option.alias_definition is not None:
-        if option.src_alias:
-            s_query = apply_alias(s_query, option.alias_definition)
-        if option.dst_alias:
-            d_query = apply_alias(d_query, option.alias_definition)
+    if option and not entry.get(COMPILED_KEY):
+        s_query = option.resolve_src(s_query)
+        d_query = option.resolve_dst(d_query)
 
-    source = get_node(s_query)
-    destination = get_node(d_query)
+    source = get_node(s_query, cache)
+    destination = get_node(d_query, cache)
 
     if selection is not None and destination:
         # Check short name to see if it is in selection
-        d_short_name = destination.fullPathName().split("|")[-1].split(":")[-1]
+        d_short_name = short_name(destination)
         if d_short_name not in selection:
             logger.debug(f"Skipping match, destination {d_short_name} not in selection.")
-            return
+            return None
 
     if not source or not destination:
         logger.debug(f"Skipping match, missing src or dst: {s_query}, {d_query}")
-        return
+        return None
 
     mode = entry.get("mode", ["t"])
     if isinstance(mode, six.string_types):
         mode = [mode]
 
+    return source, destination, mode
+
+
+def do_match(
+    entry: dict[str, Any],
+    selection: Optional[Union[set[str], list[str]]] = None,
+    option: Optional[MGOption] = None,
+    preserve_children: bool = False,
+    cache: Optional[NodeCache] = None,
+) -> None:
+    """Match transform of source node to destination node.
+
+    Args:
+        entry: Dict defining the match operation (must contain "src", "dst", etc.)
+        selection: Set of selected node names to restrict operation to
+        option: MGOption for alias handling, etc.
+        preserve_children: Whether to preserve children hierarchies during match
+        cache: Optional NodeCache shared by the entries of a run
+    """
+    resolved = _resolve_match(entry, selection, option, cache)
+    if resolved is None:
+        return
+    source, destination, mode = resolved
+
     def _perform_match() -> None:
         logger.info(f"Matching mode({mode}) destination: {destination}, source: {source}")
 
@@ -540,9 +676,10 @@ def do_match(
             translation = get_translation(source)
             set_translation(destination, translation)
 
-            t_offset = entry.get("t_offset")
+            t_offset = _offset_tokens(entry, "t_offset")
             if t_offset:
-                t_val = __tokenize_offset(destination.fullPathName(), t_offset, "t")
+                matrix = cmds.xform(destination.fullPathName(), query=True, os=True, matrix=True)
+                t_val = _resolve_offset(OpenMaya2.MMatrix(matrix), t_offset, "t")
                 cmds.move(t_val[0], t_val[1], t_val[2],
                           destination.fullPathName(),
                           os=True, relative=True, worldSpaceDistance=True)
@@ -552,9 +689,10 @@ def do_match(
             try:
                 quat = get_rotation(source)
                 set_rotation(destination, quat)
-                r_offset = entry.get("r_offset")
+                r_offset = _offset_tokens(entry, "r_offset")
                 if r_offset:
-                    r_val = __tokenize_offset(destination.fullPathName(), r_offset, "r")
+                    matrix = cmds.xform(destination.fullPathName(), query=True, os=True, matrix=True)
+                    r_val = _resolve_offset(OpenMaya2.MMatrix(matrix), r_offset, "r")
                     cmds.rotate(r_val[0], r_val[1], r_val[2],
                                 destination.fullPathName(),
                                 os=True, r=True)
@@ -568,12 +706,256 @@ def do_match(
         _perform_match()
 
 
-def do_connect(entry: dict[str, Any], option: Optional[MGOption] = None) -> None:
+def _current_world(
+    path: OpenMaya2.MDagPath,
+    planned: dict[str, OpenMaya2.MMatrix],
+    preserve_children: bool,
+) -> OpenMaya2.MMatrix:
+    """World matrix of path once the planned matrices are applied."""
+    planned_world = planned.get(path.fullPathName())
+    if planned_world is not None:
+        return planned_world
+
+    # Preserved children keep their world matrix, otherwise they follow
+    # a planned ancestor.
+    if preserve_children or path.length() <= 1:
+        return path.inclusiveMatrix()
+
+    parent = OpenMaya2.MDagPath(path)
+    parent.pop()
+    local = path.inclusiveMatrix() * path.exclusiveMatrixInverse()
+    return local * _current_world(parent, planned, preserve_children)
+
+
+def _parent_world(
+    path: OpenMaya2.MDagPath,
+    planned: dict[str, OpenMaya2.MMatrix],
+    preserve_children: bool,
+) -> OpenMaya2.MMatrix:
+    if path.length() <= 1:
+        return OpenMaya2.MMatrix()
+    parent = OpenMaya2.MDagPath(path)
+    parent.pop()
+    return _current_world(parent, planned, preserve_children)
+
+
+def _match_world(
+    world: OpenMaya2.MMatrix,
+    parent_world: OpenMaya2.MMatrix,
+    source_world: OpenMaya2.MMatrix,
+    mode: list[str],
+    t_offset: Optional[Sequence[tuple[float, bool]]],
+    r_offset: Optional[Sequence[tuple[float, bool]]],
+) -> OpenMaya2.MMatrix:
+    """Compute the world matrix do_match would leave the destination at."""
+    xform = OpenMaya2.MTransformationMatrix(world)
+    source_xform = OpenMaya2.MTransformationMatrix(source_world)
+    parent_inverse = parent_world.inverse()
+
+    if "t" in mode:
+        xform.setTranslation(source_xform.translation(OpenMaya2.MSpace.kWorld), OpenMaya2.MSpace.kWorld)
+        if t_offset:
+            # cmds.move(os=True, relative=True, worldSpaceDistance=True)
+            t_val = _resolve_offset(xform.asMatrix() * parent_inverse, t_offset, "t")
+            delta = OpenMaya2.MVector(t_val[0], t_val[1], t_val[2]).rotateBy(xform.rotation(asQuaternion=True))
+            xform.translateBy(delta, OpenMaya2.MSpace.kWorld)
+
+    if "r" in mode:
+        quat = source_xform.rotation(asQuaternion=True)
+        xform.setRotation(quat)
+        if r_offset:
+            # cmds.rotate(os=True, r=True)
+            r_val = _resolve_offset(xform.asMatrix() * parent_inverse, r_offset, "r")
+            euler = OpenMaya2.MEulerRotation(math.radians(r_val[0]), math.radians(r_val[1]), math.radians(r_val[2]))
+            xform.setRotation(euler.asQuaternion() * quat)
+
+    return xform.asMatrix()
+
+
+def plan_matches(
+    entries: Sequence[dict[str, Any]],
+    selection: Optional[Union[set[str], list[str]]] = None,
+    option: Optional[MGOption] = None,
+    preserve_children: bool = False,
+    cache: Optional[NodeCache] = None,
+) -> list[tuple[OpenMaya2.MDagPath, OpenMaya2.MMatrix]]:
+    """Resolve match entries and compute the destination world matrices.
+
+    Nothing in the scene is changed. Entries are processed parents first
+    (by destination depth, file order within a depth), each one seeing the
+    matrices planned for the entries before it in that order. This is not
+    file order: when the file matches a child before its parent, or reads a
+    source that a later entry moves, the result differs from applying the
+    entries one by one with do_match.
+
+    Args:
+        entries: Match entries of a domain
+        selection: Set of selected node names to restrict operation to
+        option: MGOption for alias handling, etc.
+        preserve_children: Whether children keep their world matrix
+        cache: Optional NodeCache shared by the entries of a run
+
+    Returns:
+        (destination, world matrix) pairs in parent first order
+    """
+    resolved = []
+    for index, entry in enumerate(entries):
+        result = _resolve_match(entry, selection, option, cache)
+        if result is None:
+            continue
+        if not isinstance(result[1], OpenMaya2.MDagPath):
+            logger.error(f"Skipping match, destination of {entry} is not a dag node.")
+            continue
+        resolved.append((result[1].length(), index, entry, result))
+    resolved.sort(key=lambda item: item[:2])
+
+    planned: dict[str, OpenMaya2.MMatrix] = {}
+    paths: dict[str, OpenMaya2.MDagPath] = {}
+    for _, _, entry, (source, destination, mode) in resolved:
+        key = destination.fullPathName()
+        if isinstance(source, OpenMaya2.MDagPath):
+            source_world = _current_world(source, planned, preserve_children)
+        else:
+            source_world = OpenMaya2.MMatrix()
+
+        planned[key] = _match_world(
+            _current_world(destination, planned, preserve_children),
+            _parent_world(destination, planned, preserve_children),
+            source_world,
+            mode,
+            _offset_tokens(entry, "t_offset"),
+            _offset_tokens(entry, "r_offset"),
+        )
+        paths.setdefault(key, destination)
+
+    return [(paths[key], world) for key, world in planned.items()]
+
+
+def _joint_orient(path: OpenMaya2.MDagPath) -> OpenMaya2.MQuaternion:
+    node = OpenMaya2.MFnDependencyNode(path.node())
+    if not node.hasAttribute("jointOrient"):
+        return OpenMaya2.MQuaternion()
+    plug = node.findPlug("jointOrient", False)
+    return OpenMaya2.MEulerRotation(
+        plug.child(0).asDouble(),
+        plug.child(1).asDouble(),
+        plug.child(2).asDouble(),
+    ).asQuaternion()
+
+
+def _local_channels(
+    path: OpenMaya2.MDagPath,
+    local: OpenMaya2.MMatrix,
+) -> tuple[OpenMaya2.MVector, OpenMaya2.MEulerRotation]:
+    """Translate and rotate channel values giving path the local matrix.
+
+    Pivots, rotate axis, rotate order and joint orient are compensated, scale
+    and shear are left as they are.
+    """
+    fn = OpenMaya2.MFnTransform(path)
+    current = fn.transformation()
+    local_xform = OpenMaya2.MTransformationMatrix(local)
+
+    # local rotation = rotateAxis * rotate * jointOrient
+    rotate = (
+        current.rotationOrientation().inverse()
+        * local_xform.rotation(asQuaternion=True)
+        * _joint_orient(path).inverse()
+    )
+    order = fn.findPlug("rotateOrder", False).asShort()
+    euler = rotate.asEulerRotation()
+    euler.reorderIt(order)
+
+    current.setRotation(euler)
+    current.setTranslation(OpenMaya2.MVector(), OpenMaya2.MSpace.kTransform)
+    pivot_offset = OpenMaya2.MTransformationMatrix(current.asMatrix()).translation(OpenMaya2.MSpace.kTransform)
+    translate = local_xform.translation(OpenMaya2.MSpace.kTransform) - pivot_offset
+
+    return translate, euler
+
+
+def apply_match_plan(
+    plan: Sequence[tuple[OpenMaya2.MDagPath, OpenMaya2.MMatrix]],
+    preserve_children: bool = False,
+    undoable: bool = True,
+) -> None:
+    """Write the world matrices of plan_matches in one pass.
+
+    All local matrices are computed before the first write. With
+    preserve_children, children that are not in the plan get local
+    matrices that keep their current world matrix instead of being
+    reparented.
+
+    Args:
+        plan: (destination, world matrix) pairs from plan_matches
+        preserve_children: Whether children keep their world matrix
+        undoable: Write through setAttr in a single undo chunk, otherwise
+            through MFnTransform, which is faster but cannot be undone
+    """
+    planned = {path.fullPathName(): world for path, world in plan}
+
+    writes = []
+    for path, world in plan:
+        parent_world = _parent_world(path, planned, preserve_children)
+        writes.append((path, world * parent_world.inverse()))
+
+        if not preserve_children:
+            continue
+
+        for i in range(path.childCount()):
+            child_obj = path.child(i)
+            if not child_obj.hasFn(OpenMaya2.MFn.kTransform):
+                continue
+            child = OpenMaya2.MDagPath(path)
+            child.push(child_obj)
+            if child.fullPathName() in planned:
+                continue
+            writes.append((child, child.inclusiveMatrix() * world.inverse()))
+
+    channels = []
+    for path, local in writes:
+        translate, euler = _local_channels(path, local)
+        channels.append((path, translate, euler))
+
+    if not undoable:
+        for path, translate, euler in channels:
+            fn = OpenMaya2.MFnTransform(path)
+            fn.setTranslation(translate, OpenMaya2.MSpace.kTransform)
+            fn.setRotation(euler, OpenMaya2.MSpace.kTransform)
+        return
+
+    linear_unit = OpenMaya2.MDistance.uiUnit()
+    angular_unit = OpenMaya2.MAngle.uiUnit()
+    cmds.undoInfo(openChunk=True, chunkName="match_guide")
+    try:
+        for path, translate, euler in channels:
+            name = path.fullPathName()
+            try:
+                cmds.setAttr(
+                    f"{name}.translate",
+                    *[OpenMaya2.MDistance(v).asUnits(linear_unit) for v in (translate.x, translate.y, translate.z)]
+                )
+                cmds.setAttr(
+                    f"{name}.rotate",
+                    *[OpenMaya2.MAngle(v).asUnits(angular_unit) for v in (euler.x, euler.y, euler.z)]
+                )
+            except RuntimeError as e:
+                logger.error(f"Failed to apply match to {name}: {e}")
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def do_connect(
+    entry: dict[str, Any],
+    option: Optional[MGOption] = None,
+    cache: Optional[NodeCache] = None,
+) -> None:
     """Connect or constrain one node to another.
 
     Args:
         entry: Dict defining the connection (contains "src", "dst", "mode", etc.)
         option: MGOption for alias handling, etc.
+        cache: Optional NodeCache shared by the entries of a run
     """
     def _connect_single(
         src_query: str,
@@ -581,19 +963,17 @@ def do_connect(entry: dict[str, Any], option: Optional[MGOption] = None) -> None
         _mode: str,
         _weight: Optional[float] = None,
     ) -> None:
-        if option and option.alias_definition:
-            if option.src_alias:
-                src_query = apply_alias(src_query, option.alias_definition)
-            if option.dst_alias:
-                dst_query = apply_alias(dst_query, option.alias_definition)
+        if option and not entry.get(COMPILED_KEY):
+            src_query = option.resolve_src(src_query)
+            dst_query = option.resolve_dst(dst_query)
 
         dst_multi = option.dst_multiple if option else False
 
-        source = get_node(src_query)
+        source = get_node(src_query, cache)
         if dst_multi:
-            destination = get_node(dst_query)
+            destination = get_node(dst_query, cache)
         else:
-            destination = get_nodes(dst_query)
+            destination = get_nodes(dst_query, cache)
 
         if not source or not destination:
             if not source:
@@ -628,6 +1008,153 @@ def do_connect(entry: dict[str, Any], option: Optional[MGOption] = None) -> None
         _connect_single(s_query, d_query, _mode)
 
 
+##############################################################################
+# Definition Files
+##############################################################################
+
+# (path, mtime, size, alias key) -> compiled domains
+_definition_cache: dict[tuple[Any, ...], dict[str, list[dict[str, Any]]]] = {}
+
+
+def _compile_entry(entry: dict[str, Any], option: Optional[MGOption]) -> dict[str, Any]:
+    compiled = dict(entry)
+    compiled[COMPILED_KEY] = 1
+
+    resolve_src = option.resolve_src if option else _identity
+    resolve_dst = option.resolve_dst if option else _identity
+
+    src = entry.get("src")
+    if isinstance(src, list):
+        compiled["src"] = [
+            dict(item, src=resolve_src(item["src"])) if isinstance(item, dict) and item.get("src") else item
+            for item in src
+        ]
+    elif src:
+        compiled["src"] = resolve_src(src)
+
+    dst = entry.get("dst")
+    if dst:
+        compiled["dst"] = resolve_dst(dst)
+
+    for key in ("t_offset", "r_offset"):
+        if entry.get(key):
+            compiled[key] = [list(token) for token in parse_offset(entry[key])]
+
+    return compiled
+
+
+def compile_definition(
+    config: dict[str, Any],
+    option: Optional[MGOption] = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Validate a parsed definition and compile its entries.
+
+    Every list of entries is kept, entries that are not dicts are dropped
+    with a warning. Compiled entries have the aliases of option applied and
+    their offsets pre-tokenized (see parse_offset), and are accepted by
+    do_match / do_connect like the raw ones.
+
+    Args:
+        config: Parsed YAML or JSON definition
+        option: MGOption for alias handling, etc.
+
+    Returns:
+        Domain to compiled entries
+    """
+    domains = {}
+    for domain, entries in config.items():
+        if not isinstance(entries, list):
+            continue
+        compiled = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                logger.warning(f"Skipping invalid entry in '{domain}': {entry}")
+                continue
+            compiled.append(_compile_entry(entry, option))
+        domains[str(domain)] = compiled
+    return domains
+
+
+def _read_compiled(path: str, stamp: list[Any]) -> Optional[dict[str, list[dict[str, Any]]]]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # a truncated or hand edited file is treated as stale, not as an error
+    if not isinstance(data, dict):
+        return None
+    if data.get("version") != COMPILED_FORMAT_VERSION or data.get("stamp") != stamp:
+        return None
+
+    domains = data.get("domains")
+    if not isinstance(domains, dict) or not all(isinstance(entries, list) for entries in domains.values()):
+        return None
+    return domains
+
+
+def _write_compiled(path: str, stamp: list[Any], domains: dict[str, list[dict[str, Any]]]) -> None:
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"version": COMPILED_FORMAT_VERSION, "stamp": stamp, "domains": domains}, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write compiled definition {path}: {e}")
+
+
+def load_definition(
+    def_file_name: str,
+    option: Optional[MGOption] = None,
+    persist: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Load and compile a definition file, through a cache.
+
+    Results are cached per path, modification time, size and the aliases
+    of option, so repeated runs on an unchanged file skip parsing. With
+    persist, the compiled form is also written next to the file as
+    "<file>.compiled.json" and read back by later sessions instead of the
+    YAML.
+
+    Args:
+        def_file_name: YAML or JSON configuration file
+        option: MGOption for alias handling, etc.
+        persist: Whether to read and write the compiled file
+
+    Returns:
+        Domain to compiled entries
+    """
+    stat = os.stat(def_file_name)
+    alias_key = option.alias_key() if option else None
+    stamp = [stat.st_mtime_ns, stat.st_size, alias_key]
+    key = (os.path.abspath(def_file_name), stat.st_mtime_ns, stat.st_size, json.dumps(alias_key))
+
+    domains = _definition_cache.get(key)
+    if domains is not None:
+        return domains
+
+    compiled_path = def_file_name + COMPILED_SUFFIX
+    if persist:
+        domains = _read_compiled(compiled_path, stamp)
+
+    if domains is None:
+        config = anyconfig.load(def_file_name)
+        if not isinstance(config, dict):
+            raise ValueError(f"Config file does not contain a valid dict: {def_file_name}")
+        domains = compile_definition(config, option)
+        if persist:
+            _write_compiled(compiled_path, stamp, domains)
+
+    _definition_cache[key] = domains
+    return domains
+
+
+def clear_definition_cache() -> None:
+    """Drop every cached definition."""
+    _definition_cache.clear()
+
+
 ##############################################################################
 # Top-level Functions
 ##############################################################################
@@ -637,6 +1164,9 @@ def match(
     def_file_name: str = "test.yaml",
     domain: str = "guide_on_bone",
     option: Optional[MGOption] = None,
+    batched: bool = False,
+    preserve_children: bool = False,
+    persist: bool = False,
 ) -> None:
     """Match transforms based on configuration file.
 
@@ -644,18 +1174,31 @@ def match(
         def_file_name: YAML or JSON configuration file
         domain: Domain (key) to read from configuration
         option: MGOption for alias handling, etc.
+        batched: Compute every destination matrix first, parents first
+            rather than in file order, and write them in one pass (see
+            plan_matches / apply_match_plan)
+        preserve_children: Whether children hierarchies keep their world
+            matrix during the match
+        persist: Whether to keep the compiled definition next to the file
     """
     try:
-        match_entries = anyconfig.load(def_file_name)
-        if not isinstance(match_entries, dict):
-            raise ValueError(f"Config file does not contain a valid dict: {def_file_name}")
+        match_entries = load_definition(def_file_name, option, persist)
 
-        selection = cmds.ls(sl=True)  # current selection
+        start = time.perf_counter()
+        selection = set(cmds.ls(sl=True))  # current selection
+        cache = NodeCache()
+        entries = match_entries.get(domain, [])
 
-        for entry in match_entries.get(domain, []):
-            logger.info(f"Processing entry: {entry}")
+        if batched:
+            plan = plan_matches(entries, selection, option, preserve_children, cache)
+            apply_match_plan(plan, preserve_children)
+        else:
+            for entry in entries:
+                logger.info(f"Processing entry: {entry}")
 
-            do_match(entry, selection, option)
+                do_match(entry, selection, option, preserve_children, cache)
+
+        logger.info(f"Matched {len(entries)} entries of '{domain}' in {time.perf_counter() - start:.3f}s")
     except Exception as e:
         logger.error(f"Error in match operation: {e}")
         logger.exception("Traceback:")
@@ -665,6 +1208,7 @@ def connect_on_deformer(
     def_file_name: str = "test.yaml",
     domain: str = "bone_on_deformer",
     option: Optional[MGOption] = None,
+    persist: bool = False,
 ) -> None:
     """Connect nodes based on configuration file.
 
@@ -672,17 +1216,24 @@ def connect_on_deformer(
         def_file_name: YAML or JSON configuration file
         domain: Domain (key) to read from configuration
         option: MGOption for alias handling, etc.
+        persist: Whether to keep the compiled definition next to the file
     """
     try:
-        config_map = anyconfig.load(def_file_name)
-        if not config_map or not isinstance(config_map, dict):
+        config_map = load_definition(def_file_name, option, persist)
+        if not config_map:
             raise ValueError(f"Could not load config as dict from file: {def_file_name}")
 
-        for entry in config_map.get(domain, []):
+        start = time.perf_counter()
+        cache = NodeCache()
+        entries = config_map.get(domain, [])
+
+        for entry in entries:
             try:
-                do_connect(entry, option=option)
+                do_connect(entry, option=option, cache=cache)
             except RuntimeError as ex:
                 logger.error(f"Connection error for entry {entry}: {ex}")
+
+        logger.info(f"Connected {len(entries)} entries of '{domain}' in {time.perf_counter() - start:.3f}s")
     except Exception as e:
         logger.error(f"Error in connect_on_deformer: {e}")
         logger.exception("Traceback:")
@@ -0,0 +1,171 @@
+"""Uniform grid index for nearest point queries.
+
+The index only depends on plain float triples, so it can be filled from
+``MFnMesh.getPoints`` or any other point source and queried many times
+without walking the geometry again.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+
+
+Point3 = Sequence[float]
+
+
+class PointGridIndex(object):
+    """Nearest point lookup over a fixed point set.
+
+    Points are bucketed into cubic cells sized for a handful of points per
+    cell. A query scans rings of cells around the query cell and stops once
+    no unvisited cell can hold a closer point, so typical queries touch only
+    a few cells regardless of the point count.
+
+    Arguments:
+        points (list of float triples): Points to index, in any space.
+        points_per_cell (float): Target average point count per cell.
+    """
+
+    def __init__(self, points: Iterable[Point3], points_per_cell: float = 8.0) -> None:
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.zs: list[float] = []
+        for point in points:
+            self.xs.append(float(point[0]))
+            self.ys.append(float(point[1]))
+            self.zs.append(float(point[2]))
+
+        self.cells: dict[tuple[int, int, int], list[int]] = {}
+        if not self.xs:
+            self.minimum = (0.0, 0.0, 0.0)
+            self.maximum = (0.0, 0.0, 0.0)
+            self.cell_size = 1.0
+            self.dims = (0, 0, 0)
+            return
+
+        self.minimum = (min(self.xs), min(self.ys), min(self.zs))
+        self.maximum = (max(self.xs), max(self.ys), max(self.zs))
+        extents = [hi - lo for lo, hi in zip(self.minimum, self.maximum)]
+        self.cell_size = self._cell_size_for(extents, len(self.xs), points_per_cell)
+        self.dims = tuple(int(extent / self.cell_size) + 1 for extent in extents)
+
+        for index, key in enumerate(zip(self.xs, self.ys, self.zs)):
+            self.cells.setdefault(self._cell_of(key), []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    @staticmethod
+    def _cell_size_for(extents: Sequence[float], count: int, points_per_cell: float) -> float:
+        # Degenerate axes (flat or linear point sets) do not contribute volume,
+        # so size the cells from the non-zero extents only. Axes thinner than
+        # a cell are one cell deep anyway; dropping them keeps a nearly flat
+        # set from being cut into far more cells than points.
+        spread = [extent for extent in extents if extent > 0.0]
+        if not spread:
+            return 1.0
+
+        cell_count = max(1.0, count / max(points_per_cell, 1.0))
+        while True:
+            measure = 1.0
+            for extent in spread:
+                measure *= extent
+            size = max((measure / cell_count) ** (1.0 / len(spread)), max(spread) * 1e-6)
+            thick = [extent for extent in spread if extent >= size]
+            if len(thick) == len(spread):
+                return size
+            spread = thick
+
+    def _cell_of(self, point: Point3) -> tuple[int, int, int]:
+        size = self.cell_size
+        return (
+            min(max(int((point[0] - self.minimum[0]) / size), 0), self.dims[0] - 1),
+            min(max(int((point[1] - self.minimum[1]) / size), 0), self.dims[1] - 1),
+            min(max(int((point[2] - self.minimum[2]) / size), 0), self.dims[2] - 1),
+        )
+
+    def _ring(self, center: tuple[int, int, int], radius: int) -> Iterable[tuple[int, int, int]]:
+        """Yield the in-grid cells at Chebyshev distance ``radius`` from ``center``.
+
+        Each axis is clipped to the grid first, so shells of flat or clustered
+        point sets cost no more than the cells they actually overlap.
+        """
+        cx, cy, cz = center
+        if radius == 0:
+            yield center
+            return
+
+        def _span(c: int, n: int, reach: int) -> range:
+            return range(max(-reach, -c), min(reach, n - 1 - c) + 1)
+
+        def _faces(c: int, n: int) -> list[int]:
+            return [d for d in (-radius, radius) if 0 <= c + d < n]
+
+        nx, ny, nz = self.dims
+        # the shell is the two x faces, then the y faces inside them, then
+        # the z faces inside both, so every cell is yielded once
+        for dx in _faces(cx, nx):
+            for dy in _span(cy, ny, radius):
+                for dz in _span(cz, nz, radius):
+                    yield cx + dx, cy + dy, cz + dz
+        for dy in _faces(cy, ny):
+            for dx in _span(cx, nx, radius - 1):
+                for dz in _span(cz, nz, radius):
+                    yield cx + dx, cy + dy, cz + dz
+        for dz in _faces(cz, nz):
+            for dx in _span(cx, nx, radius - 1):
+                for dy in _span(cy, ny, radius - 1):
+                    yield cx + dx, cy + dy, cz + dz
+
+    def _cell_distance_sq(self, key: tuple[int, int, int], qx: float, qy: float, qz: float) -> float:
+        size = self.cell_size
+        distance_sq = 0.0
+        for cell, lo, value in zip(key, self.minimum, (qx, qy, qz)):
+            low = lo + cell * size
+            if value < low:
+                distance_sq += (low - value) ** 2
+            elif value > low + size:
+                distance_sq += (value - low - size) ** 2
+        return distance_sq
+
+    def nearest(self, point: Point3) -> tuple[int, float]:
+        """Return ``(index, distance)`` of the indexed point closest to ``point``."""
+        if not self.xs:
+            raise ValueError("PointGridIndex is empty.")
+
+        qx, qy, qz = float(point[0]), float(point[1]), float(point[2])
+
+        # Any indexed point p satisfies |q - p|^2 >= |q - c|^2 + |c - p|^2,
+        # where c is q clamped into the bounding box, so the ring search around
+        # c can be pruned with that outside distance added back in.
+        clamped = tuple(
+            min(max(value, lo), hi)
+            for value, lo, hi in zip((qx, qy, qz), self.minimum, self.maximum)
+        )
+        outside_sq = (qx - clamped[0]) ** 2 + (qy - clamped[1]) ** 2 + (qz - clamped[2]) ** 2
+        center = self._cell_of(clamped)
+
+        xs, ys, zs = self.xs, self.ys, self.zs
+        best_index = -1
+        best_sq = math.inf
+        # past this radius the shells lie outside the grid on every axis
+        max_radius = max(max(c, n - 1 - c) for c, n in zip(center, self.dims))
+        for radius in range(max_radius + 1):
+            for key in self._ring(center, radius):
+                indices = self.cells.get(key)
+                if not indices or self._cell_distance_sq(key, qx, qy, qz) >= best_sq:
+                    continue
+                for index in indices:
+                    distance_sq = (xs[index] - qx) ** 2 + (ys[index] - qy) ** 2 + (zs[index] - qz) ** 2
+                    if distance_sq < best_sq:
+                        best_sq = distance_sq
+                        best_index = index
+
+            if best_index >= 0 and best_sq <= outside_sq + (radius * self.cell_size) ** 2:
+                break
+
+        return best_index, math.sqrt(best_sq)
+
+    def nearest_many(self, points: Iterable[Point3]) -> list[tuple[int, float]]:
+        """Return ``(index, distance)`` for every query point."""
+        return [self.nearest(point) for point in points]
@@ -0,0 +1,276 @@
+"""Bake world matrices onto transform channels without scrubbing the timeline.
+
+The IK/FK transfer used to set ``currentTime`` for every frame, query and set
+world matrices through ``xform`` and key with ``setKeyframe``; every time
+change evaluates the whole scene. Here the source world matrices are read
+through ``MDGContext`` timed plug evaluation, the destination local channels
+are solved in memory and the keys of a channel are written with a fixed
+number of undoable commands, see :func:`set_keys`.
+
+Destination nodes may be parented under each other (an FK chain): their
+parent world matrix is rebuilt from the matrix baked onto the ancestor, the
+same way setting the chain top down in world space did.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+
+TRANSFORM_CHANNELS = (
+    "translateX", "translateY", "translateZ",
+    "rotateX", "rotateY", "rotateZ",
+    "scaleX", "scaleY", "scaleZ",
+)
+
+
+def _dag_path(node: object) -> om.MDagPath:
+    name = node.name() if callable(getattr(node, "name", None)) else str(node)
+    sel = om.MSelectionList()
+    sel.add(name)
+    return sel.getDagPath(0)
+
+
+def _plug(name: str) -> om.MPlug:
+    sel = om.MSelectionList()
+    sel.add(name)
+    return sel.getPlug(0)
+
+
+@contextmanager
+def _evaluation_time(frame: float) -> Iterator[None]:
+    previous = om.MDGContext(om.MTime(frame, om.MTime.uiUnit())).makeCurrent()
+    try:
+        yield
+    finally:
+        previous.makeCurrent()
+
+
+def _matrix_plug(path: om.MDagPath, attr: str) -> om.MPlug:
+    plug = om.MFnDependencyNode(path.node()).findPlug(attr, False)
+    return plug.elementByLogicalIndex(path.instanceNumber())
+
+
+def _read_matrix(plug: om.MPlug) -> om.MMatrix:
+    return om.MFnMatrixData(plug.asMObject()).matrix()
+
+
+def matrix_to_list(matrix: om.MMatrix) -> list[float]:
+    """Flatten ``matrix`` into the 16 values ``xform -matrix`` takes."""
+    return [matrix[i] for i in range(16)]
+
+
+def world_matrices(nodes: Sequence[object], frames: Sequence[float]) -> list[list[om.MMatrix]]:
+    """Evaluate the world matrix of ``nodes`` at each of ``frames``.
+
+    Arguments:
+        nodes (list): Transform names or nodes.
+        frames (list of float): Frames in the current time unit.
+
+    Returns:
+        list of list of MMatrix: The matrices, ``[frame][node]``.
+    """
+    plugs = [_matrix_plug(_dag_path(n), "worldMatrix") for n in nodes]
+    res = []
+    for frame in frames:
+        with _evaluation_time(frame):
+            res.append([_read_matrix(plug) for plug in plugs])
+    return res
+
+
+def can_bake_channels(nodes: Sequence[object]) -> bool:
+    """Whether translate / rotate / scale alone reproduce a local matrix.
+
+    Pivots, rotate axis and joint orient are not solved for; nodes using them
+    have to be baked through ``xform``.
+    """
+    zero = om.MVector()
+    for node in nodes:
+        path = _dag_path(node)
+        fn = om.MFnTransform(path)
+        if (
+            om.MVector(fn.rotatePivot(om.MSpace.kTransform)) != zero
+            or om.MVector(fn.scalePivot(om.MSpace.kTransform)) != zero
+            or fn.rotatePivotTranslation(om.MSpace.kTransform) != zero
+            or fn.scalePivotTranslation(om.MSpace.kTransform) != zero
+            or not fn.rotateOrientation(om.MSpace.kTransform).isEquivalent(om.MQuaternion())
+        ):
+            return False
+        if path.hasFn(om.MFn.kJoint):
+            orient = om.MFnDependencyNode(path.node()).findPlug("jointOrient", False)
+            if any(orient.child(i).asDouble() != 0.0 for i in range(3)):
+                return False
+    return True
+
+
+class ChannelBake(object):
+    """Local channel values solved for a set of destination transforms.
+
+    Build it with :meth:`solve` before the destination animation is cut, the
+    current parent matrices are read from the scene; then :meth:`write` the
+    keys.
+
+    Arguments:
+        nodes (list): The destination transforms.
+        frames (list of float): Frames in the current time unit.
+    """
+
+    def __init__(self, nodes: Sequence[object], frames: Sequence[float]) -> None:
+        self.paths = [_dag_path(n) for n in nodes]
+        self.frames = list(frames)
+        # values[node][channel][frame], in internal units
+        self.values = [[[] for _ in TRANSFORM_CHANNELS] for _ in self.paths]
+
+    def _ancestors(self) -> list[int | None]:
+        """Index of the nearest destination node above each node, if any."""
+        names = {path.fullPathName(): i for i, path in enumerate(self.paths)}
+        res = []
+        for path in self.paths:
+            ancestor = None
+            parent = om.MDagPath(path)
+            parent.pop()
+            while parent.length() > 0:
+                ancestor = names.get(parent.fullPathName())
+                if ancestor is not None:
+                    break
+                parent.pop()
+            res.append(ancestor)
+        return res
+
+    def solve(self, world_matrix_list: Sequence[Sequence[om.MMatrix]]) -> ChannelBake:
+        """Solve the channels giving each node ``world_matrix_list[frame][node]``."""
+        ancestors = self._ancestors()
+        parent_plugs = [_matrix_plug(path, "parentMatrix") for path in self.paths]
+        world_plugs = [_matrix_plug(path, "worldMatrix") for path in self.paths]
+        orders = [
+            om.MFnDependencyNode(path.node()).findPlug("rotateOrder", False).asShort()
+            for path in self.paths
+        ]
+        previous = [om.MFnTransform(path).rotation(asQuaternion=False) for path in self.paths]
+
+        for frame, targets in zip(self.frames, world_matrix_list):
+            with _evaluation_time(frame):
+                parents = [_read_matrix(plug) for plug in parent_plugs]
+                worlds = [_read_matrix(plug) if i in ancestors else None for i, plug in enumerate(world_plugs)]
+
+            for i, target in enumerate(targets):
+                parent = parents[i]
+                ancestor = ancestors[i]
+                if ancestor is not None:
+                    # keep the offset between the ancestor and our parent,
+                    # but under the ancestor's baked matrix
+                    parent = parent * worlds[ancestor].inverse() * targets[ancestor]
+
+                xform = om.MTransformationMatrix(target * parent.inverse())
+                euler = xform.rotation(asQuaternion=False)
+                euler.reorderIt(orders[i])
+                euler.setToClosestSolution(previous[i])
+                previous[i] = euler
+
+                translate = xform.translation(om.MSpace.kTransform)
+                scale = xform.scale(om.MSpace.kTransform)
+                for channel, value in enumerate((
+                    translate.x, translate.y, translate.z,
+                    euler.x, euler.y, euler.z,
+                    scale[0], scale[1], scale[2],
+                )):
+                    self.values[i][channel].append(value)
+
+        return self
+
+    def write(self) -> None:
+        """Key every solved channel, one undoable :func:`set_keys` per channel."""
+        for path, channels in zip(self.paths, self.values):
+            fn = om.MFnDependencyNode(path.node())
+            for attr, values in zip(TRANSFORM_CHANNELS, channels):
+                plug = fn.findPlug(attr, False)
+                if not _is_keyable(plug):
+                    continue
+                set_keys(plug, self.frames, [_to_ui_unit(plug, v) for v in values])
+
+
+def _is_keyable(plug: om.MPlug) -> bool:
+    if plug.isLocked:
+        return False
+    source = plug.source()
+    return source.isNull or source.node().hasFn(om.MFn.kAnimCurve)
+
+
+def _unit_type(plug: om.MPlug) -> int | None:
+    attr = plug.attribute()
+    if not attr.hasFn(om.MFn.kUnitAttribute):
+        return None
+    return om.MFnUnitAttribute(attr).unitType()
+
+
+def _to_ui_unit(plug: om.MPlug, value: float) -> float:
+    unit_type = _unit_type(plug)
+    if unit_type == om.MFnUnitAttribute.kDistance:
+        return om.MDistance(value).asUnits(om.MDistance.uiUnit())
+    if unit_type == om.MFnUnitAttribute.kAngle:
+        return om.MAngle(value).asUnits(om.MAngle.uiUnit())
+    return value
+
+
+def _plug_name(plug: om.MPlug) -> str:
+    node = plug.node()
+    if node.hasFn(om.MFn.kDagNode):
+        node_name = om.MDagPath.getAPathTo(node).fullPathName()
+    else:
+        node_name = om.MFnDependencyNode(node).name()
+    return "{}.{}".format(node_name, plug.partialName(useLongNames=True))
+
+
+def _curve_type(plug: om.MPlug) -> str:
+    unit_type = _unit_type(plug)
+    if unit_type == om.MFnUnitAttribute.kDistance:
+        return "animCurveTL"
+    if unit_type == om.MFnUnitAttribute.kAngle:
+        return "animCurveTA"
+    return "animCurveTU"
+
+
+def set_keys(plug: om.MPlug, frames: Sequence[float], values: Sequence[float]) -> None:
+    """Key ``plug`` at every frame with a fixed number of undoable commands.
+
+    The keys are written into a temporary curve with a single ``setAttr`` on
+    its ``keyTimeValue`` range, given the global default tangents, and pasted
+    onto ``plug`` through the ``api`` clipboard, which leaves the user's
+    clipboard alone. ``pasteKey`` creates the curve when there is none and
+    keeps the keys outside ``frames``.
+
+    Arguments:
+        plug (MPlug): The plug to key.
+        frames (list of float): Sorted frames in the current time unit.
+        values (list of float): The values in UI units.
+    """
+    if not frames:
+        return
+
+    count = len(frames)
+    keys = [v for frame, value in zip(frames, values) for v in (frame, value)]
+    in_tangent = cmds.keyTangent(query=True, g=True, inTangentType=True)[0]
+    out_tangent = cmds.keyTangent(query=True, g=True, outTangentType=True)[0]
+
+    temp = cmds.createNode(_curve_type(plug), name="ymt_bake_temp")
+    try:
+        cmds.setAttr("{}.ktv[0:{}]".format(temp, count - 1), *keys, size=count)
+        cmds.keyTangent(temp, edit=True, inTangentType=in_tangent, outTangentType=out_tangent)
+        cmds.copyKey(temp, clipboard="api")
+        cmds.pasteKey(
+            _plug_name(plug),
+            clipboard="api",
+            option="replace",
+            time=(frames[0], frames[-1]),
+        )
+    finally:
+        cmds.delete(temp)
+
+
+def key_constant(attr_name: str, frames: Sequence[float]) -> None:
+    """Key the current value of ``attr_name`` at every frame."""
+    plug = _plug(attr_name)
+    set_keys(plug, frames, [_to_ui_unit(plug, plug.asDouble())] * len(frames))
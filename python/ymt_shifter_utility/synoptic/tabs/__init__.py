@@ -2,6 +2,7 @@
 import traceback
 
 # dcc
+from maya import cmds
 import importlib
 try:
     pm = importlib.import_module("mgear.pymaya")
@@ -16,12 +17,116 @@ from mgear.core import callbackManager
 from .. import widgets, utils
 
 
+##################################################
+# SELECTION SYNC
+##################################################
+
+
+class SelectionSyncMixin(object):
+    """Repaint only the select buttons whose selection state changed.
+
+    Buttons are indexed once by their control name (without namespace) and
+    every Maya selection change is diffed against the previous one.  Mix it
+    in before ``MainSynopticTab``, it works with the mGear select buttons as
+    well as the ones in this package.
+    """
+
+    _selectionIndex = None
+    _selectedKeys = None
+    _selectionNamespace = None
+
+    def buildSelectionIndex(self) -> None:
+        index = {}
+        for button in self.findChildren(QtWidgets.QWidget):
+            if not hasattr(button, "paintSelected"):
+                continue
+
+            obj = button.property("object")
+            if obj is None:
+                continue
+
+            # multi object buttons are not painted by selection
+            names = str(obj).split(",")
+            if len(names) != 1:
+                continue
+
+            index.setdefault(names[0], []).append(button)
+
+        self._selectionIndex = index
+        self._selectedKeys = None
+
+    def syncSelection(self, selection: list[str], nameSpace: str) -> None:
+        if self._selectionIndex is None:
+            self.buildSelectionIndex()
+        index = self._selectionIndex
+
+        prefix = "{}:".format(nameSpace) if nameSpace else ""
+        keys = set()
+        for name in selection:
+            if prefix:
+                if not name.startswith(prefix):
+                    continue
+                name = name[len(prefix):]
+            if name in index:
+                keys.add(name)
+
+        previous = self._selectedKeys
+        if previous is None or nameSpace != self._selectionNamespace:
+            for key, buttons in index.items():
+                for button in buttons:
+                    button.paintSelected(key in keys)
+        else:
+            for key in keys - previous:
+                for button in index[key]:
+                    button.paintSelected(True)
+            for key in previous - keys:
+                for button in index[key]:
+                    button.paintSelected(False)
+
+        self._selectedKeys = keys
+        self._selectionNamespace = nameSpace
+
+    def selectChanged(self, *args: object) -> None:
+        # wrap to catch exception guaranteeing core does not stop at this
+        try:
+            self._syncSelectionChanged()
+
+        except Exception as e:
+            mes = traceback.format_exc()
+            mes = "error has occur in scriptJob " \
+                  "SelectionChanged\n{0}".format(mes)
+
+            mes = "{0}\n{1}".format(mes, e)
+            mgear.log(mes, mgear.sev_error)
+            self.cbManager.removeAllManagedCB()
+            try:
+                self.close()
+            except RuntimeError:
+                pass
+
+    def _syncSelectionChanged(self) -> None:
+        oModel = utils.getModel(self)
+        if not oModel:
+            mes = "model not found for synoptic {}".format(self.name)
+            mgear.log(mes, mgear.sev_info)
+
+            syn_widget = utils.getSynopticWidget(self)
+            syn_widget.updateModelList()
+
+            # repaint everything once a model is back
+            self._selectedKeys = None
+            return
+
+        nameSpace = utils.getNamespace(oModel.name())
+        self.syncSelection(cmds.ls(sl=True) or [], nameSpace)
+
+
 ##################################################
 # SYNOPTIC TAB WIDGET
 ##################################################
 
 
-class MainSynopticTab(QtWidgets.QDialog):
+class MainSynopticTab(SelectionSyncMixin, QtWidgets.QDialog):
     """
     Base class of synoptic tab widget
 
@@ -51,6 +156,7 @@ class MainSynopticTab(QtWidgets.QDialog):
         klass.setBackground()
         klass.connectSignals()
         klass.connectMaya()
+        klass.buildSelectionIndex()
         self._buttonGeometry = {}  # for cachinig
 
         # This is necessary for not to be zombie job on close.
@@ -91,63 +197,6 @@ class MainSynopticTab(QtWidgets.QDialog):
 
         self.cbManager = callbackManager.CallbackManager()
 
-    def selectChanged(self, *args: object) -> None:
-        # wrap to catch exception guaranteeing core does not stop at this
-        try:
-            self.__selectChanged(*args)
-
-        except Exception as e:
-            mes = traceback.format_exc()
-            mes = "error has occur in scriptJob " \
-                  "SelectionChanged\n{0}".format(mes)
-
-            mes = "{0}\n{1}".format(mes, e)
-            mgear.log(mes, mgear.sev_error)
-            self.cbManager.removeAllManagedCB()
-            try:
-                self.close()
-            except RuntimeError:
-                pass
-
-    def __selectChanged(self, *args: object) -> None:
-
-        sels = []
-        [sels.append(x.name()) for x in pm.ls(sl=True)]
-
-        oModel = utils.getModel(self)
-        if not oModel:
-            mes = "model not found for synoptic {}".format(self.name)
-            mgear.log(mes, mgear.sev_info)
-
-            # self.close()
-
-            syn_widget = utils.getSynopticWidget(self)
-            syn_widget.updateModelList()
-
-            return
-
-        nameSpace = utils.getNamespace(oModel.name())
-
-        selButtons = self.findChildren(widgets.SelectButton)
-        selButtonsStyled = self.findChildren(widgets.SelectButtonStyleSheet)
-
-        buttons = []
-        buttons.extend(selButtons)
-        buttons.extend(selButtonsStyled)
-
-        for selB in buttons:
-            obj = str(selB.property("object")).split(",")
-            if len(obj) == 1:
-                if nameSpace:
-                    checkName = ":".join([nameSpace, obj[0]])
-                else:
-                    checkName = obj[0]
-
-                if checkName in sels:
-                    selB.paintSelected(True)
-                else:
-                    selB.paintSelected(False)
-
     def _getButtonAbsoluteGeometry(self, button: object) -> QtCore.QRect:
         if button in self._buttonGeometry.keys():
             return self._buttonGeometry[button]
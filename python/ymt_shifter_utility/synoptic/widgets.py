@@ -299,25 +299,29 @@ class SelectButton(QtWidgets.QWidget):
         painter.drawPath(path)
 
 
-class SelectButtonStyleSheet(QtWidgets.QFrame):
-    def __init__(self, parent: object = None) -> None:
-        """ This class allows you to charge a QFrame widget on your picker
-        that will maintain the StyleSheet compatibility coming form your UI
-        file.
-        """
-        super(SelectButtonStyleSheet, self).__init__(parent)
+class _StyleSheetLookup(object):
+    """Parsed style sheet of a picker, see SelectButtonStyleSheet.
+
+    The style sheet is split into blocks once and the selected / unselected
+    style of each control is generated once and kept.
+    """
+
+    def __init__(self, style_sheet: str) -> None:
+        self.style_sheet = style_sheet
+        self.blocks = style_sheet.split("\n\n")
+        self._styles = {}
 
-    def __get_background_color(self, control: str, stylesheet: list[str]) -> list[str]:
+    def __get_background_color(self, control: str) -> list[str]:
         """ Returns the background color for the given control on the
         style sheet provided
         """
 
         current_style = ""
+        style_key = "control_style={}".format(control)
+        id_key = "#{}".format(control)
 
-        for i in stylesheet:
-            if (re.findall("\control_style={}".format(control), i) and
-                not i.count("disabled") or re.findall("\#{}".format(
-                    control), i) and not i.count("disabled")):
+        for i in self.blocks:
+            if (style_key in i or id_key in i) and not i.count("disabled"):
                 current_style += i
         return re.findall(r"\S+[a-z][-][a-z].+\W;", current_style)
 
@@ -327,15 +331,13 @@ class SelectButtonStyleSheet(QtWidgets.QFrame):
         effect of the button been hovered.
         """
 
-        # gets overall style sheet
-        style_sheet = self.parent().styleSheet()
-        widgets_styles = style_sheet.split("\n\n")
+        style_sheet = self.style_sheet
+        widgets_styles = self.blocks
         new_style = ""
 
         # handles # type style sheet
         if style_sheet.count(control_object):
-            bg_color, hover_color = self.__get_background_color(control_object,
-                                                                widgets_styles)
+            bg_color, hover_color = self.__get_background_color(control_object)
 
             for i in widgets_styles:
                 if i.count(control_object) and paint and not i.count("hover"):
@@ -349,8 +351,7 @@ class SelectButtonStyleSheet(QtWidgets.QFrame):
 
         # handles property type style sheet
         elif style_sheet.count(control_style):
-            bg_color, hover_color = self.__get_background_color(control_style,
-                                                                widgets_styles)
+            bg_color, hover_color = self.__get_background_color(control_style)
 
             for i in widgets_styles:
                 if i.count(control_style) and paint and not i.count("hover"):
@@ -365,6 +366,40 @@ class SelectButtonStyleSheet(QtWidgets.QFrame):
 
         return new_style
 
+    def styles(self, control_object: str, control_style: str) -> tuple[str, str]:
+        """ Returns the (selected, unselected) style of a control."""
+        key = (control_object, control_style)
+        styles = self._styles.get(key)
+        if styles is None:
+            styles = (self.__create_new_style(control_object, control_style, True),
+                      self.__create_new_style(control_object, control_style, False))
+            self._styles[key] = styles
+        return styles
+
+
+_style_sheet_lookups = {}
+
+
+def _get_style_sheet_lookup(style_sheet: str) -> _StyleSheetLookup:
+    lookup = _style_sheet_lookups.get(style_sheet)
+    if lookup is None:
+        # a picker has one style sheet, old ones are only left by edits
+        if len(_style_sheet_lookups) > 16:
+            _style_sheet_lookups.clear()
+        lookup = _style_sheet_lookups[style_sheet] = _StyleSheetLookup(style_sheet)
+    return lookup
+
+
+class SelectButtonStyleSheet(QtWidgets.QFrame):
+    def __init__(self, parent: object = None) -> None:
+        """ This class allows you to charge a QFrame widget on your picker
+        that will maintain the StyleSheet compatibility coming form your UI
+        file.
+        """
+        super(SelectButtonStyleSheet, self).__init__(parent)
+        # (lookup, selected style, unselected style)
+        self._paintStyles = None
+
     def enterEvent(self, event: object) -> None:
         if not self.isEnabled():
             return
@@ -415,16 +450,20 @@ class SelectButtonStyleSheet(QtWidgets.QFrame):
         """
         if not self.isEnabled():
             return
-        # get control name and control_style properties from the widget
-        control_object = str(self.property("object")).split(",")[0]
-        control_style = str(self.property("control_style")).split(",")[0]
 
         # gets new style sheet
         try:
-            new_style = self.__create_new_style(control_object,
-                                                control_style,
-                                                paint)
-            self.setStyleSheet(new_style)
+            lookup = _get_style_sheet_lookup(self.parent().styleSheet())
+            if self._paintStyles is None or self._paintStyles[0] is not lookup:
+                # get control name and control_style properties from the widget
+                control_object = str(self.property("object")).split(",")[0]
+                control_style = str(self.property("control_style")).split(",")[0]
+                self._paintStyles = (lookup,) + lookup.styles(control_object,
+                                                              control_style)
+
+            new_style = self._paintStyles[1] if paint else self._paintStyles[2]
+            if new_style != self.styleSheet():
+                self.setStyleSheet(new_style)
         except Exception as error:
             message = "Something is wrong with your current style-sheet." \
                       "Contact mGear development team with the following" \
@@ -15,6 +15,7 @@ import mgear.synoptic.utils as syn_utils
 import mgear.core.utils as utils
 from typing import Optional
 from ymt_shifter_utility.type_protocols import AttrValue, DagNodeLike, MatrixValue, MouseEventLike
+from ymt_shifter_utility.synoptic import bake
 
 import gml_maya.decorator as deco
 try:
@@ -608,6 +609,13 @@ class IkFkTransfer(anim_utils.AbstractAnimationTransfer):
     @utils.one_undo
     @utils.viewport_off
     def bakeAnimation(self, switch_attr_name: object, val_src_nodes: object, key_src_nodes: object, key_dst_nodes: object, startFrame: object, endFrame: object, onlyKeyframes: object=True) -> None:
+        """Bake the world matrices of val_src_nodes onto key_dst_nodes.
+
+        The destination channels are solved in memory and keyed without
+        changing the current time, see ymt_shifter_utility.synoptic.bake.
+        Destinations with pivots, rotate axis or joint orient still go
+        through xform frame by frame.
+        """
 
         # Temporaly turn off cycle check to avoid misleading cycle message
         # on Maya 2016.  With Maya 2016.5 and 2017 the cycle warning doesn't
@@ -631,39 +639,35 @@ class IkFkTransfer(anim_utils.AbstractAnimationTransfer):
                                                 val_src_nodes,
                                                 keyframeList)
 
+        # the parent matrices are read from the current animation, so solve
+        # before it is cut
+        channel_bake = None
+        if bake.can_bake_channels(key_dst_nodes):
+            channel_bake = bake.ChannelBake(key_dst_nodes, keyframeList).solve(worldMatrixList)
+
         # delete animation in the space switch channel and destination ctrls
         pm.cutKey(key_dst_nodes, at=channels, time=(startFrame, endFrame))
         pm.cutKey(switch_attr_name, time=(startFrame, endFrame))
 
-        def keyframe(x: object, i: object) -> None:
-            pm.currentTime(x)
-
+        if channel_bake is not None:
             # set the new space in the channel
             self.changeAttrToBoundValue()
+            channel_bake.write()
+            bake.key_constant(switch_attr_name, keyframeList)
 
-            # bake the stored transforms to the cotrols
-            for j, n in enumerate(key_dst_nodes):
-                # n.setMatrix(worldMatrixList[i][j], worldSpace=True)
-                for _ in range(2):
-                    cmds.xform(n.name(), ws=True, matrix=worldMatrixList[i][j])
-
-            # bake the stored transforms to the cotrols
-            for j, n in enumerate(key_dst_nodes):
-                # n.setMatrix(worldMatrixList[i][j], worldSpace=True)
-
-                for _ in range(2):
-                    cmds.xform(n.name(), ws=True, matrix=worldMatrixList[i][j])
+        else:
+            for i, x in enumerate(keyframeList):
+                pm.currentTime(x)
 
-            pm.setKeyframe(key_dst_nodes, at=channels)
-            pm.setKeyframe(switch_attr_name)
+                # set the new space in the channel
+                self.changeAttrToBoundValue()
 
-        if onlyKeyframes:
-            for i, x in enumerate(keyframeList):
-                keyframe(x, i)
+                # bake the stored transforms to the cotrols
+                for j, n in enumerate(key_dst_nodes):
+                    cmds.xform(n.name(), ws=True, matrix=bake.matrix_to_list(worldMatrixList[i][j]))
 
-        else:
-            for i, x in enumerate(range(startFrame, endFrame + 1)):
-                keyframe(x, i)
+                pm.setKeyframe(key_dst_nodes, at=channels)
+                pm.setKeyframe(switch_attr_name)
 
         # if versions.current() <= 20180200:
         pm.cycleCheck(e=True)
@@ -788,16 +792,7 @@ class IkFkTransfer(anim_utils.AbstractAnimationTransfer):
     def getWorldMatrices(self, start: object, end: object, val_src_nodes: object, keyframes: object) -> object:
         """ returns matrice List[frame][controller number]."""
 
-        res = []
-        for x in keyframes:
-            tmp = []
-            cmds.currentTime(x)
-            for n in val_src_nodes:
-                tmp.append(cmds.xform(n.name(), q=True, matrix=True, ws=True))
-
-            res.append(tmp)
-
-        return res
+        return bake.world_matrices(val_src_nodes, keyframes)
 
 
 class toggleControllerVisibilityButton(QtWidgets.QPushButton):
@@ -10,6 +10,7 @@ from mgear.synoptic.tabs import MainSynopticTab
 from mgear.vendor.Qt import QtWidgets, QtCore
 
 from mgear.synoptic import utils
+from ymt_shifter_utility.synoptic.tabs import SelectionSyncMixin
 from . import widget
 
 
@@ -18,7 +19,7 @@ from . import widget
 ##################################################
 
 
-class SynopticTab(MainSynopticTab, widget.Ui_ymt_face_detail):
+class SynopticTab(SelectionSyncMixin, MainSynopticTab, widget.Ui_ymt_face_detail):
 
     description = "face_detail"
     name = "ymt_face_detail"
@@ -35,6 +36,7 @@ class SynopticTab(MainSynopticTab, widget.Ui_ymt_face_detail):
     # INIT
     def __init__(self, parent: object=None) -> None:
         super(SynopticTab, self).__init__(self, parent)
+        self.buildSelectionIndex()
         self.cbManager.selectionChangedCB(self.name, self.selectChanged)
 
     # ============================================